@@ -7,15 +7,32 @@ Refactored for better code organization and maintainability.
 """
 
 import tcod
+import numpy as np
 import logging
 import random
 import math
+import functools
+import sys
 from abc import ABC, abstractmethod
-from enum import Enum
+from collections import deque
+from itertools import islice
+from enum import Enum, IntEnum
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict, Any, Set
+from typing import List, Tuple, Optional, Dict, Any, Set, Callable, Iterator, Deque
 import time
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; kernels fall back to plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Frozen builds have no source files for numba to key its on-disk cache on
+JIT_CACHE = not getattr(sys, "frozen", False)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message)s')
 
@@ -91,6 +108,139 @@ class Colors:
     UI_HIGHLIGHT = (255, 20, 255)  # Hot magenta highlights
     LOG_BG = (8, 12, 20)  # Darker blue background
     LOG_BORDER = (20, 255, 200)  # Cyber teal border
+    
+    # Data patch colors keyed by patch color name
+    DATA_PATCH = {
+        'crimson': NEON_PINK, 'azure': ELECTRIC_BLUE, 'emerald': ACID_GREEN,
+        'golden': YELLOW, 'violet': ELECTRIC_PURPLE, 'silver': CYAN
+    }
+
+# ============================================================================
+# NUMERIC KERNELS
+# ============================================================================
+
+@njit(cache=JIT_CACHE)
+def vision_offsets(radius):
+    """Return (dx, dy) offsets inside a Euclidean disc of the given radius."""
+    count = 0
+    for dx in range(-radius, radius + 1):
+        for dy in range(-radius, radius + 1):
+            if dx * dx + dy * dy <= radius * radius:
+                count += 1
+    offsets = np.empty((count, 2), dtype=np.int64)
+    i = 0
+    for dx in range(-radius, radius + 1):
+        for dy in range(-radius, radius + 1):
+            if dx * dx + dy * dy <= radius * radius:
+                offsets[i, 0] = dx
+                offsets[i, 1] = dy
+                i += 1
+    return offsets
+
+# Step directions toward a target, as multipliers of its (dx, dy), most preferred first
+STEP_PREFERENCES = np.array([
+    (1, 1), (1, 0), (0, 1), (1, -1), (-1, 1), (-1, 0), (0, -1), (-1, -1)
+], dtype=np.int64)
+
+@njit(cache=JIT_CACHE)
+def step_toward(walls, occupied, x, y, tx, ty, px, py):
+    """Pick the next cell from (x, y) toward (tx, ty).
+    
+    Skips walls, cells with a nonzero occupied count and the player's cell;
+    returns (x, y) unchanged if every direction is blocked.
+    """
+    width, height = walls.shape
+    dx = int(tx > x) - int(tx < x)
+    dy = int(ty > y) - int(ty < y)
+    for i in range(STEP_PREFERENCES.shape[0]):
+        step_x = dx * STEP_PREFERENCES[i, 0]
+        step_y = dy * STEP_PREFERENCES[i, 1]
+        if step_x == 0 and step_y == 0:
+            continue
+        nx = x + step_x
+        ny = y + step_y
+        if (0 <= nx < width and 0 <= ny < height and not walls[nx, ny] and
+                occupied[nx, ny] == 0 and not (nx == px and ny == py)):
+            return nx, ny
+    return x, y
+
+@njit(cache=JIT_CACHE)
+def room_connections(centers_x, centers_y):
+    """Return (from, to) room index pairs of a Manhattan spanning tree grown from room 0.
+    
+    Each step joins the closest unconnected room; ties go to the earliest-joined
+    room, then the lowest unconnected index. Pairs come out in joining order.
+    """
+    n = centers_x.shape[0]
+    pairs = np.empty((max(n - 1, 0), 2), dtype=np.int64)
+    joined = np.zeros(n, dtype=np.bool_)
+    best_dist = np.empty(n, dtype=np.int64)
+    best_from = np.zeros(n, dtype=np.int64)
+    best_step = np.zeros(n, dtype=np.int64)
+    joined[0] = True
+    for i in range(n):
+        best_dist[i] = abs(centers_x[i] - centers_x[0]) + abs(centers_y[i] - centers_y[0])
+    
+    for step in range(n - 1):
+        chosen = -1
+        for i in range(n):
+            if joined[i]:
+                continue
+            if (chosen < 0 or best_dist[i] < best_dist[chosen] or
+                    (best_dist[i] == best_dist[chosen] and best_step[i] < best_step[chosen])):
+                chosen = i
+        pairs[step, 0] = best_from[chosen]
+        pairs[step, 1] = chosen
+        joined[chosen] = True
+        
+        for i in range(n):
+            if not joined[i]:
+                dist = abs(centers_x[i] - centers_x[chosen]) + abs(centers_y[i] - centers_y[chosen])
+                if dist < best_dist[i]:
+                    best_dist[i] = dist
+                    best_from[i] = chosen
+                    best_step[i] = step + 1
+    return pairs
+
+@njit(cache=JIT_CACHE)
+def stamp_discs(owner, xs, ys, radii):
+    """Write each disc's index into the owner grid cells it covers.
+    
+    Discs are stamped in order, so later discs win where they overlap; cells
+    outside the grid are clipped.
+    """
+    width, height = owner.shape
+    for i in range(xs.shape[0]):
+        radius = radii[i]
+        for dx in range(-radius, radius + 1):
+            x = xs[i] + dx
+            if x < 0 or x >= width:
+                continue
+            for dy in range(-radius, radius + 1):
+                y = ys[i] + dy
+                if 0 <= y < height and dx * dx + dy * dy <= radius * radius:
+                    owner[x, y] = i
+
+def warm_up_kernels():
+    """Compile (or load the cached build of) the kernels up front rather than mid-game."""
+    vision_offsets(1)
+    # GameMap.walls is the interior view of a bordered grid, so warm up that non-contiguous layout
+    walls = np.zeros((4, 4), dtype=np.bool_)[1:-1, 1:-1]
+    step_toward(walls, np.zeros((1, 1), dtype=np.int16), 0, 0, 0, 0, 0, 0)
+    room_connections(np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64))
+    stamp_discs(np.full((1, 1), -1, dtype=np.int64), np.zeros(1, dtype=np.int64),
+                np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64))
+
+_vision_stencils: Dict[int, np.ndarray] = {}
+
+def get_vision_stencil(radius: int) -> np.ndarray:
+    """Get the cached, read-only disc offsets for a vision or targeting radius."""
+    stencil = _vision_stencils.get(radius)
+    if stencil is None:
+        stencil = vision_offsets(radius)
+        stencil.flags.writeable = False
+        _vision_stencils[radius] = stencil
+    return stencil
 
 # ============================================================================
 # ENUMS AND DATA CLASSES
@@ -102,13 +252,25 @@ class EnemyState(Enum):
     ALERT = "alert"
     HOSTILE = "hostile"
 
-class EnemyMovement(Enum):
-    """Enemy movement patterns."""
-    STATIC = "static"
-    LINEAR = "linear"
-    RANDOM = "random"
-    SEEK = "seek"
-    TRACK = "track"
+class EnemyMovement(IntEnum):
+    """Enemy movement patterns (integer tags so kernels can carry them)."""
+    STATIC = 0
+    LINEAR = 1
+    RANDOM = 2
+    SEEK = 3
+    TRACK = 4
+
+class TileFlags:
+    """Bit flags packed into GameMap.tile_flags, one byte per map cell."""
+    WALL = 1
+    SHADOW = 2
+    COOLING_NODE = 4
+    CPU_RECOVERY_NODE = 8
+    DATA_PATCH = 16
+    EXPLOIT_PICKUP = 32
+    # Combined masks for the placement checks
+    NODE = COOLING_NODE | CPU_RECOVERY_NODE
+    OCCUPIED = WALL | NODE | DATA_PATCH  # Cells that take no further patches, enemies or gateway
 
 class TargetingMode(Enum):
     """Exploit targeting modes."""
@@ -117,7 +279,7 @@ class TargetingMode(Enum):
     AREA = "area"
     DIRECTION = "direction"
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """2D position with x, y coordinates."""
     x: int
@@ -125,14 +287,32 @@ class Position:
     
     def distance_to(self, other: 'Position') -> float:
         """Calculate Euclidean distance to another position."""
-        import math
-        return math.sqrt((self.x - other.x)**2 + (self.y - other.y)**2)
+        return math.sqrt(self.distance_sq_to(other))
+    
+    def distance_sq_to(self, other: 'Position') -> int:
+        """Calculate squared Euclidean distance, for comparing against squared whole-number ranges."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
+    
+    def chebyshev(self, other: 'Position') -> int:
+        """Calculate the 8-way step distance to another position."""
+        return max(abs(self.x - other.x), abs(self.y - other.y))
+    
+    def within(self, other: 'Position', radius: int) -> bool:
+        """Check if another position lies within a whole-number Euclidean radius."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        # Anything outside the bounding square is rejected before squaring
+        if dx > radius or dx < -radius or dy > radius or dy < -radius:
+            return False
+        return dx * dx + dy * dy <= radius * radius
     
     def is_valid(self, width: int, height: int) -> bool:
         """Check if position is within bounds."""
         return 0 <= self.x < width and 0 <= self.y < height
 
-@dataclass
+@dataclass(slots=True)
 class EnemyTypeDefinition:
     """Definition of an enemy type with all its properties."""
     symbol: str
@@ -142,7 +322,7 @@ class EnemyTypeDefinition:
     name: str
     damage: int
 
-@dataclass
+@dataclass(slots=True)
 class ExploitDefinition:
     """Definition of an exploit with its properties."""
     name: str
@@ -197,6 +377,8 @@ class GameData:
 class InventoryItem(ABC):
     """Base class for all inventory items."""
     
+    __slots__ = ('name', 'item_type', 'description')
+    
     def __init__(self, name: str, item_type: str, description: str = ""):
         self.name = name
         self.item_type = item_type
@@ -210,12 +392,16 @@ class InventoryItem(ABC):
 class DataPatch(InventoryItem):
     """Randomized data patches with unknown effects until used."""
     
+    __slots__ = ('color', 'effect', 'quantity', 'discovered', 'render_color')
+    
     def __init__(self, color: str, effect: str, name: str, description: str = "", quantity: int = 1):
         super().__init__(name, "data_patch", description)
         self.color = color
         self.effect = effect
         self.quantity = quantity
         self.discovered = False
+        # Resolved once so rendering never has to look the color up
+        self.render_color = Colors.DATA_PATCH.get(color, Colors.CYAN)
     
     def use(self, player: 'Player', game: 'Game') -> bool:
         """Apply the data patch effect to the player."""
@@ -239,41 +425,62 @@ class DataPatch(InventoryItem):
     
     def _apply_effect(self, effect_key: str, player: 'Player', game: 'Game') -> bool:
         """Apply the specific effect."""
-        if effect_key == 'restore_cpu':
-            restore = random.randint(30, 40)
-            actual = min(restore, player.max_cpu - player.cpu)
-            player.cpu += actual
-            game.message_log.add_message(f"CPU restored: +{actual}")
-        
-        elif effect_key == 'reduce_heat':
-            old_heat = player.heat
-            player.heat = max(0, player.heat - 40)
-            actual_reduction = old_heat - player.heat
-            game.message_log.add_message(f"Heat reduced: -{actual_reduction}°C")
-        
-        elif effect_key == 'reduce_detection':
-            old_detection = player.detection
-            player.detection = max(0, player.detection - 25)
-            actual_reduction = old_detection - player.detection
-            game.message_log.add_message(f"Detection: -{actual_reduction:.1f}%")
-        
-        elif effect_key == 'speed_boost':
-            player.speed_boost_turns = 10
-            game.message_log.add_message("Speed boost active (10 turns)")
-        
-        elif effect_key == 'enhanced_vision':
-            player.enhanced_vision_turns = 15
-            game.message_log.add_message("Enhanced vision active (15 turns)")
-        
-        elif effect_key == 'exploit_efficiency':
-            player.exploit_efficiency_turns = 8
-            game.message_log.add_message("Exploit efficiency active (8 turns)")
-        
+        handler = self._EFFECT_HANDLERS.get(effect_key)
+        if handler:
+            handler(self, player, game)
         return True
+    
+    def _restore_cpu(self, player: 'Player', game: 'Game'):
+        """Restore 30-40 CPU."""
+        restore = random.randint(30, 40)
+        actual = min(restore, player.max_cpu - player.cpu)
+        player.cpu += actual
+        game.message_log.add_message(f"CPU restored: +{actual}")
+    
+    def _reduce_heat(self, player: 'Player', game: 'Game'):
+        """Vent 40 heat."""
+        old_heat = player.heat
+        player.heat = max(0, player.heat - 40)
+        actual_reduction = old_heat - player.heat
+        game.message_log.add_message(f"Heat reduced: -{actual_reduction}°C")
+    
+    def _reduce_detection(self, player: 'Player', game: 'Game'):
+        """Lower detection by 25."""
+        old_detection = player.detection
+        player.detection = max(0, player.detection - 25)
+        actual_reduction = old_detection - player.detection
+        game.message_log.add_message(f"Detection: -{actual_reduction:.1f}%")
+    
+    def _speed_boost(self, player: 'Player', game: 'Game'):
+        """Start a 10 turn speed boost."""
+        player.temporary_effects['speed_boost_turns'] = 10
+        game.message_log.add_message("Speed boost active (10 turns)")
+    
+    def _enhanced_vision(self, player: 'Player', game: 'Game'):
+        """Start 15 turns of enhanced vision."""
+        player.temporary_effects['enhanced_vision_turns'] = 15
+        game.message_log.add_message("Enhanced vision active (15 turns)")
+    
+    def _exploit_efficiency(self, player: 'Player', game: 'Game'):
+        """Start 8 turns of exploit efficiency."""
+        player.temporary_effects['exploit_efficiency_turns'] = 8
+        game.message_log.add_message("Exploit efficiency active (8 turns)")
+    
+    # Effect key -> handler
+    _EFFECT_HANDLERS = {
+        'restore_cpu': _restore_cpu,
+        'reduce_heat': _reduce_heat,
+        'reduce_detection': _reduce_detection,
+        'speed_boost': _speed_boost,
+        'enhanced_vision': _enhanced_vision,
+        'exploit_efficiency': _exploit_efficiency,
+    }
 
 class ExploitItem(InventoryItem):
     """Exploit items that can be equipped."""
     
+    __slots__ = ('exploit_key', 'ram_cost')
+    
     def __init__(self, exploit_key: str, exploit_def: ExploitDefinition):
         super().__init__(exploit_def.name, "exploit", exploit_def.description)
         self.exploit_key = exploit_key
@@ -405,114 +612,235 @@ class InventoryManager:
 # PLAYER CLASS
 # ============================================================================
 
+class TemporaryEffects(dict):
+    """Turn counters for temporary effects that report when a value changes."""
+    
+    def __init__(self, on_change, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._on_change = on_change
+    
+    def __setitem__(self, key: str, value: int):
+        if self.get(key) != value:
+            super().__setitem__(key, value)
+            self._on_change()
+    
+    def tick(self):
+        """Count every active effect down by one turn, reporting the change once."""
+        active = [key for key, turns in self.items() if turns > 0]
+        for key in active:
+            super().__setitem__(key, self[key] - 1)
+        if active:
+            self._on_change()
+
 class Player:
     """Player character with stats, position, and abilities."""
     
+    __slots__ = (
+        '_position', 'last_position', 'render_color', 'cpu', 'max_cpu', '_heat',
+        'detection', 'ram_total', 'base_vision_range', '_vision_range', '_see_through_walls',
+        '_invisible', '_conditions_text',
+        'temporary_effects', '_speed_moves_remaining', 'inventory_manager'
+    )
+    
+    # Render color indexed by (invisible << 2) | (speed boosted << 1) | overheating;
+    # the highest set bit wins, so invisibility outranks speed, which outranks heat
+    RENDER_COLORS = (Colors.PLAYER, Colors.RED, Colors.YELLOW, Colors.YELLOW,
+                     Colors.BLUE, Colors.BLUE, Colors.BLUE, Colors.BLUE)
+    
     def __init__(self, x: int, y: int):
-        # Position and movement
-        self.position = Position(x, y)
+        # Position and movement; both are updated in place rather than replaced
+        self._position = Position(x, y)
         self.last_position = Position(x, y)
         
-        # Core stats
+        # Core stats (heat and effect changes keep the cached render color fresh)
+        self.render_color = Colors.PLAYER
         self.cpu = 100
         self.max_cpu = 100
-        self.heat = 0
+        self._heat = 0
         self.detection = 0
         self.ram_total = 8
         
         # Vision and abilities
         self.base_vision_range = 15
+        self._vision_range = self.base_vision_range  # Includes effect bonuses
+        self._see_through_walls = False
+        self._invisible = False
         
-        # Temporary effects
-        self.temporary_effects = {
+        # Temporary effects (any change invalidates the cached conditions text)
+        self._conditions_text: Optional[Tuple[str, bool]] = None
+        self.temporary_effects = TemporaryEffects(self._on_effects_changed, {
             'data_mimic_turns': 0,
             'speed_boost_turns': 0,
             'enhanced_vision_turns': 0,
             'exploit_efficiency_turns': 0
-        }
-        self.speed_moves_remaining = 0
+        })
+        self._speed_moves_remaining = 0
         
         # Inventory system
         self.inventory_manager = InventoryManager(self)
     
+    @property
+    def position(self) -> Position:
+        return self._position
+    
+    @position.setter
+    def position(self, value: Position):
+        # Copy the coordinates so the player never shares a Position with the caller
+        self._position.x = value.x
+        self._position.y = value.y
+    
     @property
     def x(self) -> int:
-        return self.position.x
+        return self._position.x
     
     @x.setter
     def x(self, value: int):
-        self.position.x = value
+        self._position.x = value
     
     @property
     def y(self) -> int:
-        return self.position.y
+        return self._position.y
     
     @y.setter
     def y(self, value: int):
-        self.position.y = value
+        self._position.y = value
     
     @property
     def ram_used(self) -> int:
         return self.inventory_manager.get_ram_usage()
     
+    @property
+    def heat(self) -> int:
+        return self._heat
+    
+    @heat.setter
+    def heat(self, value: int):
+        crossed = (value >= 90) != (self._heat >= 90)
+        self._heat = value
+        if crossed:
+            self._update_render_color()
+    
+    @property
+    def speed_moves_remaining(self) -> int:
+        return self._speed_moves_remaining
+    
+    @speed_moves_remaining.setter
+    def speed_moves_remaining(self, value: int):
+        if value != self._speed_moves_remaining:
+            self._speed_moves_remaining = value
+            self.invalidate_conditions()
+    
+    def invalidate_conditions(self):
+        """Mark the cached conditions text as stale."""
+        self._conditions_text = None
+    
+    def _on_effects_changed(self):
+        """Refresh caches that depend on temporary effects."""
+        self.invalidate_conditions()
+        self._update_effect_flags()
+        self._update_render_color()
+    
+    def _update_render_color(self):
+        """Recompute the cached render color after a state change."""
+        status = ((self.is_invisible() << 2) |
+                  ((self.temporary_effects['speed_boost_turns'] > 0) << 1) |
+                  (self._heat >= 90))
+        self.render_color = self.RENDER_COLORS[status]
+    
+    def get_conditions_text(self, network_scan_turns: int) -> Tuple[str, bool]:
+        """Get the conditions line and whether any condition is active."""
+        if self._conditions_text is None:
+            conditions = []
+            
+            # Player temporary effects (from data patches and other sources)
+            for effect_name, turns in self.temporary_effects.items():
+                if turns > 0:
+                    display_name = effect_name.replace('_turns', '').replace('_', ' ').title()
+                    conditions.append(f"{display_name}({turns})")
+            
+            # Network scan effect
+            if network_scan_turns > 0:
+                conditions.append(f"Network Scan({network_scan_turns})")
+            
+            # Speed moves remaining (from speed boost)
+            if self.speed_moves_remaining > 0:
+                conditions.append(f"Speed Moves({self.speed_moves_remaining})")
+            
+            if conditions:
+                conditions_text = "Conditions: " + " ".join(conditions)
+                # Truncate if too long for the line
+                max_width = GameConfig.GAME_AREA_WIDTH - 2
+                if len(conditions_text) > max_width:
+                    conditions_text = conditions_text[:max_width-3] + "..."
+                self._conditions_text = (conditions_text, True)
+            else:
+                self._conditions_text = ("Conditions: None", False)
+        return self._conditions_text
+    
     def move(self, dx: int, dy: int, game_map: 'GameMap') -> bool:
         """Move player with boundary and collision checking."""
-        self.last_position = Position(self.x, self.y)
-        new_position = Position(
-            max(0, min(GameConfig.MAP_WIDTH - 1, self.x + dx)),
-            max(0, min(GameConfig.MAP_HEIGHT - 1, self.y + dy))
-        )
-        
-        if game_map.is_valid_position(new_position):
-            self.position = new_position
+        position = self._position
+        self.last_position.x = position.x
+        self.last_position.y = position.y
+        new_x = max(0, min(GameConfig.MAP_WIDTH - 1, position.x + dx))
+        new_y = max(0, min(GameConfig.MAP_HEIGHT - 1, position.y + dy))
+        
+        if game_map.is_open_cell(new_x, new_y):
+            position.x = new_x
+            position.y = new_y
             return True
         return False
     
     def update_effects(self):
         """Update temporary effects each turn."""
-        for effect in self.temporary_effects:
-            self.temporary_effects[effect] = max(0, self.temporary_effects[effect] - 1)
+        self.temporary_effects.tick()
     
     def is_invisible(self) -> bool:
         """Check if player is effectively invisible."""
-        return self.temporary_effects['data_mimic_turns'] > 0
+        return self._invisible
     
     def get_vision_range(self) -> int:
         """Get current vision range including bonuses."""
-        base_range = self.base_vision_range
-        if self.temporary_effects['enhanced_vision_turns'] > 0:
-            base_range += 5
-        return base_range
+        return self._vision_range
+    
+    def _update_effect_flags(self):
+        """Recompute the cached vision range and effect flags after an effect change."""
+        self._invisible = self.temporary_effects['data_mimic_turns'] > 0
+        self._see_through_walls = self.temporary_effects['enhanced_vision_turns'] > 0
+        self._vision_range = self.base_vision_range + (5 if self._see_through_walls else 0)
     
     def can_see_through_walls(self) -> bool:
         """Check if player can see through walls."""
-        return self.temporary_effects['enhanced_vision_turns'] > 0
+        return self._see_through_walls
     
     def can_see_enemy(self, enemy: 'Enemy', game_map: 'GameMap') -> bool:
         """Check if player can see enemy, considering shadow mechanics."""
-        distance = self.position.distance_to(enemy.position)
+        # Squared distances avoid the sqrt; all ranges are whole numbers
+        distance_sq = self._position.distance_sq_to(enemy.position)
+        vision_range = self._vision_range
         
         # Check basic vision range
-        if distance > self.get_vision_range():
+        if distance_sq > vision_range * vision_range:
             return False
         
         # Check for stealth mechanics
-        player_in_shadow = game_map.is_shadow(self.position)
+        player_in_shadow = game_map.is_shadow(self._position)
         enemy_in_shadow = game_map.is_shadow(enemy.position)
         
         # If enemy is in shadow, only visible if player is directly adjacent (distance <= 1)
-        if enemy_in_shadow and distance > 1:
+        if enemy_in_shadow and distance_sq > 1:
             return False
         
         # If player is in shadow, they can't see as far (but can still see adjacent)
-        if player_in_shadow and distance > 1:
+        if player_in_shadow and distance_sq > 1:
             # Reduce vision range when in shadows
-            if distance > max(1, self.get_vision_range() // 2):
+            shadow_range = max(1, vision_range // 2)
+            if distance_sq > shadow_range * shadow_range:
                 return False
         
-        # Check line of sight (enhanced vision can see through walls)
+        # Check field of view (enhanced vision can see through walls)
         return (self.can_see_through_walls() or 
-                game_map.has_line_of_sight(self.position, enemy.position))
+                game_map.is_visible(enemy.position))
     
     def calculate_ram_usage(self):
         """Update RAM usage calculation."""
@@ -532,97 +860,171 @@ class Player:
 class Enemy:
     """Enemy character with AI behavior."""
     
+    __slots__ = (
+        'id', 'list_index', 'on_change', '_position', 'type', 'type_data',
+        'vision', 'damage', 'movement', 'symbol', '_move_handler', '_vision_sq', '_shadow_vision_sq',
+        'cpu', 'max_cpu', '_state', '_disabled_turns', 'color_index', '_color', 'alert_timer',
+        'move_cooldown', 'patrol_points', 'patrol_index',
+        'patrol_steps', 'patrol_previews', 'last_seen_player', 'random_move_queue'
+    )
+    
     _next_id = 1  # Class variable for unique IDs
     
+    # Render color for each awareness state while not disabled
+    STATE_COLORS = {
+        EnemyState.UNAWARE: Colors.ENEMY_UNAWARE,
+        EnemyState.ALERT: Colors.ENEMY_ALERT,
+        EnemyState.HOSTILE: Colors.ENEMY_HOSTILE,
+    }
+    # Small-int color index per render state; disabled enemies use the last entry
+    STATE_COLOR_INDEX = {state: i for i, state in enumerate(STATE_COLORS)}
+    DISABLED_COLOR_INDEX = len(STATE_COLORS)
+    RENDER_COLORS = (*STATE_COLORS.values(), Colors.BLUE)
+    
+    # Directions a random mover can queue up
+    RANDOM_DIRECTIONS = ((0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1))
+    
     def __init__(self, position: Position, enemy_type: str):
         self.id = Enemy._next_id
         Enemy._next_id += 1
         
-        self.position = position
+        # Set by Game to keep its per-enemy arrays in sync
+        self.list_index = -1
+        self.on_change: Optional[Callable[['Enemy'], None]] = None
+        
+        self._position = position
         self.type = enemy_type
-        self.type_data = GameData.ENEMY_TYPES[enemy_type]
+        type_data = GameData.ENEMY_TYPES[enemy_type]
+        self.type_data = type_data
+        # Type fields read every turn or frame, copied to skip the attribute chain
+        self.vision = type_data.vision
+        self.damage = type_data.damage
+        self.movement = type_data.movement
+        self.symbol = type_data.symbol
+        self._move_handler = self._MOVE_HANDLERS[self.movement]
+        self._vision_sq = self.vision ** 2
+        self._shadow_vision_sq = max(1, self.vision // 2) ** 2
         
         # Stats
-        self.cpu = self.type_data.cpu
-        self.max_cpu = self.type_data.cpu
-        
-        # AI state
-        self.state = EnemyState.UNAWARE
+        self.cpu = type_data.cpu
+        self.max_cpu = type_data.cpu
+        
+        # AI state (state and disabled_turns keep the cached render color fresh)
+        self._state = EnemyState.UNAWARE
+        self._disabled_turns = 0
+        self.color_index = self.STATE_COLOR_INDEX[EnemyState.UNAWARE]
+        self._color = Colors.ENEMY_UNAWARE
         self.alert_timer = 0
-        self.disabled_turns = 0
         self.move_cooldown = 0
         
         # Movement data
         self.patrol_points: List[Position] = []
         self.patrol_index = 0
+        # (x, y, patrol_index) -> (patrol_index, next cell ignoring enemies and player)
+        self.patrol_steps: Dict[Tuple[int, int, int], Tuple[int, Optional[Tuple[int, int]]]] = {}
+        # (x, y, patrol_index, steps) -> next cells along those patrol steps
+        self.patrol_previews: Dict[Tuple[int, int, int, int], Tuple[Tuple[int, int], ...]] = {}
         self.last_seen_player: Optional[Position] = None
-        self.random_move_queue: List[Tuple[int, int]] = []
+        self.random_move_queue: Deque[Tuple[int, int]] = deque()
+    
+    @property
+    def position(self) -> Position:
+        return self._position
+    
+    @position.setter
+    def position(self, value: Position):
+        self._position = value
+        self._notify_change()
     
     @property
     def x(self) -> int:
 
-        return self.position.x
+        return self._position.x
     
     @x.setter
     def x(self, value: int):
-        self.position.x = value
+        self._position.x = value
+        self._notify_change()
     
     @property
     def y(self) -> int:
-        return self.position.y
+        return self._position.y
     
     @y.setter
     def y(self, value: int):
-        self.position.y = value
+        self._position.y = value
+        self._notify_change()
+    
+    @property
+    def state(self) -> EnemyState:
+        return self._state
+    
+    @state.setter
+    def state(self, value: EnemyState):
+        self._state = value
+        self._update_color()
+    
+    @property
+    def disabled_turns(self) -> int:
+        return self._disabled_turns
+    
+    @disabled_turns.setter
+    def disabled_turns(self, value: int):
+        self._disabled_turns = value
+        self._update_color()
+        self._notify_change()
+    
+    def _notify_change(self):
+        """Report a position or disabled change to the owning game."""
+        if self.on_change:
+            self.on_change(self)
+    
+    def _update_color(self):
+        """Recompute the cached render color after a state change."""
+        self.color_index = (self.DISABLED_COLOR_INDEX if self._disabled_turns > 0
+                            else self.STATE_COLOR_INDEX[self._state])
+        self._color = self.RENDER_COLORS[self.color_index]
     
     def get_color(self) -> Tuple[int, int, int]:
         """Get the color for rendering this enemy."""
-        if self.disabled_turns > 0:
-            return Colors.BLUE
-        elif self.state == EnemyState.UNAWARE:
-            return Colors.ENEMY_UNAWARE
-        elif self.state == EnemyState.ALERT:
-            return Colors.ENEMY_ALERT
-        else:
-            return Colors.ENEMY_HOSTILE
+        return self._color
     
     def can_see_player(self, player: Player, game_map: 'GameMap') -> bool:
         """Check if enemy can see player."""
         if self.disabled_turns > 0:
             return False
         
-        distance = self.position.distance_to(player.position)
-        if distance > self.type_data.vision:
+        # Squared distances avoid the sqrt; all ranges are whole numbers
+        dx = self._position.x - player.position.x
+        dy = self._position.y - player.position.y
+        distance_sq = dx * dx + dy * dy
+        if distance_sq > self._vision_sq:
             return False
 
         # Check if player is invisible (data mimic effect)
         if player.is_invisible():
             return False
         
-        # Check for stealth mechanics
-        player_in_shadow = game_map.is_shadow(player.position)
-        enemy_in_shadow = game_map.is_shadow(self.position)
-        
-        # If player is in shadow, only visible if enemy is directly adjacent (distance <= 1)
-        if player_in_shadow and distance > 1:
-            return False
-        
-        # If enemy is in shadow, it can't see as far (but can still see adjacent)
-        if enemy_in_shadow and distance > 1:
-            # Reduce vision range when in shadows
-            if distance > max(1, self.type_data.vision // 2):
+        # Shadows only matter beyond adjacent range
+        if distance_sq > 1:
+            # If player is in shadow, only visible if enemy is directly adjacent
+            if game_map.is_shadow(player.position):
+                return False
+            
+            # If enemy is in shadow, it can't see as far
+            if distance_sq > self._shadow_vision_sq and game_map.is_shadow(self._position):
                 return False
 
-        return game_map.has_line_of_sight(self.position, player.position)
+        # Field of view is computed from the player and is symmetric
+        return game_map.is_visible(self.position)
     
     def can_attack_player(self, player: Player) -> bool:
-        """Check if enemy can attack player (adjacent)."""
-        distance = self.position.distance_to(player.position)
-        return distance <= 1 and self.disabled_turns == 0
+        """Check if enemy can attack player (adjacent, diagonals included)."""
+        return self.disabled_turns == 0 and self.position.chebyshev(player.position) <= 1
     
     def attack_player(self, player: Player) -> int:
         """Attack the player and return damage dealt."""
-        return player.take_damage(self.type_data.damage)
+        return player.take_damage(self.damage)
     
     def take_damage(self, damage: int) -> bool:
         """Take damage and return True if destroyed."""
@@ -648,36 +1050,35 @@ class Enemy:
         
         self._reset_movement_cooldown()
         
-        if self.type_data.movement == EnemyMovement.STATIC:
-            return False
-        elif self.type_data.movement == EnemyMovement.RANDOM:
-            return self._move_random(game_map, player, game)
-        elif self.type_data.movement == EnemyMovement.LINEAR and self.patrol_points:
-            return self._move_patrol(game_map, player, game)
-        elif self.type_data.movement == EnemyMovement.SEEK:
-            if self.state == EnemyState.HOSTILE and self.last_seen_player:
-                return self._move_toward(self.last_seen_player, game_map, player, game)
-            elif self.state == EnemyState.ALERT and self.last_seen_player:
-                return self._move_toward(self.last_seen_player, game_map, player, game)
-        elif self.type_data.movement == EnemyMovement.TRACK:
-            if self.state == EnemyState.HOSTILE:
-                return self._move_toward(player.position, game_map, player, game)
-        
-        return False
+        return self._move_handler(self, game_map, player, game)
     
     def _reset_movement_cooldown(self):
         """Reset movement cooldown based on enemy type."""
-        if self.type_data.movement == EnemyMovement.LINEAR:
+        if self.movement == EnemyMovement.LINEAR:
             self.move_cooldown = 1
         else:
             self.move_cooldown = 2
     
     def _ensure_random_move_queue(self):
         """Ensure the random move queue has at least 3 moves."""
-        directions = [(0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1)]
-        
         while len(self.random_move_queue) < 3:
-            self.random_move_queue.append(random.choice(directions))
+            self.random_move_queue.append(random.choice(self.RANDOM_DIRECTIONS))
+    
+    def _move_static(self, game_map: 'GameMap', player: Player, game: 'Game' = None) -> bool:
+        """Static enemies never move."""
+        return False
+    
+    def _move_seek(self, game_map: 'GameMap', player: Player, game: 'Game' = None) -> bool:
+        """Head for where the player was last seen once alerted. Returns True if moved."""
+        if self.state in (EnemyState.HOSTILE, EnemyState.ALERT) and self.last_seen_player:
+            return self._move_toward(self.last_seen_player, game_map, player, game)
+        return False
+    
+    def _move_track(self, game_map: 'GameMap', player: Player, game: 'Game' = None) -> bool:
+        """Chase the player directly while hostile. Returns True if moved."""
+        if self.state == EnemyState.HOSTILE:
+            return self._move_toward(player.position, game_map, player, game)
+        return False
     
     def _move_random(self, game_map: 'GameMap', player: Player, game: 'Game' = None) -> bool:
         """Execute random movement pattern with move queue. Returns True if moved."""
@@ -691,64 +1092,113 @@ class Enemy:
         
         # Execute the next queued move
         if self.random_move_queue:
-            dx, dy = self.random_move_queue.pop(0)
-            new_position = Position(self.x + dx, self.y + dy)
-            if (new_position.is_valid(GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT) and
-                game_map.is_valid_position(new_position) and
-                not new_position.distance_to(player.position) == 0 and
-                (game is None or not game._get_enemy_at(new_position))):
-                self.position = new_position
+            dx, dy = self.random_move_queue.popleft()
+            new_cell = (self._position.x + dx, self._position.y + dy)
+            if (game_map.is_open_cell(*new_cell) and
+                new_cell != (player.x, player.y) and
+                (game is None or new_cell not in game.enemy_by_pos)):
+                self.position = Position(*new_cell)
                 return True
         
         return False
     
     def _move_patrol(self, game_map: 'GameMap', player: Player, game: 'Game' = None) -> bool:
         """Execute patrol movement pattern. Returns True if moved."""
+        if not self.patrol_points:
+            return False
+        
         if self.state == EnemyState.HOSTILE:
             return self._move_toward(player.position, game_map, player, game)
         elif self.state == EnemyState.ALERT and self.last_seen_player:
             return self._move_toward(self.last_seen_player, game_map, player, game)
         
-        if not self.patrol_points:
-            return False
-        
-        target = self.patrol_points[self.patrol_index]
+        self.patrol_index, step = self.get_patrol_step(self.x, self.y, self.patrol_index, game_map)
         
-        if self.position.distance_to(target) <= 1:
-            self.patrol_index = (self.patrol_index + 1) % len(self.patrol_points)
-            target = self.patrol_points[self.patrol_index]
+        # The cached step is what _move_toward picks unless an enemy or the player is in the way
+        if (step and step != (player.x, player.y) and
+            (game is None or step not in game.enemy_by_pos)):
+            self.position = Position(*step)
+            return True
         
-        return self._move_toward(target, game_map, player, game)
-
+        return self._move_toward(self.patrol_points[self.patrol_index], game_map, player, game)
+    
+    # Movement pattern -> handler, resolved once per enemy in __init__
+    _MOVE_HANDLERS = {
+        EnemyMovement.STATIC: _move_static,
+        EnemyMovement.LINEAR: _move_patrol,
+        EnemyMovement.RANDOM: _move_random,
+        EnemyMovement.SEEK: _move_seek,
+        EnemyMovement.TRACK: _move_track,
+    }
+    
+    def bake_patrol(self, game_map: 'GameMap'):
+        """Precompute patrol steps around the route from the current position."""
+        self.patrol_steps.clear()
+        self.patrol_previews.clear()
+        state = (self.x, self.y, self.patrol_index)
+        while state not in self.patrol_steps:
+            index, step = self.get_patrol_step(*state, game_map)
+            if step is None:
+                break
+            state = (step[0], step[1], index)
+    
+    def get_patrol_step(self, x: int, y: int, patrol_index: int, game_map: 'GameMap') -> Tuple[int, Optional[Tuple[int, int]]]:
+        """Get the patrol index and next cell from (x, y), ignoring enemies and the player.
+        
+        Walls are fixed once a level is generated, so results are cached per state.
+        """
+        key = (x, y, patrol_index)
+        cached = self.patrol_steps.get(key)
+        if cached is not None:
+            return cached
+        
+        target = self.patrol_points[patrol_index]
+        if target.chebyshev(Position(x, y)) <= 1:
+            patrol_index = (patrol_index + 1) % len(self.patrol_points)
+            target = self.patrol_points[patrol_index]
+        
+        step = None
+        if target.is_valid(GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT):
+            # Same direction preference as _move_toward, ignoring enemies and the player
+            new_x, new_y = step_toward(game_map.walls, game_map.no_occupants, x, y, target.x, target.y, -1, -1)
+            if (new_x, new_y) != (x, y):
+                step = (int(new_x), int(new_y))
+        
+        self.patrol_steps[key] = (patrol_index, step)
+        return patrol_index, step
+    
+    def get_patrol_preview(self, steps: int, game_map: 'GameMap') -> Tuple[Tuple[int, int], ...]:
+        """Get up to `steps` next cells along the patrol from the current state, ignoring enemies and the player.
+        
+        Stops early where walls block the route; cached per state like get_patrol_step.
+        """
+        key = (self.x, self.y, self.patrol_index, steps)
+        preview = self.patrol_previews.get(key)
+        if preview is None:
+            cells = []
+            x, y, patrol_index = key[:3]
+            for _ in range(steps):
+                patrol_index, step = self.get_patrol_step(x, y, patrol_index, game_map)
+                if step is None:
+                    break
+                cells.append(step)
+                x, y = step
+            preview = self.patrol_previews[key] = tuple(cells)
+        return preview
     
     def _move_toward(self, target: Position, game_map: 'GameMap', player: Player, game: 'Game' = None) -> bool:
         """Move one step toward target position. Returns True if moved."""
         if not target.is_valid(GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT):
             return False
         
-        original_position = self.position
-        dx = 0 if self.x == target.x else (1 if target.x > self.x else -1)
-        dy = 0 if self.y == target.y else (1 if target.y > self.y else -1)
-        
-        # Try different movement directions in order of preference
-        move_attempts = [
-            (dx, dy), (dx, 0), (0, dy), (dx, -dy), (-dx, dy),
-            (-dx, 0), (0, -dy), (-dx, -dy)
-        ]
-        
-        for try_dx, try_dy in move_attempts:
-            if try_dx == 0 and try_dy == 0:
-                continue
-            
-            new_position = Position(self.x + try_dx, self.y + try_dy)
-            if (new_position.is_valid(GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT) and
-                game_map.is_valid_position(new_position) and
-                not new_position.distance_to(player.position) == 0 and
-                (game is None or not game._get_enemy_at(new_position))):
-                self.position = new_position
-                break
+        occupied = game.enemy_grid if game is not None else game_map.no_occupants
+        x, y = self._position.x, self._position.y
+        new_x, new_y = step_toward(game_map.walls, occupied, x, y, target.x, target.y, player.x, player.y)
+        if new_x == x and new_y == y:
+            return False
         
-        return self.position != original_position
+        self.position = Position(int(new_x), int(new_y))
+        return True
 
 # ============================================================================
 # GAME MAP
@@ -761,44 +1211,171 @@ class GameMap:
         self.width = width
         self.height = height
         
-        # Terrain sets
-        self.walls: Set[Tuple[int, int]] = set()
-        self.shadows: Set[Tuple[int, int]] = set()
+        # Terrain grids, indexed [x, y]
+        # Walls live inside a one-cell wall border, so neighbours of any map cell index safely
+        self._bordered_walls = np.ones((width + 2, height + 2), dtype=bool)
+        self.walls = self._bordered_walls[1:-1, 1:-1]
+        self.walls[:] = False
+        self.shadows = np.zeros((width, height), dtype=bool)
         
-        # Feature sets
-        self.cooling_nodes: Set[Tuple[int, int]] = set()
-        self.cpu_recovery_nodes: Set[Tuple[int, int]] = set()
+        # Feature grids
+        self.cooling_nodes = np.zeros((width, height), dtype=bool)
+        self.cpu_recovery_nodes = np.zeros((width, height), dtype=bool)
         
         # Items
         self.data_patches: Dict[Tuple[int, int], DataPatch] = {}
         self.exploit_pickups: Dict[Tuple[int, int], ExploitItem] = {}
         
+        # Packed TileFlags per cell for rendering, kept in sync with the grids and items above
+        self.tile_flags = np.zeros((width, height), dtype=np.uint8)
+        # Occupancy for step_toward queries that ignore other enemies
+        self.no_occupants = np.zeros((width, height), dtype=np.int16)
+        
+        # Field of view from the player: symmetric, so it also answers "can x see the player"
+        self.visible = np.zeros((width, height), dtype=bool)
+        self._fov_key: Optional[Tuple[int, int, int]] = None  # None when walls changed since last compute
+        # Half-size of the largest wall-free square centered on each cell (-1 on walls), built lazily
+        self._open_radius: Optional[np.ndarray] = None
+        
         # Special locations
         self.gateway: Optional[Position] = None
         
-        # Memory system for hybrid fog of war
-        self.explored_tiles: Set[Tuple[int, int]] = set()
+        # Memory system for hybrid fog of war: cells the player has seen, indexed [x, y]
+        self.explored = np.zeros((width, height), dtype=bool)
         self.last_known_enemy_positions: Dict[int, Tuple[Position, int]] = {}  # enemy_id -> (position, turn_seen)
     
+    def clear(self):
+        """Clear terrain, features, data patches and memory for a new level."""
+        self.walls.fill(False)
+        self.shadows.fill(False)
+        self.cooling_nodes.fill(False)
+        self.cpu_recovery_nodes.fill(False)
+        self.data_patches.clear()
+        self.explored.fill(False)
+        self.last_known_enemy_positions.clear()
+        self.tile_flags.fill(0)
+        self.visible.fill(False)
+        self.invalidate_fov()
+        # Exploit pickups are not cleared between levels
+        for x, y in self.exploit_pickups:
+            self.tile_flags[x, y] |= TileFlags.EXPLOIT_PICKUP
+    
+    def add_wall(self, x: int, y: int):
+        """Place a wall at (x, y)."""
+        self.walls[x, y] = True
+        self.tile_flags[x, y] |= TileFlags.WALL
+        self.invalidate_fov()
+    
+    def _clip_rect(self, x: int, y: int, width: int, height: int) -> Tuple[slice, slice]:
+        """Get [x, y] slices for a rectangle, clipped to the map."""
+        return (slice(max(0, x), max(0, min(self.width, x + width))),
+                slice(max(0, y), max(0, min(self.height, y + height))))
+    
+    def add_wall_rect(self, x: int, y: int, width: int, height: int):
+        """Fill a rectangle with walls; parts outside the map are ignored."""
+        area = self._clip_rect(x, y, width, height)
+        self.walls[area] = True
+        self.tile_flags[area] |= TileFlags.WALL
+        self.invalidate_fov()
+    
+    def remove_wall_rect(self, x: int, y: int, width: int, height: int):
+        """Clear walls from a rectangle; parts outside the map are ignored."""
+        area = self._clip_rect(x, y, width, height)
+        self.walls[area] = False
+        self.tile_flags[area] &= ~TileFlags.WALL & 0xFF
+        self.invalidate_fov()
+    
+    def remove_wall(self, x: int, y: int):
+        """Remove the wall at (x, y) if there is one."""
+        self.walls[x, y] = False
+        self.tile_flags[x, y] &= ~TileFlags.WALL & 0xFF
+        self.invalidate_fov()
+    
+    def add_shadow(self, x: int, y: int):
+        """Mark (x, y) as shadow."""
+        self.shadows[x, y] = True
+        self.tile_flags[x, y] |= TileFlags.SHADOW
+    
+    def add_shadow_rect(self, x: int, y: int, width: int, height: int):
+        """Shade the open cells of a rectangle; walls and parts outside the map are skipped."""
+        area = self._clip_rect(x, y, width, height)
+        shaded = ~self.walls[area]
+        self.shadows[area] |= shaded
+        self.tile_flags[area][shaded] |= TileFlags.SHADOW
+    
+    def add_shadow_mask(self, mask: np.ndarray):
+        """Shade the open cells of an [x, y] mask; walls are skipped."""
+        shaded = mask & ~self.walls
+        self.shadows |= shaded
+        self.tile_flags[shaded] |= TileFlags.SHADOW
+    
+    def _disc_cells(self, x: int, y: int, radius: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the in-map (xs, ys) cells of a Euclidean disc, from the cached stencil."""
+        offsets = get_vision_stencil(radius)
+        xs = offsets[:, 0] + x
+        ys = offsets[:, 1] + y
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        return xs[inside], ys[inside]
+    
+    def add_shadow_disc(self, x: int, y: int, radius: int):
+        """Shade the open cells of a disc; walls and parts outside the map are skipped."""
+        xs, ys = self._disc_cells(x, y, radius)
+        shaded = ~self.walls[xs, ys]
+        xs, ys = xs[shaded], ys[shaded]
+        self.shadows[xs, ys] = True
+        self.tile_flags[xs, ys] |= TileFlags.SHADOW
+    
+    def add_cooling_node(self, x: int, y: int):
+        """Place a cooling node at (x, y)."""
+        self.cooling_nodes[x, y] = True
+        self.tile_flags[x, y] |= TileFlags.COOLING_NODE
+    
+    def add_cpu_recovery_node(self, x: int, y: int):
+        """Place a CPU recovery node at (x, y)."""
+        self.cpu_recovery_nodes[x, y] = True
+        self.tile_flags[x, y] |= TileFlags.CPU_RECOVERY_NODE
+    
+    def add_data_patch(self, x: int, y: int, patch: DataPatch):
+        """Place a data patch at (x, y)."""
+        self.data_patches[(x, y)] = patch
+        self.tile_flags[x, y] |= TileFlags.DATA_PATCH
+    
+    def remove_data_patch(self, x: int, y: int) -> Optional[DataPatch]:
+        """Remove and return the data patch at (x, y)."""
+        self.tile_flags[x, y] &= ~TileFlags.DATA_PATCH & 0xFF
+        return self.data_patches.pop((x, y), None)
+    
+    def add_exploit_pickup(self, x: int, y: int, exploit_item: ExploitItem):
+        """Place an exploit pickup at (x, y)."""
+        self.exploit_pickups[(x, y)] = exploit_item
+        self.tile_flags[x, y] |= TileFlags.EXPLOIT_PICKUP
+    
+    def remove_exploit_pickup(self, x: int, y: int) -> Optional[ExploitItem]:
+        """Remove and return the exploit pickup at (x, y)."""
+        self.tile_flags[x, y] &= ~TileFlags.EXPLOIT_PICKUP & 0xFF
+        return self.exploit_pickups.pop((x, y), None)
+    
+    def get_flags(self, x: int, y: int) -> int:
+        """Get the TileFlags packed for (x, y); cells off the map read as walls."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return int(self.tile_flags[x, y])
+        return TileFlags.WALL
+    
     def is_wall(self, position: Position) -> bool:
         """Check if position contains a wall."""
-        if not position.is_valid(self.width, self.height):
-            return True
-        return (position.x, position.y) in self.walls
+        return bool(self.get_flags(position.x, position.y) & TileFlags.WALL)
     
     def is_shadow(self, position: Position) -> bool:
         """Check if position is in shadow."""
-        if not position.is_valid(self.width, self.height):
-            return False
-        return (position.x, position.y) in self.shadows
+        return bool(self.get_flags(position.x, position.y) & TileFlags.SHADOW)
     
     def is_cooling_node(self, position: Position) -> bool:
         """Check if position contains a cooling node."""
-        return (position.x, position.y) in self.cooling_nodes
+        return bool(self.get_flags(position.x, position.y) & TileFlags.COOLING_NODE)
     
     def is_cpu_recovery_node(self, position: Position) -> bool:
         """Check if position contains a CPU recovery node."""
-        return (position.x, position.y) in self.cpu_recovery_nodes
+        return bool(self.get_flags(position.x, position.y) & TileFlags.CPU_RECOVERY_NODE)
     
     def get_data_patch(self, position: Position) -> Optional[DataPatch]:
         """Get data patch at position."""
@@ -808,38 +1385,73 @@ class GameMap:
         """Get exploit pickup at position."""
         return self.exploit_pickups.get((position.x, position.y))
     
+    def is_open_cell(self, x: int, y: int) -> bool:
+        """Check if (x, y) is in bounds and not a wall.
+        
+        (x, y) may be at most one cell off the map, where the wall border rejects it.
+        """
+        return not self._bordered_walls[x + 1, y + 1]
+    
     def is_valid_position(self, position: Position) -> bool:
         """Check if position is valid for movement."""
-        return (position.is_valid(self.width, self.height) and 
-                not self.is_wall(position))
-    
-    def has_line_of_sight(self, start: Position, end: Position) -> bool:
-        """Check line of sight between two positions using Bresenham's algorithm."""
-        if not (start.is_valid(self.width, self.height) and 
-                end.is_valid(self.width, self.height)):
+        return position.is_valid(self.width, self.height) and not self.walls[position.x, position.y]
+    
+    def get_open_radius(self) -> np.ndarray:
+        """Get the half-size of the largest wall-free square centered on each cell.
+        
+        Walls are -1; the map edge counts as a wall.
+        """
+        if self._open_radius is None:
+            open_radius = np.full((self.width, self.height), -1, dtype=np.int16)
+            current = ~self.walls
+            radius = 0
+            while current.any():
+                open_radius[current] = radius
+                # Erode: a cell survives if its whole 3x3 neighbourhood did
+                eroded = np.zeros_like(current)
+                core = eroded[1:-1, 1:-1]
+                core[...] = True
+                for dx in range(3):
+                    for dy in range(3):
+                        core &= current[dx:self.width - 2 + dx, dy:self.height - 2 + dy]
+                current = eroded
+                radius += 1
+            self._open_radius = open_radius
+        return self._open_radius
+    
+    def compute_fov(self, origin: Position, radius: int):
+        """Recompute the visible grid from origin using symmetric shadowcasting.
+        
+        The grid is limited to a Euclidean disc of the given radius.
+        """
+        disc = np.zeros((self.width, self.height), dtype=bool)
+        disc[self._disc_cells(origin.x, origin.y, radius)] = True
+        
+        if self.get_open_radius()[origin.x, origin.y] >= radius:
+            # No walls anywhere in the square around origin, so the whole disc is in view
+            self.visible = disc
+        else:
+            self.visible = tcod.map.compute_fov(
+                ~self.walls, (origin.x, origin.y), radius=0, light_walls=True,
+                algorithm=tcod.constants.FOV_SYMMETRIC_SHADOWCAST
+            ) & disc
+        self._fov_key = (origin.x, origin.y, radius)
+    
+    def update_fov(self, origin: Position, radius: int):
+        """Recompute the visible grid only if origin or radius changed, or walls changed."""
+        if self._fov_key != (origin.x, origin.y, radius):
+            self.compute_fov(origin, radius)
+    
+    def invalidate_fov(self):
+        """Force the next update_fov to recompute, e.g. after walls change."""
+        self._fov_key = None
+        self._open_radius = None
+    
+    def is_visible(self, position: Position) -> bool:
+        """Check if position is in the field of view computed by compute_fov."""
+        if not position.is_valid(self.width, self.height):
             return False
-        
-        dx = abs(end.x - start.x)
-        dy = abs(end.y - start.y)
-        sx = 1 if start.x < end.x else -1
-        sy = 1 if start.y < end.y else -1
-        err = dx - dy
-        
-        x, y = start.x, start.y
-        
-        while True:
-            if x == end.x and y == end.y:
-                return True
-            if self.is_wall(Position(x, y)):
-                return False
-            
-            e2 = 2 * err
-            if e2 > -dy:
-                err -= dy
-                x += sx
-            if e2 < dx:
-                err += dx
-                y += sy
+        return bool(self.visible[position.x, position.y])
 
 # ============================================================================
 # MESSAGE LOG SYSTEM
@@ -848,8 +1460,16 @@ class GameMap:
 class MessageLog:
     """Manages game messages and logging."""
     
+    # Lowercase keywords that pick a message's color, checked in order; otherwise green
+    COLOR_RULES = (
+        (("admin", "critical", "eliminated"), Colors.RED),
+        (("detected", "investigating", "attracted", "attacks"), Colors.YELLOW),
+        (("activated", "restored", "reduced", "active"), Colors.CYAN),
+    )
+    
     def __init__(self, max_messages: int = 100):
-        self.messages: List[Tuple[str, Tuple[int, int, int]]] = []
+        # Oldest messages fall off the front once max_messages is reached
+        self.messages: deque = deque(maxlen=max_messages)
         self.max_messages = max_messages
     
     def add_message(self, text: str, color: Optional[Tuple[int, int, int]] = None):
@@ -861,30 +1481,21 @@ class MessageLog:
             color = self._determine_message_color(text)
         
         self.messages.append((text, color))
-        
-        if len(self.messages) > self.max_messages:
-            self.messages = self.messages[-self.max_messages:]
     
     def _determine_message_color(self, text: str) -> Tuple[int, int, int]:
         """Determine appropriate color for message based on content."""
         text_lower = text.lower()
-        text_upper = text.upper()
-        
-        if ("ADMIN" in text_upper or "CRITICAL" in text_upper or 
-            "eliminated" in text_lower):
-            return Colors.RED
-        elif ("detected" in text_lower or "investigating" in text_lower or 
-              "attracted" in text_lower or "attacks" in text_lower):
-            return Colors.YELLOW
-        elif ("activated" in text_lower or "restored" in text_lower or 
-              "reduced" in text_lower or "active" in text_lower):
-            return Colors.CYAN
-        else:
-            return Colors.GREEN
+        for keywords, color in self.COLOR_RULES:
+            if any(keyword in text_lower for keyword in keywords):
+                return color
+        return Colors.GREEN
     
     def get_recent_messages(self, count: int) -> List[Tuple[str, Tuple[int, int, int]]]:
-        """Get the most recent messages."""
-        return self.messages[-count:] if len(self.messages) > count else self.messages
+        """Get the most recent messages, oldest first."""
+        # Walk in from the newest end instead of copying the whole log
+        recent = list(islice(reversed(self.messages), count))
+        recent.reverse()
+        return recent
 
 # ============================================================================
 # GAME STATE AND MAIN GAME CLASS
@@ -893,6 +1504,11 @@ class MessageLog:
 class Game:
     """Main game class that manages all game state and logic."""
     
+    # Patrol route legs run along the cardinal axes
+    PATROL_DIRECTIONS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+    # Each kind of placement must be farther than this from the level spawn point
+    SPAWN_CLEARANCE = {'node': 8, 'patch': 5, 'enemy': 12, 'gateway': 25}
+    
     def __init__(self):
         # Core game objects
         self.player = Player(5, 5)
@@ -911,14 +1527,34 @@ class Game:
         self.show_inventory = False
         self.show_help = False
         self.inventory_selection = 0
+        self.dirty = True  # Screen needs to be redrawn
         
         # Targeting system
         self.targeting_mode = False
         self.targeting_exploit: Optional[str] = None
         self.cursor_position = Position(0, 0)
         
+        # Per-enemy arrays indexed by Enemy.list_index, for vectorized culling
+        self.enemy_x = np.zeros(0, dtype=np.int32)
+        self.enemy_y = np.zeros(0, dtype=np.int32)
+        self.enemy_disabled = np.zeros(0, dtype=np.int32)
+        self.enemy_vision = np.zeros(0, dtype=np.int32)
+        
+        # Enemy at each occupied (x, y), for O(1) collision checks
+        self.enemy_by_pos: Dict[Tuple[int, int], Enemy] = {}
+        self.enemy_by_id: Dict[int, Enemy] = {}
+        self.enemy_grid = np.zeros((GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT), dtype=np.int16)
+        
+        # Squared distance of every cell from the level spawn point, for placement rules
+        spawn_dx = np.arange(GameConfig.MAP_WIDTH)[:, np.newaxis] - 5
+        spawn_dy = np.arange(GameConfig.MAP_HEIGHT)[np.newaxis, :] - 5
+        self.spawn_distance_sq = spawn_dx * spawn_dx + spawn_dy * spawn_dy
+        # Cells clear of the spawn point for each placement kind; spawn never moves, so built once
+        self.spawn_clear = {kind: self.spawn_distance_sq > clearance * clearance
+                            for kind, clearance in self.SPAWN_CLEARANCE.items()}
+        
         # Game effects
-        self.network_scan_turns = 0
+        self._network_scan_turns = 0
         self.noise_locations: List[Position] = []
         self.distraction_points: Dict[Position, int] = {}
         
@@ -928,8 +1564,19 @@ class Game:
         
         # Initialize - Start with first procedural level
         self.dungeon_seed = random.randint(1, 1000000)
+        self.level_rng: Optional[np.random.Generator] = None  # Seeded per level by _generate_procedural_level
         self._generate_procedural_level()
     
+    @property
+    def network_scan_turns(self) -> int:
+        return self._network_scan_turns
+    
+    @network_scan_turns.setter
+    def network_scan_turns(self, value: int):
+        if value != self._network_scan_turns:
+            self._network_scan_turns = value
+            self.player.invalidate_conditions()
+    
     def _randomize_data_patches(self):
         """Randomize data patch effects for this game session."""
         colors = ['crimson', 'azure', 'emerald', 'golden', 'violet', 'silver']
@@ -949,24 +1596,150 @@ class Game:
    
     def _clear_map(self):
         """Clear all map data."""
-        self.game_map.walls.clear()
-        self.game_map.shadows.clear()
-        self.game_map.cooling_nodes.clear()
-        self.game_map.cpu_recovery_nodes.clear()
-        self.game_map.data_patches.clear()
-        self.game_map.explored_tiles.clear()  # Clear memory system
-        self.game_map.last_known_enemy_positions.clear()  # Clear enemy memory
+        self.game_map.clear()  # Terrain, items and memory system
         self.enemies.clear()
+        self._rebuild_enemy_arrays()
+    
+    def _add_enemy(self, enemy: Enemy):
+        """Add an enemy to the level, extending the arrays and indexes in place."""
+        enemy.on_change = self._sync_enemy
+        enemy.list_index = len(self.enemies)
+        self.enemies.append(enemy)
+        self.enemy_x = np.append(self.enemy_x, np.int32(enemy.x))
+        self.enemy_y = np.append(self.enemy_y, np.int32(enemy.y))
+        self.enemy_disabled = np.append(self.enemy_disabled, np.int32(enemy.disabled_turns))
+        self.enemy_vision = np.append(self.enemy_vision, np.int32(enemy.vision))
+        # Earlier enemies keep a shared cell, matching _rebuild_enemy_arrays
+        self.enemy_by_pos.setdefault((enemy.x, enemy.y), enemy)
+        self.enemy_by_id[enemy.id] = enemy
+        self.enemy_grid[enemy.x, enemy.y] += 1
+    
+    def _remove_enemy(self, enemy: Enemy):
+        """Remove a destroyed enemy by moving the last enemy into its slot."""
+        index = enemy.list_index
+        position = (int(self.enemy_x[index]), int(self.enemy_y[index]))
+        last = self.enemies.pop()
+        if last is not enemy:
+            self.enemies[index] = last
+            last.list_index = index
+            for values in (self.enemy_x, self.enemy_y, self.enemy_disabled, self.enemy_vision):
+                values[index] = values[-1]
+        self.enemy_x = self.enemy_x[:-1]
+        self.enemy_y = self.enemy_y[:-1]
+        self.enemy_disabled = self.enemy_disabled[:-1]
+        self.enemy_vision = self.enemy_vision[:-1]
+        enemy.on_change = None
+        
+        del self.enemy_by_id[enemy.id]
+        self._release_cell(enemy, position)
+    
+    def _release_cell(self, enemy: Enemy, position: Tuple[int, int]):
+        """Take an enemy that has left or been removed off its old cell in the grid and position index."""
+        self.enemy_grid[position] -= 1
+        if self.enemy_by_pos.get(position) is enemy:
+            del self.enemy_by_pos[position]
+            # Hand a shared cell to the first remaining enemy on it
+            if self.enemy_grid[position]:
+                self.enemy_by_pos[position] = next(other for other in self.enemies
+                                                   if other is not enemy and (other.x, other.y) == position)
+    
+    def _rebuild_enemy_arrays(self):
+        """Rebuild the per-enemy arrays and position index after enemies are added or removed."""
+        for index, enemy in enumerate(self.enemies):
+            enemy.list_index = index
+        self.enemy_x = np.array([enemy.x for enemy in self.enemies], dtype=np.int32)
+        self.enemy_y = np.array([enemy.y for enemy in self.enemies], dtype=np.int32)
+        self.enemy_disabled = np.array([enemy.disabled_turns for enemy in self.enemies], dtype=np.int32)
+        self.enemy_vision = np.array([enemy.vision for enemy in self.enemies], dtype=np.int32)
+        self.enemy_by_pos = {(enemy.x, enemy.y): enemy for enemy in reversed(self.enemies)}
+        self.enemy_by_id = {enemy.id: enemy for enemy in self.enemies}
+        # Enemy count per cell, indexed [x, y], for the movement kernels
+        self.enemy_grid = np.zeros((GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT), dtype=np.int16)
+        np.add.at(self.enemy_grid, (self.enemy_x, self.enemy_y), 1)
+    
+    def _sync_enemy(self, enemy: Enemy):
+        """Copy an enemy's position and disabled turns into the per-enemy arrays and grid."""
+        index = enemy.list_index
+        old_pos = (int(self.enemy_x[index]), int(self.enemy_y[index]))
+        new_pos = (enemy.x, enemy.y)
+        if old_pos != new_pos:
+            self._release_cell(enemy, old_pos)
+            # An enemy already on the new cell keeps it, matching _add_enemy
+            self.enemy_by_pos.setdefault(new_pos, enemy)
+            self.enemy_grid[new_pos] += 1
+        self.enemy_x[index] = enemy.x
+        self.enemy_y[index] = enemy.y
+        self.enemy_disabled[index] = enemy.disabled_turns
+    
+    def get_enemy_visibility(self) -> np.ndarray:
+        """Get Player.can_see_enemy for every enemy at once, as a bool array in list order.
+        
+        Relies on the field of view computed by update_fov.
+        """
+        player = self.player
+        vision_range = player.get_vision_range()
+        dx = self.enemy_x - player.x
+        dy = self.enemy_y - player.y
+        distance_sq = dx * dx + dy * dy
+        beyond_adjacent = distance_sq > 1
+        
+        visible = distance_sq <= vision_range * vision_range
+        # Enemies in shadow are only visible when adjacent
+        visible &= ~(self.game_map.shadows[self.enemy_x, self.enemy_y] & beyond_adjacent)
+        # A player in shadow sees non-adjacent enemies only within half range
+        if self.game_map.is_shadow(player.position):
+            reduced_range = max(1, vision_range // 2)
+            visible &= ~beyond_adjacent | (distance_sq <= reduced_range * reduced_range)
+        if not player.can_see_through_walls():
+            visible &= self.game_map.visible[self.enemy_x, self.enemy_y]
+        return visible
+    
+    def get_player_sightings(self) -> np.ndarray:
+        """Get Enemy.can_see_player for every enemy at once, as a bool array in list order.
+        
+        Relies on the field of view computed by update_fov.
+        """
+        player = self.player
+        if player.is_invisible():
+            return np.zeros(len(self.enemies), dtype=np.bool_)
+        
+        dx = self.enemy_x - player.x
+        dy = self.enemy_y - player.y
+        distance_sq = dx * dx + dy * dy
+        beyond_adjacent = distance_sq > 1
+        
+        sees = (distance_sq <= self.enemy_vision * self.enemy_vision) & (self.enemy_disabled == 0)
+        # A player in shadow is only seen from adjacent cells
+        if self.game_map.is_shadow(player.position):
+            sees &= ~beyond_adjacent
+        # Enemies in shadow see non-adjacent cells only within half range
+        shadow_range = np.maximum(1, self.enemy_vision // 2)
+        sees &= ~(beyond_adjacent & (distance_sq > shadow_range * shadow_range) &
+                  self.game_map.shadows[self.enemy_x, self.enemy_y])
+        # Field of view is computed from the player and is symmetric
+        sees &= self.game_map.visible[self.enemy_x, self.enemy_y]
+        return sees
+    
+    def get_enemies_in_range(self, center: Position, radius: float, include_disabled: bool = True) -> List[Enemy]:
+        """Get enemies within Euclidean distance of center, in list order."""
+        dx = self.enemy_x - center.x
+        dy = self.enemy_y - center.y
+        mask = dx * dx + dy * dy <= radius * radius
+        if not include_disabled:
+            mask &= self.enemy_disabled == 0
+        return [self.enemies[index] for index in np.flatnonzero(mask)]
     
     def _create_border_walls(self):
         """Create walls around the map border."""
-        for x in range(GameConfig.MAP_WIDTH):
-            self.game_map.walls.add((x, 0))
-            self.game_map.walls.add((x, GameConfig.MAP_HEIGHT - 1))
-        for y in range(GameConfig.MAP_HEIGHT):
-            self.game_map.walls.add((0, y))
-            self.game_map.walls.add((GameConfig.MAP_WIDTH - 1, y))
+        self.game_map.add_wall_rect(0, 0, GameConfig.MAP_WIDTH, 1)
+        self.game_map.add_wall_rect(0, GameConfig.MAP_HEIGHT - 1, GameConfig.MAP_WIDTH, 1)
+        self.game_map.add_wall_rect(0, 0, 1, GameConfig.MAP_HEIGHT)
+        self.game_map.add_wall_rect(GameConfig.MAP_WIDTH - 1, 0, 1, GameConfig.MAP_HEIGHT)
         
+    def update_fov(self):
+        """Bring the field of view up to date with the player position and walls."""
+        self.game_map.update_fov(self.player.position, self.player.get_vision_range())
+    
     def _reset_player_state(self, x: int, y: int):
         """Reset player to starting state."""
         self.player.position = Position(x, y)
@@ -981,6 +1754,7 @@ class Game:
     def process_turn(self):
         """Process one complete game turn."""
         self.turn += 1
+        self.update_fov()
         
         # Update player effects
         self.player.update_effects()
@@ -1020,73 +1794,77 @@ class Game:
         vision_range = self.player.get_vision_range()
         
         # Update explored tiles
-        for dx in range(-vision_range, vision_range + 1):
-            for dy in range(-vision_range, vision_range + 1):
-                if dx*dx + dy*dy <= vision_range*vision_range:
-                    x = self.player.x + dx
-                    y = self.player.y + dy
-                    world_pos = Position(x, y)
-                    
-                    if (world_pos.is_valid(GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT) and
-                        (self.player.can_see_through_walls() or 
-                         self.game_map.has_line_of_sight(self.player.position, world_pos))):
-                        self.game_map.explored_tiles.add((x, y))
+        stencil = get_vision_stencil(vision_range)
+        xs = self.player.x + stencil[:, 0]
+        ys = self.player.y + stencil[:, 1]
+        inside = (xs >= 0) & (xs < GameConfig.MAP_WIDTH) & (ys >= 0) & (ys < GameConfig.MAP_HEIGHT)
+        xs, ys = xs[inside], ys[inside]
+        if not self.player.can_see_through_walls():
+            seen = self.game_map.visible[xs, ys]
+            xs, ys = xs[seen], ys[seen]
+        self.game_map.explored[xs, ys] = True
         
         # Update last known enemy positions
-        for enemy in self.enemies:
-            if self.player.can_see_enemy(enemy, self.game_map):
-                self.game_map.last_known_enemy_positions[enemy.id] = (enemy.position, self.turn)
+        for index in np.flatnonzero(self.get_enemy_visibility()):
+            enemy = self.enemies[index]
+            self.game_map.last_known_enemy_positions[enemy.id] = (enemy.position, self.turn)
 
     def _process_special_tiles(self):
         """Process effects of special tiles at player position."""
         player_pos = (self.player.x, self.player.y)
+        # One packed lookup answers every tile check below
+        flags = self.game_map.get_flags(*player_pos)
         
         # Cooling node
-        if self.game_map.is_cooling_node(self.player.position):
+        if flags & TileFlags.COOLING_NODE:
             old_heat = self.player.heat
             self.player.heat = max(0, self.player.heat - 20)
             if old_heat > self.player.heat:
                 self.message_log.add_message(f"Cooling node: -{old_heat - self.player.heat}°C")
         
         # CPU recovery node
-        if self.game_map.is_cpu_recovery_node(self.player.position):
+        if flags & TileFlags.CPU_RECOVERY_NODE:
             recovery = min(20, self.player.max_cpu - self.player.cpu)
             self.player.cpu += recovery
             if recovery > 0:
                 self.message_log.add_message(f"CPU recovery: +{recovery}")
         
         # Data patch
-        if player_pos in self.game_map.data_patches:
-            patch = self.game_map.data_patches[player_pos]
+        if flags & TileFlags.DATA_PATCH:
+            patch = self.game_map.remove_data_patch(*player_pos)
             self.player.inventory_manager.add_item(patch)
             self.message_log.add_message(f"Found {patch.name}")
-            del self.game_map.data_patches[player_pos]
         
         # Exploit pickup
-        if player_pos in self.game_map.exploit_pickups:
-            exploit_item = self.game_map.exploit_pickups[player_pos]
+        if flags & TileFlags.EXPLOIT_PICKUP:
+            exploit_item = self.game_map.remove_exploit_pickup(*player_pos)
             self.player.inventory_manager.add_item(exploit_item)
             self.message_log.add_message(f"Found {exploit_item.name}")
-            del self.game_map.exploit_pickups[player_pos]
     
     def _update_enemies(self):
         """Update all enemy states and actions."""
         self._update_enemy_awareness()
-        self._move_enemies()
-        self._process_enemy_attacks()
+        moved = self._move_enemies()
+        self._process_enemy_attacks(moved)
     
     def _update_enemy_awareness(self):
         """Update enemy awareness states."""
-        for enemy in self.enemies[:]:
-            old_state = enemy.state
-            
-            if enemy.can_see_player(self.player, self.game_map):
-                self._handle_enemy_sees_player(enemy)
+        # Neither the player nor any enemy moves during this pass, so sightings are decided up front
+        sightings = self.get_player_sightings().tolist()
+        player_seen_at = Position(self.player.x, self.player.y)
+        detection_gain = 0
+        
+        for enemy, sees_player in zip(self.enemies[:], sightings):
+            if sees_player:
+                detection_gain += self._handle_enemy_sees_player(enemy, player_seen_at)
             else:
                 self._handle_enemy_loses_player(enemy)
+        
+        if detection_gain:
+            self.player.detection = min(100, self.player.detection + detection_gain)
     
-    def _handle_enemy_sees_player(self, enemy: Enemy):
-        """Handle when enemy sees the player."""
+    def _handle_enemy_sees_player(self, enemy: Enemy, player_seen_at: Position) -> int:
+        """Handle when enemy sees the player. Returns the detection increase."""
         if enemy.state == EnemyState.UNAWARE:
             enemy.state = EnemyState.ALERT
             enemy.alert_timer = 1
@@ -1095,16 +1873,15 @@ class Game:
             enemy.alert_timer -= 1
             if enemy.alert_timer <= 0:
                 enemy.state = EnemyState.HOSTILE
-                enemy.last_seen_player = Position(self.player.x, self.player.y)
-                detection_increase = 15 if enemy.type == 'admin' else 10
-                self.player.detection = min(100, self.player.detection + detection_increase)
+                enemy.last_seen_player = player_seen_at
                 self.message_log.add_message(f"{enemy.type_data.name} detected you!")
                 # Alert nearby enemies when this enemy becomes hostile
-                self._alert_nearby_enemies(enemy)
+                self._alert_nearby_enemies(enemy, player_seen_at)
+                return 15 if enemy.type == 'admin' else 10
         elif enemy.state == EnemyState.HOSTILE:
-            enemy.last_seen_player = Position(self.player.x, self.player.y)
-            detection_increase = 3 if enemy.type == 'admin' else 1
-            self.player.detection = min(100, self.player.detection + detection_increase)
+            enemy.last_seen_player = player_seen_at
+            return 3 if enemy.type == 'admin' else 1
+        return 0
     
     def _handle_enemy_loses_player(self, enemy: Enemy):
         """Handle when enemy loses sight of player."""
@@ -1123,56 +1900,50 @@ class Game:
                     enemy.last_seen_player = None
                     self.message_log.add_message(f"{enemy.type_data.name} lost track")
     
-    def _alert_nearby_enemies(self, alerting_enemy: Enemy):
+    def _alert_nearby_enemies(self, alerting_enemy: Enemy, player_seen_at: Position):
         """Alert nearby enemies when one becomes hostile."""
         alert_range = 8
         alerted_count = 0
         
-        for enemy in self.enemies:
-            if enemy is alerting_enemy or enemy.state == EnemyState.HOSTILE:
+        # The range query rejects distant enemies in one array pass
+        for enemy in self.get_enemies_in_range(alerting_enemy.position, alert_range):
+            if enemy is alerting_enemy:
                 continue
-                
-            distance = enemy.position.distance_to(alerting_enemy.position)
-            if distance <= alert_range:
-                if enemy.state == EnemyState.UNAWARE:
-                    enemy.state = EnemyState.ALERT
-                    enemy.alert_timer = 3
-                    enemy.last_seen_player = Position(self.player.x, self.player.y)
-                    alerted_count += 1
-                elif enemy.state == EnemyState.ALERT:
-                    enemy.alert_timer = max(enemy.alert_timer, 3)
-                    enemy.last_seen_player = Position(self.player.x, self.player.y)
-                    alerted_count += 1
+            
+            if enemy.state == EnemyState.UNAWARE:
+                enemy.state = EnemyState.ALERT
+                enemy.alert_timer = 3
+                enemy.last_seen_player = player_seen_at
+                alerted_count += 1
+            elif enemy.state == EnemyState.ALERT:
+                enemy.alert_timer = max(enemy.alert_timer, 3)
+                enemy.last_seen_player = player_seen_at
+                alerted_count += 1
         
         if alerted_count > 0:
             self.message_log.add_message(f"{alerted_count} enemies alerted nearby!")
     
-    def _move_enemies(self):
-        """Move all enemies according to their AI."""
-        for enemy in self.enemies:
-            # Only mark as moved if enemy actually moved
-            did_move = enemy.move(self.game_map, self.player, self)
-            enemy.has_moved_this_turn = did_move
+    def _move_enemies(self) -> np.ndarray:
+        """Move all enemies according to their AI. Returns whether each one actually moved, in list order."""
+        return np.array([enemy.move(self.game_map, self.player, self) for enemy in self.enemies], dtype=np.bool_)
     
-    def _process_enemy_attacks(self):
+    def _process_enemy_attacks(self, moved: np.ndarray):
         """Process attacks from enemies adjacent to player."""
-        for enemy in self.enemies[:]:
-            # Only attack if enemy hasn't moved this turn (move OR attack, not both)
-            if enemy.can_attack_player(self.player) and not getattr(enemy, 'has_moved_this_turn', False):
+        # Only enemies in the 3x3 block around the player that haven't moved this turn
+        # can attack (move OR attack, not both)
+        near = ((np.abs(self.enemy_x - self.player.x) <= 1) &
+                (np.abs(self.enemy_y - self.player.y) <= 1) & ~moved)
+        for enemy in [self.enemies[index] for index in np.flatnonzero(near)]:
+            if enemy.can_attack_player(self.player):
                 damage = enemy.attack_player(self.player)
                 self.message_log.add_message(f"{enemy.type_data.name} attacks: {damage} CPU damage")
                 if self.player.cpu <= 0:
                     self.message_log.add_message("CRITICAL SYSTEM FAILURE!")
-        
-        # Reset movement flags for next turn
-        for enemy in self.enemies:
-            enemy.has_moved_this_turn = False
     
     def _check_admin_spawn(self):
         """Check if admin avatar should spawn."""
-        if (self.player.detection >= GameConfig.ADMIN_SPAWN_THRESHOLD and 
-            not self.admin_spawned and 
-            not any(e.type == 'admin' for e in self.enemies)):
+        # Admins only enter through _spawn_admin_avatar, so the flag alone says whether one is on this level
+        if not self.admin_spawned and self.player.detection >= GameConfig.ADMIN_SPAWN_THRESHOLD:
             self._spawn_admin_avatar()
     
     def _spawn_admin_avatar(self):
@@ -1185,46 +1956,37 @@ class Game:
             admin = Enemy(spawn_position, 'admin')
             admin.state = EnemyState.HOSTILE
             admin.last_seen_player = Position(self.player.x, self.player.y)
-            self.enemies.append(admin)
+            self._add_enemy(admin)
             self.admin_spawned = True
             self.message_log.add_message("*** ADMIN AVATAR SPAWNED! ***")
     
     def _find_admin_spawn_position(self) -> Optional[Position]:
         """Find a suitable spawn position for admin avatar near player and visible."""
         player_vision = self.player.get_vision_range()
+        game_map = self.game_map
         
-        # Try to spawn within player's vision range (5-10 tiles away for dramatic effect)
-        for _ in range(100):
-            # Generate position within player's vision range but not too close
-            distance = random.randint(5, min(10, player_vision))
-            angle = random.uniform(0, 2 * 3.14159)  # Random angle in radians
-            
-            x = int(self.player.x + distance * math.cos(angle))
-            y = int(self.player.y + distance * math.sin(angle))
-            position = Position(x, y)
-            
-            if (self.game_map.is_valid_position(position) and
-                position.distance_to(self.player.position) >= 5 and  # Not too close to player
-                position.distance_to(self.player.position) <= player_vision and  # Within sight
-                self.game_map.has_line_of_sight(self.player.position, position) and  # Actually visible
-                not self._get_enemy_at(position) and
-                (x, y) not in self.game_map.data_patches and
-                (x, y) not in self.game_map.cooling_nodes and
-                (x, y) not in self.game_map.cpu_recovery_nodes):
-                return position
-        
-        # Fallback: try positions just within vision range if ideal spots don't work
-        for _ in range(50):
-            distance = player_vision - 1  # Just within vision
-            angle = random.uniform(0, 2 * 3.14159)
-            
-            x = int(self.player.x + distance * math.cos(angle))
-            y = int(self.player.y + distance * math.sin(angle))
-            position = Position(x, y)
-            
-            if (self.game_map.is_valid_position(position) and
-                not self._get_enemy_at(position)):
-                return position
+        dx = np.arange(game_map.width)[:, np.newaxis] - self.player.x
+        dy = np.arange(game_map.height)[np.newaxis, :] - self.player.y
+        distance_sq = dx * dx + dy * dy
+        
+        open_cells = ~game_map.walls
+        open_cells[self.enemy_x, self.enemy_y] = False
+        
+        # Spawn within player's vision range (5-10 tiles away for dramatic effect)
+        max_distance = min(10, player_vision)
+        candidates = (open_cells & game_map.visible &
+                      (distance_sq >= 5 * 5) & (distance_sq <= max_distance * max_distance) &
+                      ((game_map.tile_flags & (TileFlags.DATA_PATCH | TileFlags.NODE)) == 0))
+        
+        # Fallback: positions just within vision range if ideal spots don't work
+        if not candidates.any():
+            edge = player_vision - 1
+            candidates = open_cells & (distance_sq > (edge - 1) * (edge - 1)) & (distance_sq <= edge * edge)
+        
+        cells = np.argwhere(candidates)
+        if len(cells):
+            x, y = cells[random.randrange(len(cells))].tolist()
+            return Position(x, y)
         
         # Last resort fallback position
         fallback = Position(GameConfig.MAP_WIDTH - 10, GameConfig.MAP_HEIGHT - 10)
@@ -1245,12 +2007,10 @@ class Game:
             self.player.speed_moves_remaining = 0
         
         # Check for enemy at target position first
-        new_position = Position(
-            max(0, min(GameConfig.MAP_WIDTH - 1, self.player.x + dx)),
-            max(0, min(GameConfig.MAP_HEIGHT - 1, self.player.y + dy))
-        )
+        target_x = max(0, min(GameConfig.MAP_WIDTH - 1, self.player.x + dx))
+        target_y = max(0, min(GameConfig.MAP_HEIGHT - 1, self.player.y + dy))
         
-        target_enemy = self._get_enemy_at(new_position)
+        target_enemy = self.enemy_by_pos.get((target_x, target_y))
         if target_enemy:
             # Bump attack the enemy
             self._perform_bump_attack(target_enemy)
@@ -1258,8 +2018,7 @@ class Game:
             # Try to move player
             if self.player.move(dx, dy, self.game_map):
                 # Check for gateway
-                if (self.game_map.gateway and 
-                    self.player.position.distance_to(self.game_map.gateway) == 0):
+                if self.game_map.gateway and self.player.position == self.game_map.gateway:
                     self.message_log.add_message("Gateway reached! Next network...")
                     self.next_level()
                     return
@@ -1312,7 +2071,7 @@ class Game:
         # Apply damage
         if target_enemy.take_damage(total_damage):
             # Enemy destroyed
-            self.enemies.remove(target_enemy)
+            self._remove_enemy(target_enemy)
             self.player.cpu = min(self.player.max_cpu, self.player.cpu + 5)  # Small CPU recovery
             self.message_log.add_message(f"Eliminated {target_enemy.type_data.name} (+5 CPU)")
         else:
@@ -1340,10 +2099,7 @@ class Game:
     
     def _get_enemy_at(self, position: Position) -> Optional[Enemy]:
         """Get enemy at specified position."""
-        for enemy in self.enemies:
-            if enemy.position.distance_to(position) == 0:
-                return enemy
-        return None
+        return self.enemy_by_pos.get((position.x, position.y))
     
     def next_level(self):
         """Progress to the next level."""
@@ -1373,6 +2129,7 @@ class Game:
         # Set deterministic seed for this level
         level_seed = self.dungeon_seed + self.level * 12345
         random.seed(level_seed)
+        self.level_rng = np.random.default_rng(level_seed)
         
         try:
             self._clear_map()
@@ -1411,6 +2168,10 @@ class Game:
         max_rooms = min(num_rooms, 20)  # Cap at 20 rooms
         attempts = 0
         max_attempts = 400  # More attempts for better placement
+        gap_fill_attempts = 30
+        
+        # Placed room bounds as rows of x, y, x + w, y + h, so overlap tests cover all rooms at once
+        bounds = np.empty((4, max_rooms + gap_fill_attempts), dtype=np.int32)
         
         while len(rooms) < max_rooms and attempts < max_attempts:
             attempts += 1
@@ -1434,58 +2195,52 @@ class Game:
             y = random.randint(3, GameConfig.MAP_HEIGHT - h - 3)
             
             # Check for overlap with reduced buffer for tighter packing
-            if self._is_room_valid(x, y, w, h, rooms):
+            if self._is_room_valid(x, y, w, h, bounds[:, :len(rooms)]):
                 self._create_room(x, y, w, h)
+                bounds[:, len(rooms)] = (x, y, x + w, y + h)
                 rooms.append((x, y, w, h))
         
         # Try to fill gaps with smaller rooms
-        for _ in range(30):  # Extra attempts to fill space
+        for _ in range(gap_fill_attempts):  # Extra attempts to fill space
             w = random.randint(2, 4)
             h = random.randint(2, 4)
             x = random.randint(3, GameConfig.MAP_WIDTH - w - 3)
             y = random.randint(3, GameConfig.MAP_HEIGHT - h - 3)
             
-            if self._is_room_valid(x, y, w, h, rooms):
+            if self._is_room_valid(x, y, w, h, bounds[:, :len(rooms)]):
                 self._create_room(x, y, w, h)
+                bounds[:, len(rooms)] = (x, y, x + w, y + h)
                 rooms.append((x, y, w, h))
         
         return rooms
     
-    def _is_room_valid(self, x: int, y: int, w: int, h: int, 
-                      existing_rooms: List[Tuple[int, int, int, int]]) -> bool:
-        """Check if room placement is valid with tighter packing."""
-        # Check overlap with existing rooms (reduced buffer for tighter packing)
-        for rx, ry, rw, rh in existing_rooms:
-            if not (x + w <= rx or x >= rx + rw or y + h <= ry or y >= ry + rh):
-                return False
+    def _is_room_valid(self, x: int, y: int, w: int, h: int, existing_bounds: np.ndarray) -> bool:
+        """Check if room placement is valid with tighter packing.
+        
+        existing_bounds holds one column of x, y, x + w, y + h per placed room.
+        """
+        x2, y2 = x + w, y + h
         
-        # Keep spawn area clear
+        # Keep spawn area clear (constant-time checks come before the room scan)
         if x < 8 and y < 8:
             return False
         
         # Ensure room is within bounds
-        if x + w >= GameConfig.MAP_WIDTH - 1 or y + h >= GameConfig.MAP_HEIGHT - 1:
+        if x2 >= GameConfig.MAP_WIDTH - 1 or y2 >= GameConfig.MAP_HEIGHT - 1:
             return False
         
-        return True
+        # Check overlap with existing rooms (reduced buffer for tighter packing)
+        room_x, room_y, room_x2, room_y2 = existing_bounds
+        # Separated on either axis means no overlap
+        separated = (x2 <= room_x) | (x >= room_x2) | (y2 <= room_y) | (y >= room_y2)
+        return bool(separated.all())
     
     def _create_room(self, x: int, y: int, width: int, height: int):
         """Create a rectangular room."""
-        for i in range(width):
-            wall_x = x + i
-            if 0 <= wall_x < GameConfig.MAP_WIDTH:
-                if 0 <= y < GameConfig.MAP_HEIGHT:
-                    self.game_map.walls.add((wall_x, y))
-                if 0 <= y + height - 1 < GameConfig.MAP_HEIGHT:
-                    self.game_map.walls.add((wall_x, y + height - 1))
-        
-        for i in range(height):
-            wall_y = y + i
-            if 0 <= wall_y < GameConfig.MAP_HEIGHT:
-                if 0 <= x < GameConfig.MAP_WIDTH:
-                    self.game_map.walls.add((x, wall_y))
-                if 0 <= x + width - 1 < GameConfig.MAP_WIDTH:
-                    self.game_map.walls.add((x + width - 1, wall_y))
+        self.game_map.add_wall_rect(x, y, width, 1)
+        self.game_map.add_wall_rect(x, y + height - 1, width, 1)
+        self.game_map.add_wall_rect(x, y, 1, height)
+        self.game_map.add_wall_rect(x + width - 1, y, 1, height)
     
     def _connect_rooms(self, rooms: List[Tuple[int, int, int, int]]):
         """Connect rooms using MST approach for better connectivity."""
@@ -1493,32 +2248,9 @@ class Game:
             return
         
         # MST-based connection like dungeon-gen-v3
-        connected = [rooms[0]]
-        unconnected = rooms[1:].copy()
-        
-        while unconnected:
-            # Find closest pair between connected and unconnected
-            min_dist = float('inf')
-            closest_pair = None
-            
-            for conn_room in connected:
-                cx = conn_room[0] + conn_room[2] // 2
-                cy = conn_room[1] + conn_room[3] // 2
-                
-                for i, unconn_room in enumerate(unconnected):
-                    ux = unconn_room[0] + unconn_room[2] // 2
-                    uy = unconn_room[1] + unconn_room[3] // 2
-                    
-                    dist = abs(cx - ux) + abs(cy - uy)
-                    if dist < min_dist:
-                        min_dist = dist
-                        closest_pair = (conn_room, unconn_room, i)
-            
-            if closest_pair:
-                room1, room2, idx = closest_pair
-                self._create_corridor_between_rooms(room1, room2)
-                connected.append(room2)
-                unconnected.pop(idx)
+        centers = np.array([(x + w // 2, y + h // 2) for x, y, w, h in rooms], dtype=np.int64)
+        for from_index, to_index in room_connections(centers[:, 0], centers[:, 1]).tolist():
+            self._create_corridor_between_rooms(rooms[from_index], rooms[to_index])
         
         # Add extra connections for multiple paths (good for stealth)
         self._add_extra_connections(rooms)
@@ -1545,17 +2277,18 @@ class Game:
     
     def _carve_h_corridor(self, x1: int, x2: int, y: int, width: int):
         """Carve a horizontal corridor."""
-        for x in range(min(x1, x2), max(x1, x2) + 1):
-            for dy in range(width):
-                if 1 <= y + dy < GameConfig.MAP_HEIGHT - 1 and 1 <= x < GameConfig.MAP_WIDTH - 1:
-                    self.game_map.walls.discard((x, y + dy))
+        self._carve_interior(min(x1, x2), y, abs(x2 - x1) + 1, width)
     
     def _carve_v_corridor(self, y1: int, y2: int, x: int, width: int):
         """Carve a vertical corridor."""
-        for y in range(min(y1, y2), max(y1, y2) + 1):
-            for dx in range(width):
-                if 1 <= y < GameConfig.MAP_HEIGHT - 1 and 1 <= x + dx < GameConfig.MAP_WIDTH - 1:
-                    self.game_map.walls.discard((x + dx, y))
+        self._carve_interior(x, min(y1, y2), width, abs(y2 - y1) + 1)
+    
+    def _carve_interior(self, x: int, y: int, width: int, height: int):
+        """Clear walls from a rectangle, leaving the map border intact."""
+        left, top = max(1, x), max(1, y)
+        right = min(GameConfig.MAP_WIDTH - 1, x + width)
+        bottom = min(GameConfig.MAP_HEIGHT - 1, y + height)
+        self.game_map.remove_wall_rect(left, top, right - left, bottom - top)
     
     def _add_extra_connections(self, rooms: List[Tuple[int, int, int, int]]):
         """Add extra corridors for multiple paths (good for stealth)."""
@@ -1573,300 +2306,209 @@ class Game:
     
     def _add_cover_elements(self):
         """Add small wall segments in larger open areas for cover."""
-        for y in range(5, GameConfig.MAP_HEIGHT - 5, 6):
-            for x in range(5, GameConfig.MAP_WIDTH - 5, 6):
-                # Check if area is mostly open
-                open_count = 0
-                for dy in range(-3, 4):
-                    for dx in range(-3, 4):
-                        check_y, check_x = y + dy, x + dx
-                        if (0 <= check_y < GameConfig.MAP_HEIGHT and 
-                            0 <= check_x < GameConfig.MAP_WIDTH):
-                            if (check_x, check_y) not in self.game_map.walls:
-                                open_count += 1
-                
-                # If area is very open, maybe add a small cover element
-                if open_count > 35 and random.random() < 0.25:
-                    # Add small L-shaped or straight cover
+        # Open cells in the 7x7 window around every cell, indexed by the window's corner.
+        # Windows around the sample points never reach cover added at earlier points,
+        # so counting them all up front matches counting as we go.
+        open_counts = np.lib.stride_tricks.sliding_window_view(~self.game_map.walls, (7, 7)).sum(axis=(2, 3))
+        
+        # Sample every 6th cell from (5, 5), row by row; cover there stays clear of the border walls
+        sample_counts = open_counts[2:GameConfig.MAP_WIDTH - 8:6, 2:GameConfig.MAP_HEIGHT - 8:6]
+        rows, columns = np.nonzero(sample_counts.T > 35)  # Only very open areas may get cover
+        
+        for x, y in zip((5 + 6 * columns).tolist(), (5 + 6 * rows).tolist()):
+            if random.random() < 0.25:
+                # Add small L-shaped or straight cover
+                if random.random() < 0.5:
+                    # Straight cover
                     if random.random() < 0.5:
-                        # Straight cover
-                        if random.random() < 0.5:
-                            for dx in range(2):
-                                if x + dx < GameConfig.MAP_WIDTH - 1:
-                                    self.game_map.walls.add((x + dx, y))
-                        else:
-                            for dy in range(2):
-                                if y + dy < GameConfig.MAP_HEIGHT - 1:
-                                    self.game_map.walls.add((x, y + dy))
+                        self.game_map.add_wall_rect(x, y, 2, 1)
                     else:
-                        # L-shaped cover
-                        self.game_map.walls.add((x, y))
-                        if random.random() < 0.5:
-                            if x + 1 < GameConfig.MAP_WIDTH - 1:
-                                self.game_map.walls.add((x + 1, y))
-                            if y + 1 < GameConfig.MAP_HEIGHT - 1:
-                                self.game_map.walls.add((x, y + 1))
+                        self.game_map.add_wall_rect(x, y, 1, 2)
+                else:
+                    # L-shaped cover
+                    self.game_map.add_wall(x, y)
+                    if random.random() < 0.5:
+                        self.game_map.add_wall(x + 1, y)
+                        self.game_map.add_wall(x, y + 1)
     
     def _create_corridor(self, x1: int, y1: int, x2: int, y2: int):
         """Create a corridor between two points."""
-        for x in range(min(x1, x2), max(x1, x2) + 1):
-            if 0 <= x < GameConfig.MAP_WIDTH and 0 <= y1 < GameConfig.MAP_HEIGHT:
-                self.game_map.walls.discard((x, y1))
-        for y in range(min(y1, y2), max(y1, y2) + 1):
-            if 0 <= x2 < GameConfig.MAP_WIDTH and 0 <= y < GameConfig.MAP_HEIGHT:
-                self.game_map.walls.discard((x2, y))
+        self.game_map.remove_wall_rect(min(x1, x2), y1, abs(x2 - x1) + 1, 1)
+        self.game_map.remove_wall_rect(x2, min(y1, y2), 1, abs(y2 - y1) + 1)
     
     def _generate_shadows(self, coverage: float):
         """Generate strategic shadow areas for better stealth gameplay."""
+        rng = self.level_rng
+        
         # Adjust shadow cluster count based on coverage
         base_clusters = 8 if coverage < 0.25 else 12
-        shadow_clusters = random.randint(base_clusters, base_clusters + 4)
+        shadow_clusters = int(rng.integers(base_clusters, base_clusters + 4, endpoint=True))
         
-        # Create larger, more connected shadow areas
-        for _ in range(shadow_clusters):
-            center_x = random.randint(8, GameConfig.MAP_WIDTH - 8)
-            center_y = random.randint(8, GameConfig.MAP_HEIGHT - 8)
-            
-            # Smaller shadow clusters for lower coverage
-            cluster_size = random.randint(10, 25) if coverage < 0.25 else random.randint(15, 35)
-            
-            # Create more organic shadow shapes
-            shadow_shape = random.choice(['circular', 'linear', 'L-shaped'])
-            
+        # Create larger, more connected shadow areas with more organic shapes
+        centers_x = rng.integers(8, GameConfig.MAP_WIDTH - 8, size=shadow_clusters, endpoint=True).tolist()
+        centers_y = rng.integers(8, GameConfig.MAP_HEIGHT - 8, size=shadow_clusters, endpoint=True).tolist()
+        shapes = rng.choice(['circular', 'linear', 'L-shaped'], size=shadow_clusters).tolist()
+        
+        for center_x, center_y, shadow_shape in zip(centers_x, centers_y, shapes):
             if shadow_shape == 'circular':
                 # Circular shadow area
-                radius = random.randint(3, 6)
-                for dx in range(-radius, radius + 1):
-                    for dy in range(-radius, radius + 1):
-                        if dx*dx + dy*dy <= radius*radius:
-                            x, y = center_x + dx, center_y + dy
-                            position = Position(x, y)
-                            if (position.is_valid(GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT) and
-                                not self.game_map.is_wall(position)):
-                                self.game_map.shadows.add((x, y))
+                radius = int(rng.integers(3, 6, endpoint=True))
+                self.game_map.add_shadow_disc(center_x, center_y, radius)
             
             elif shadow_shape == 'linear':
                 # Linear shadow corridor
-                if random.random() < 0.5:
+                length, width = rng.integers([8, 2], [15, 4], endpoint=True).tolist()
+                if rng.random() < 0.5:
                     # Horizontal corridor
-                    length = random.randint(8, 15)
-                    width = random.randint(2, 4)
-                    for dx in range(length):
-                        for dy in range(width):
-                            x, y = center_x + dx - length//2, center_y + dy - width//2
-                            position = Position(x, y)
-                            if (position.is_valid(GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT) and
-                                not self.game_map.is_wall(position)):
-                                self.game_map.shadows.add((x, y))
+                    self.game_map.add_shadow_rect(center_x - length//2, center_y - width//2, length, width)
                 else:
                     # Vertical corridor
-                    length = random.randint(8, 15)
-                    width = random.randint(2, 4)
-                    for dx in range(width):
-                        for dy in range(length):
-                            x, y = center_x + dx - width//2, center_y + dy - length//2
-                            position = Position(x, y)
-                            if (position.is_valid(GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT) and
-                                not self.game_map.is_wall(position)):
-                                self.game_map.shadows.add((x, y))
+                    self.game_map.add_shadow_rect(center_x - width//2, center_y - length//2, width, length)
             
             else:  # L-shaped
                 # L-shaped shadow area for complex stealth gameplay
-                arm1_length = random.randint(5, 10)
-                arm2_length = random.randint(5, 10)
-                arm_width = random.randint(2, 3)
+                arm1_length, arm2_length, arm_width = rng.integers([5, 5, 2], [10, 10, 3], endpoint=True).tolist()
                 
                 # Horizontal arm
-                for dx in range(arm1_length):
-                    for dy in range(arm_width):
-                        x, y = center_x + dx, center_y + dy
-                        position = Position(x, y)
-                        if (position.is_valid(GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT) and
-                            not self.game_map.is_wall(position)):
-                            self.game_map.shadows.add((x, y))
+                self.game_map.add_shadow_rect(center_x, center_y, arm1_length, arm_width)
                 
                 # Vertical arm
-                for dx in range(arm_width):
-                    for dy in range(arm2_length):
-                        x, y = center_x + dx, center_y + dy
-                        position = Position(x, y)
-                        if (position.is_valid(GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT) and
-                            not self.game_map.is_wall(position)):
-                            self.game_map.shadows.add((x, y))
+                self.game_map.add_shadow_rect(center_x, center_y, arm_width, arm2_length)
         
         # Add some additional scattered shadow spots for tactical hiding (fewer for lower coverage)
-        scattered_shadows = random.randint(10, 20) if coverage < 0.25 else random.randint(20, 40)
-        for _ in range(scattered_shadows):
-            x = random.randint(3, GameConfig.MAP_WIDTH - 3)
-            y = random.randint(3, GameConfig.MAP_HEIGHT - 3)
-            position = Position(x, y)
-            if (position.is_valid(GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT) and
-                not self.game_map.is_wall(position)):
-                # Create small 2x2 shadow patches
-                for dx in range(2):
-                    for dy in range(2):
-                        shadow_pos = Position(x + dx, y + dy)
-                        if (shadow_pos.is_valid(GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT) and
-                            not self.game_map.is_wall(shadow_pos)):
-                            self.game_map.shadows.add((x + dx, y + dy))
+        scattered_shadows = int(rng.integers(10, 20, endpoint=True) if coverage < 0.25 else
+                                rng.integers(20, 40, endpoint=True))
+        xs = rng.integers(3, GameConfig.MAP_WIDTH - 3, size=scattered_shadows, endpoint=True)
+        ys = rng.integers(3, GameConfig.MAP_HEIGHT - 3, size=scattered_shadows, endpoint=True)
+        open_spots = ~self.game_map.walls[xs, ys]
+        
+        # Grow each open spot into a small 2x2 shadow patch
+        patches = np.zeros_like(self.game_map.walls)
+        patches[xs[open_spots], ys[open_spots]] = True
+        patches[1:, :] |= patches[:-1, :].copy()
+        patches[:, 1:] |= patches[:, :-1].copy()
+        self.game_map.add_shadow_mask(patches)
     
     def _place_special_nodes(self):
         """Place cooling and CPU recovery nodes."""
         node_count = 8 + self.level * 2  # More nodes for better gameplay (was 4 + level)
-        placed_nodes = 0
-        attempts = 0
+        valid = self._placement_mask(TileFlags.WALL | TileFlags.NODE, 'node')
         
-        while placed_nodes < node_count and attempts < 100:
-            attempts += 1
-            x = random.randint(5, GameConfig.MAP_WIDTH - 5)
-            y = random.randint(5, GameConfig.MAP_HEIGHT - 5)
-            position = Position(x, y)
-            
-            if self._is_valid_special_placement(position):
-                if random.choice([True, False]):
-                    self.game_map.cooling_nodes.add((x, y))
-                else:
-                    self.game_map.cpu_recovery_nodes.add((x, y))
-                placed_nodes += 1
+        for x, y, node_kind in self._placement_sites(5, valid, node_count, 2):
+            if node_kind == 0:
+                self.game_map.add_cooling_node(x, y)
+            else:
+                self.game_map.add_cpu_recovery_node(x, y)
     
     def _place_data_patches(self):
         """Place data patches throughout the level."""
         patch_count = 12 + self.level * 4  # Much more data patches (was 6 + level * 2)
-        placed_patches = 0
-        attempts = 0
+        colors = list(self.data_patch_effects.keys())
+        valid = self._placement_mask(TileFlags.OCCUPIED, 'patch')
         
-        while placed_patches < patch_count and attempts < 150:
-            attempts += 1
-            x = random.randint(3, GameConfig.MAP_WIDTH - 3)
-            y = random.randint(3, GameConfig.MAP_HEIGHT - 3)
-            position = Position(x, y)
-            
-            if self._is_valid_patch_placement(position):
-                color = random.choice(list(self.data_patch_effects.keys()))
-                effect, desc = self.data_patch_effects[color]
-                patch = DataPatch(color, effect, f"{color.title()} Data Patch", desc)
-                self.game_map.data_patches[(x, y)] = patch
-                placed_patches += 1
+        for x, y, color_index in self._placement_sites(3, valid, patch_count, len(colors)):
+            color = colors[color_index]
+            effect, desc = self.data_patch_effects[color]
+            patch = DataPatch(color, effect, f"{color.title()} Data Patch", desc)
+            self.game_map.add_data_patch(x, y, patch)
     
     def _place_exploit_pickups(self):
         """Place random exploit pickups throughout the level."""
         exploit_count = 5 + self.level * 2  # Much more exploits (was 2 + max(0, level - 1))
-        placed_exploits = 0
-        attempts = 0
         
         # Get list of available exploits (excluding ones player starts with)
         available_exploits = list(GameData.EXPLOITS.keys())
+        # Same rules as data patches, without landing on a pickup left from an earlier level
+        valid = self._placement_mask(TileFlags.OCCUPIED | TileFlags.EXPLOIT_PICKUP, 'patch')
         
-        while placed_exploits < exploit_count and attempts < 100:
-            attempts += 1
-            x = random.randint(5, GameConfig.MAP_WIDTH - 5)
-            y = random.randint(5, GameConfig.MAP_HEIGHT - 5)
-            position = Position(x, y)
-            
-            if self._is_valid_patch_placement(position):  # Reuse data patch placement validation
-                # Choose random exploit
-                exploit_key = random.choice(available_exploits)
-                exploit_def = GameData.EXPLOITS[exploit_key]
-                exploit_item = ExploitItem(exploit_key, exploit_def)
-                self.game_map.exploit_pickups[(x, y)] = exploit_item
-                placed_exploits += 1
+        for x, y, exploit_index in self._placement_sites(5, valid, exploit_count, len(available_exploits)):
+            exploit_key = available_exploits[exploit_index]
+            exploit_def = GameData.EXPLOITS[exploit_key]
+            exploit_item = ExploitItem(exploit_key, exploit_def)
+            self.game_map.add_exploit_pickup(x, y, exploit_item)
     
     def _place_enemies(self, enemy_count: int):
         """Place enemies throughout the level."""
         enemy_types = ['scanner', 'patrol', 'bot', 'firewall', 'hunter']
-        enemy_weights = [3, 2, 3, 1, 1]
-        placed_enemies = 0
-        attempts = 0
+        enemy_weights = np.array([3, 2, 3, 1, 1]) / 10
+        valid = self._placement_mask(TileFlags.OCCUPIED, 'enemy') & (self.enemy_grid == 0)
         
-        while placed_enemies < enemy_count and attempts < enemy_count * 20:
-            attempts += 1
-            x = random.randint(8, GameConfig.MAP_WIDTH - 8)
-            y = random.randint(8, GameConfig.MAP_HEIGHT - 8)
-            position = Position(x, y)
+        for x, y, type_index in self._placement_sites(8, valid, enemy_count, len(enemy_types), enemy_weights):
+            enemy_type = enemy_types[type_index]
+            enemy = Enemy(Position(x, y), enemy_type)
             
-            if self._is_valid_enemy_placement(position):
-                enemy_type = random.choices(enemy_types, weights=enemy_weights)[0]
-                enemy = Enemy(position, enemy_type)
-                
-                if enemy_type == 'patrol':
-                    enemy.patrol_points = self._generate_patrol_route(position)
-                
-                self.enemies.append(enemy)
-                placed_enemies += 1
+            if enemy_type == 'patrol':
+                enemy.patrol_points = self._generate_patrol_route(enemy.position)
+                enemy.bake_patrol(self.game_map)
+            
+            self._add_enemy(enemy)
+    
+    def _placement_mask(self, blocked: int, kind: str) -> np.ndarray:
+        """Get the cells free of the blocked TileFlags and clear of spawn for this placement kind."""
+        return ((self.game_map.tile_flags & blocked) == 0) & self.spawn_clear[kind]
+    
+    def _placement_sites(self, margin: int, valid: np.ndarray, count: int, options: int,
+                         weights: Optional[np.ndarray] = None) -> Iterator[Tuple[int, int, int]]:
+        """Draw up to count distinct (x, y, option) sites from the valid cells at least margin from the edge.
+        
+        Sites and options come from the level RNG in one draw each, so no attempt is wasted on a blocked cell.
+        """
+        inner = valid[margin:GameConfig.MAP_WIDTH - margin + 1, margin:GameConfig.MAP_HEIGHT - margin + 1]
+        xs, ys = np.nonzero(inner)
+        picks = self.level_rng.choice(len(xs), size=min(count, len(xs)), replace=False)
+        choices = self.level_rng.choice(options, size=len(picks), p=weights)
+        return zip((xs[picks] + margin).tolist(), (ys[picks] + margin).tolist(), choices.tolist())
     
     def _place_gateway(self, rooms: List[Tuple[int, int, int, int]]):
         """Place the level gateway."""
-        # Try to place in a room first
-        for room_x, room_y, room_w, room_h in rooms:
-            x = room_x + room_w // 2
-            y = room_y + room_h // 2
-            position = Position(x, y)
-            
-            if self._is_valid_gateway_placement(position):
-                self.game_map.gateway = position
-                return
-        
-        # Fallback placement
-        for x in range(GameConfig.MAP_WIDTH - 10, GameConfig.MAP_WIDTH - 5):
-            for y in range(GameConfig.MAP_HEIGHT - 10, GameConfig.MAP_HEIGHT - 5):
-                position = Position(x, y)
-                if self.game_map.is_valid_position(position):
-                    self.game_map.gateway = position
-                    return
-    
-    def _is_valid_special_placement(self, position: Position) -> bool:
-        """Check if position is valid for special node placement."""
-        return (not self.game_map.is_wall(position) and
-                (position.x, position.y) not in self.game_map.cooling_nodes and
-                (position.x, position.y) not in self.game_map.cpu_recovery_nodes and
-                position.distance_to(Position(5, 5)) > 8)
-    
-    def _is_valid_patch_placement(self, position: Position) -> bool:
-        """Check if position is valid for data patch placement."""
-        return (not self.game_map.is_wall(position) and
-                (position.x, position.y) not in self.game_map.data_patches and
-                (position.x, position.y) not in self.game_map.cooling_nodes and
-                (position.x, position.y) not in self.game_map.cpu_recovery_nodes and
-                position.distance_to(Position(5, 5)) > 5)
-    
-    def _is_valid_enemy_placement(self, position: Position) -> bool:
-        """Check if position is valid for enemy placement."""
-        return (self.game_map.is_valid_position(position) and
-                position.distance_to(Position(5, 5)) > 12 and
-                not self._get_enemy_at(position) and
-                (position.x, position.y) not in self.game_map.data_patches and
-                (position.x, position.y) not in self.game_map.cooling_nodes and
-                (position.x, position.y) not in self.game_map.cpu_recovery_nodes)
+        # Try room centers farthest from spawn first, since only far rooms can qualify;
+        # stop at the first valid one
+        room_centers = sorted((Position(room_x + room_w // 2, room_y + room_h // 2)
+                               for room_x, room_y, room_w, room_h in rooms),
+                              key=lambda center: self.spawn_distance_sq[center.x, center.y], reverse=True)
+        gateway = next((position for position in room_centers
+                        if self._is_valid_gateway_placement(position)), None)
+        
+        # Fallback placement: first open cell near the far corner
+        if gateway is None:
+            gateway = next((Position(x, y)
+                            for x in range(GameConfig.MAP_WIDTH - 10, GameConfig.MAP_WIDTH - 5)
+                            for y in range(GameConfig.MAP_HEIGHT - 10, GameConfig.MAP_HEIGHT - 5)
+                            if not self.game_map.walls[x, y]), None)
+        
+        if gateway is not None:
+            self.game_map.gateway = gateway
     
     def _is_valid_gateway_placement(self, position: Position) -> bool:
         """Check if position is valid for gateway placement."""
-        return (self.game_map.is_valid_position(position) and
-                position.distance_to(Position(5, 5)) > 25 and
-                (position.x, position.y) not in self.game_map.data_patches and
-                (position.x, position.y) not in self.game_map.cooling_nodes and
-                (position.x, position.y) not in self.game_map.cpu_recovery_nodes and
-                not self._get_enemy_at(position))
+        return (not self.game_map.tile_flags[position.x, position.y] & TileFlags.OCCUPIED and
+                self.spawn_clear['gateway'][position.x, position.y] and
+                not self.enemy_grid[position.x, position.y])
     
     def _generate_patrol_route(self, start: Position) -> List[Position]:
         """Generate a patrol route starting from given position."""
         route = [start]
-        route_length = random.randint(4, 8)
-        current = start
-        
-        for _ in range(route_length - 1):
-            attempts = 0
-            while attempts < 30:
-                attempts += 1
-                step_size = random.randint(2, 5)
-                direction = random.choice([(0, -step_size), (step_size, 0), 
-                                         (0, step_size), (-step_size, 0)])
-                new_pos = Position(current.x + direction[0], current.y + direction[1])
+        route_length = int(self.level_rng.integers(4, 8, endpoint=True))
+        
+        # Draw every leg's 30 attempts up front: a step size and a cardinal direction each
+        attempts_per_leg = 30
+        attempts = (route_length - 1) * attempts_per_leg
+        step_sizes = self.level_rng.integers(2, 5, size=attempts, endpoint=True).tolist()
+        directions = self.level_rng.integers(0, 4, size=attempts).tolist()
+        x, y = start.x, start.y
+        # Waypoints keep a 3-cell margin from the map edge
+        max_x, max_y = GameConfig.MAP_WIDTH - 3, GameConfig.MAP_HEIGHT - 3
+        
+        for leg in range(route_length - 1):
+            for attempt in range(leg * attempts_per_leg, (leg + 1) * attempts_per_leg):
+                dx, dy = self.PATROL_DIRECTIONS[directions[attempt]]
+                new_x = x + dx * step_sizes[attempt]
+                new_y = y + dy * step_sizes[attempt]
                 
-                if (new_pos.is_valid(GameConfig.MAP_WIDTH - 3, GameConfig.MAP_HEIGHT - 3) and
-                    new_pos.x >= 3 and new_pos.y >= 3 and
-                    self.game_map.is_valid_position(new_pos)):
-                    route.append(new_pos)
-                    current = new_pos
+                if (3 <= new_x < max_x and 3 <= new_y < max_y and
+                    not self.game_map.walls[new_x, new_y]):
+                    route.append(Position(new_x, new_y))
+                    x, y = new_x, new_y
                     break
         
         # Ensure minimum route length
@@ -1878,126 +2520,111 @@ class Game:
         
         return route
     
-    def get_enemy_next_positions(self, enemy: Enemy, steps: int = 3) -> List[Position]:
-        """Get the next N positions this enemy will move to."""
+    def get_enemy_next_positions(self, enemy: Enemy, steps: int = 3) -> List[Tuple[int, int]]:
+        """Get the next N (x, y) cells this enemy will move to."""
         if enemy.disabled_turns > 0:
             return []
         
         positions = []
         
-        if enemy.type_data.movement == EnemyMovement.STATIC:
+        if enemy.movement == EnemyMovement.STATIC:
             return []
-        elif enemy.type_data.movement == EnemyMovement.LINEAR and enemy.patrol_points:
+        elif enemy.movement == EnemyMovement.LINEAR and enemy.patrol_points:
             positions = self._predict_patrol_movement(enemy, steps)
-        elif enemy.type_data.movement == EnemyMovement.RANDOM:
+        elif enemy.movement == EnemyMovement.RANDOM:
             positions = self._predict_random_movement(enemy, steps)
-        elif enemy.type_data.movement == EnemyMovement.SEEK:
+        elif enemy.movement == EnemyMovement.SEEK:
             if enemy.state == EnemyState.HOSTILE and enemy.last_seen_player:
                 positions = self._predict_seek_movement(enemy, steps)
-        elif enemy.type_data.movement == EnemyMovement.TRACK:
+        elif enemy.movement == EnemyMovement.TRACK:
             if enemy.state == EnemyState.HOSTILE:
                 positions = self._predict_track_movement(enemy, steps)
         
         return positions
     
-    def _predict_patrol_movement(self, enemy: Enemy, steps: int) -> List[Position]:
-        """Predict next positions for patrol movement."""
+    def _predict_patrol_movement(self, enemy: Enemy, steps: int) -> List[Tuple[int, int]]:
+        """Predict next cells for patrol movement."""
         if not enemy.patrol_points:
             return []
         
+        # The cached route preview holds unless walls cut it short or the player stands on it
+        player_cell = (self.player.x, self.player.y)
+        preview = enemy.get_patrol_preview(steps, self.game_map)
+        if len(preview) == steps and player_cell not in preview:
+            return list(preview)
+        
         positions = []
-        current_pos = Position(enemy.x, enemy.y)
+        current = (enemy.x, enemy.y)
         current_index = enemy.patrol_index
         
         for step in range(steps):
-            target = enemy.patrol_points[current_index]
+            current_index, next_step = enemy.get_patrol_step(current[0], current[1], current_index, self.game_map)
             
-            if current_pos.distance_to(target) <= 1:
-                current_index = (current_index + 1) % len(enemy.patrol_points)
+            if next_step is None or next_step == player_cell:
                 target = enemy.patrol_points[current_index]
-            
-            next_pos = self._get_next_move_toward(current_pos, target)
-            if next_pos and next_pos != current_pos:
-                positions.append(next_pos)
-                current_pos = next_pos
+                next_step = self._get_next_move_toward(current, target.x, target.y)
+            if next_step and next_step != current:
+                positions.append(next_step)
+                current = next_step
             else:
                 break
         
         return positions
     
-    def _predict_random_movement(self, enemy: Enemy, steps: int) -> List[Position]:
-        """Predict next positions for random movement (show possible moves)."""
+    def _predict_random_movement(self, enemy: Enemy, steps: int) -> List[Tuple[int, int]]:
+        """Predict next cells for random movement (show the queued moves)."""
         if enemy.state == EnemyState.HOSTILE:
             return self._predict_seek_movement(enemy, steps)
         
-        # For random movement, show the queued moves
         enemy._ensure_random_move_queue()
-        current_pos = Position(enemy.x, enemy.y)
+        x, y = enemy.x, enemy.y
         positions = []
         
-        for i, (dx, dy) in enumerate(enemy.random_move_queue[:steps]):
-            new_pos = Position(current_pos.x + dx, current_pos.y + dy)
-            if (new_pos.is_valid(GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT) and
-                self.game_map.is_valid_position(new_pos)):
-                positions.append(new_pos)
-                current_pos = new_pos
-                positions.append(new_pos)
-                current_pos = new_pos
+        for dx, dy in islice(enemy.random_move_queue, steps):
+            if self.game_map.is_open_cell(x + dx, y + dy):
+                x, y = x + dx, y + dy
+                positions.append((x, y))
         
-        positions.append(new_pos)
         return positions
     
-    def _predict_seek_movement(self, enemy: Enemy, steps: int) -> List[Position]:
-        """Predict next positions for seek movement."""
+    def _predict_seek_movement(self, enemy: Enemy, steps: int) -> List[Tuple[int, int]]:
+        """Predict next cells for seek movement."""
         if not enemy.last_seen_player:
             return []
         
         return self._predict_movement_toward_target(enemy, enemy.last_seen_player, steps)
     
-    def _predict_track_movement(self, enemy: Enemy, steps: int) -> List[Position]:
-        """Predict next positions for track movement."""
+    def _predict_track_movement(self, enemy: Enemy, steps: int) -> List[Tuple[int, int]]:
+        """Predict next cells for track movement."""
         return self._predict_movement_toward_target(enemy, self.player.position, steps)
     
-    def _predict_movement_toward_target(self, enemy: Enemy, target: Position, steps: int) -> List[Position]:
+    def _predict_movement_toward_target(self, enemy: Enemy, target: Position, steps: int) -> List[Tuple[int, int]]:
         """Predict movement toward a specific target."""
         positions = []
-        current_pos = Position(enemy.x, enemy.y)
+        current = (enemy.x, enemy.y)
         
         for step in range(steps):
-            next_pos = self._get_next_move_toward(current_pos, target)
-            if next_pos and next_pos != current_pos:
-                positions.append(next_pos)
-                current_pos = next_pos
+            next_step = self._get_next_move_toward(current, target.x, target.y)
+            if next_step and next_step != current:
+                positions.append(next_step)
+                current = next_step
             else:
                 break
         
         return positions
     
-    def _get_next_move_toward(self, start: Position, target: Position) -> Optional[Position]:
-        """Get the next move position toward target."""
-        if not target.is_valid(GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT):
+    def _get_next_move_toward(self, start: Tuple[int, int], target_x: int, target_y: int) -> Optional[Tuple[int, int]]:
+        """Get the next cell from start toward (target_x, target_y)."""
+        if not (0 <= target_x < GameConfig.MAP_WIDTH and 0 <= target_y < GameConfig.MAP_HEIGHT):
             return None
         
-        dx = 0 if start.x == target.x else (1 if target.x > start.x else -1)
-        dy = 0 if start.y == target.y else (1 if target.y > start.y else -1)
-        
-        # Try different movement directions in order of preference
-        move_attempts = [
-            (dx, dy), (dx, 0), (0, dy), (dx, -dy), (-dx, dy),
-            (-dx, 0), (0, -dy), (-dx, -dy)
-        ]
-        
-        for try_dx, try_dy in move_attempts:
-            if try_dx == 0 and try_dy == 0:
-                continue
-            
-            new_position = Position(start.x + try_dx, start.y + try_dy)
-            if (new_position.is_valid(GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT) and
-                self.game_map.is_valid_position(new_position) and
-                not new_position.distance_to(self.player.position) == 0):
-                return new_position
-        
-        return None
+        x, y = start
+        # Same direction preference as enemy movement, ignoring other enemies
+        new_x, new_y = step_toward(self.game_map.walls, self.game_map.no_occupants, x, y,
+                                   target_x, target_y, self.player.x, self.player.y)
+        if (new_x, new_y) == (x, y):
+            return None
+        return int(new_x), int(new_y)
 
 # ============================================================================
 # EXPLOIT SYSTEM
@@ -2012,7 +2639,7 @@ class ExploitSystem:
     def use_exploit(self, exploit_key: str) -> bool:
         """Attempt to use an exploit."""
         if not self.game.player.inventory_manager.can_use_exploit(exploit_key):
-            self.message_log.add_message("Exploit not equipped")
+            self.game.message_log.add_message("Exploit not equipped")
             return False
         
         exploit = GameData.EXPLOITS[exploit_key]
@@ -2073,8 +2700,7 @@ class ExploitSystem:
             self.game.message_log.add_message("Invalid target location")
             return False
         
-        distance = self.game.player.position.distance_to(target)
-        if distance > exploit.range:
+        if not self.game.player.position.within(target, exploit.range):
             self.game.message_log.add_message(f"Out of range (Max: {exploit.range})")
             return False
         
@@ -2083,28 +2709,12 @@ class ExploitSystem:
     
     def _execute_specific_exploit(self, exploit_key: str, exploit: ExploitDefinition, target: Position) -> bool:
         """Execute the specific exploit effect."""
-        if exploit_key == 'shadow_step':
-            return self._execute_shadow_step(target)
-        elif exploit_key == 'data_mimic':
-            return self._execute_data_mimic()
-        elif exploit_key == 'noise_maker':
-            return self._execute_noise_maker(target)
-        elif exploit_key == 'code_injection':
-            return self._execute_code_injection(target)
-        elif exploit_key == 'buffer_overflow':
-            return self._execute_buffer_overflow(target)
-        elif exploit_key == 'system_crash':
-            return self._execute_system_crash(target, exploit.range)
-        elif exploit_key == 'network_scan':
-            return self._execute_network_scan()
-        elif exploit_key == 'log_wiper':
-            return self._execute_log_wiper()
-        elif exploit_key == 'emp_burst':
-            return self._execute_emp_burst(target, exploit.range)
-        
-        return False
+        handler = self._EXPLOIT_HANDLERS.get(exploit_key)
+        if handler is None:
+            return False
+        return handler(self, exploit, target)
     
-    def _execute_shadow_step(self, target: Position) -> bool:
+    def _execute_shadow_step(self, exploit: ExploitDefinition, target: Position) -> bool:
         """Execute shadow step exploit."""
         if self.game.game_map.is_shadow(target) and self.game.game_map.is_valid_position(target):
             if not self.game._get_enemy_at(target):
@@ -2117,19 +2727,18 @@ class ExploitSystem:
             self.game.message_log.add_message("Must target shadow zone")
         return False
     
-    def _execute_data_mimic(self) -> bool:
+    def _execute_data_mimic(self, exploit: ExploitDefinition, target: Position) -> bool:
         """Execute data mimic exploit."""
         self.game.player.temporary_effects['data_mimic_turns'] = 5
         self.game.message_log.add_message("Data Mimic active")
         return True
     
-    def _execute_noise_maker(self, target: Position) -> bool:
+    def _execute_noise_maker(self, exploit: ExploitDefinition, target: Position) -> bool:
         """Execute noise maker exploit."""
         attracted = 0
-        for enemy in self.game.enemies:
-            if (enemy.type_data.movement in [EnemyMovement.SEEK, EnemyMovement.RANDOM, EnemyMovement.LINEAR] and
-                enemy.position.distance_to(target) <= 10):
-                if enemy.type_data.movement == EnemyMovement.LINEAR:
+        for enemy in self.game.get_enemies_in_range(target, 10):
+            if enemy.movement in (EnemyMovement.SEEK, EnemyMovement.RANDOM, EnemyMovement.LINEAR):
+                if enemy.movement == EnemyMovement.LINEAR:
                     enemy.state = EnemyState.ALERT
                     enemy.alert_timer = 3
                 else:
@@ -2140,7 +2749,7 @@ class ExploitSystem:
         self.game.message_log.add_message(f"Noise: {attracted} enemies attracted")
         return True
     
-    def _execute_code_injection(self, target: Position) -> bool:
+    def _execute_code_injection(self, exploit: ExploitDefinition, target: Position) -> bool:
 
         """Execute code injection exploit."""
         target_enemy = self.game._get_enemy_at(target)
@@ -2148,7 +2757,7 @@ class ExploitSystem:
             damage = 35 if target_enemy.type == 'firewall' else 30
             
             if target_enemy.take_damage(damage):
-                self.game.enemies.remove(target_enemy)
+                self.game._remove_enemy(target_enemy)
                 self.game.player.cpu = min(self.game.player.max_cpu, self.game.player.cpu + 5)
                 self.game.message_log.add_message(f"Eliminated {target_enemy.type_data.name}")
             else:
@@ -2160,15 +2769,14 @@ class ExploitSystem:
             self.game.message_log.add_message("No target at location")
             return False
     
-    def _execute_buffer_overflow(self, target: Position) -> bool:
+    def _execute_buffer_overflow(self, exploit: ExploitDefinition, target: Position) -> bool:
 
-        distance = self.game.player.position.distance_to(target)
-        if distance <= 1:
+        if self.game.player.position.within(target, 1):
             target_enemy = self.game._get_enemy_at(target)
             if target_enemy:
                 damage = 50
                 if target_enemy.take_damage(damage):
-                    self.game.enemies.remove(target_enemy)
+                    self.game._remove_enemy(target_enemy)
                     self.game.player.cpu = min(self.game.player.max_cpu, self.game.player.cpu + 5)
                     self.game.message_log.add_message(f"Eliminated {target_enemy.type_data.name}")
                 else:
@@ -2182,26 +2790,22 @@ class ExploitSystem:
             self.game.message_log.add_message("Must target adjacent enemy")
         return False
     
-    def _execute_system_crash(self, target: Position, exploit_range: int) -> bool:
+    def _execute_system_crash(self, exploit: ExploitDefinition, target: Position) -> bool:
         """Execute system crash exploit."""
-        enemies_hit = []
-        for enemy in self.game.enemies[:]:
-            if enemy.position.distance_to(target) <= exploit_range:
-                enemy.disabled_turns = 4
-                enemy.state = EnemyState.UNAWARE
-                enemy.alert_timer = 0
-                enemies_hit.append(enemy)
+        enemies_hit = self.game.get_enemies_in_range(target, exploit.range)
+        for enemy in enemies_hit:
+            enemy.disabled_turns = 4
+            enemy.state = EnemyState.UNAWARE
+            enemy.alert_timer = 0
         self.game.message_log.add_message(f"System crash: {len(enemies_hit)} disabled")
         return True
     
-    def _execute_network_scan(self) -> bool:
+    def _execute_network_scan(self, exploit: ExploitDefinition, target: Position) -> bool:
         """Execute enhanced network scan exploit."""
         self.game.network_scan_turns = 5  # Shorter duration but more powerful
         
         # Network scan reveals entire map layout
-        for x in range(GameConfig.MAP_WIDTH):
-            for y in range(GameConfig.MAP_HEIGHT):
-                self.game.game_map.explored_tiles.add((x, y))
+        self.game.game_map.explored.fill(True)
         
         # Update all enemy positions in memory
         for enemy in self.game.enemies:
@@ -2210,7 +2814,7 @@ class ExploitSystem:
         self.game.message_log.add_message("FULL NETWORK SCAN ACTIVE - All systems revealed!")
         return True
 
-    def _execute_log_wiper(self) -> bool:
+    def _execute_log_wiper(self, exploit: ExploitDefinition, target: Position) -> bool:
 
         old_detection = self.game.player.detection
         self.game.player.detection = max(0, self.game.player.detection - 30)
@@ -2218,32 +2822,115 @@ class ExploitSystem:
         self.game.message_log.add_message(f"Detection: -{actual_reduction:.1f}%")
         return True
     
-    def _execute_emp_burst(self, target: Position, exploit_range: int) -> bool:
+    def _execute_emp_burst(self, exploit: ExploitDefinition, target: Position) -> bool:
 
         """Execute EMP burst exploit."""
-        enemies_hit = []
-        for enemy in self.game.enemies[:]:
-            if enemy.position.distance_to(target) <= exploit_range:
-                enemy.disabled_turns = 6
-                enemy.state = EnemyState.UNAWARE
-                enemy.alert_timer = 0
-                enemies_hit.append(enemy)
+        enemies_hit = self.game.get_enemies_in_range(target, exploit.range)
+        for enemy in enemies_hit:
+            enemy.disabled_turns = 6
+            enemy.state = EnemyState.UNAWARE
+            enemy.alert_timer = 0
         self.game.message_log.add_message(f"EMP: {len(enemies_hit)} disabled")
         return True
+    
+    _EXPLOIT_HANDLERS = {
+        'shadow_step': _execute_shadow_step,
+        'data_mimic': _execute_data_mimic,
+        'noise_maker': _execute_noise_maker,
+        'code_injection': _execute_code_injection,
+        'buffer_overflow': _execute_buffer_overflow,
+        'system_crash': _execute_system_crash,
+        'network_scan': _execute_network_scan,
+        'log_wiper': _execute_log_wiper,
+        'emp_burst': _execute_emp_burst,
+    }
+
 # INPUT HANDLING
 # ============================================================================
 
 class InputHandler:
     """Handles all user input and translates it to game actions."""
     
+    # Movement keys shared by gameplay and targeting
+    MOVEMENT_KEYS = {
+        # WASD + QEZC (original)
+        tcod.event.KeySym.W: (0, -1),
+        tcod.event.KeySym.Q: (-1, -1),
+        tcod.event.KeySym.E: (1, -1),
+        tcod.event.KeySym.D: (1, 0),
+        tcod.event.KeySym.C: (1, 1),
+        tcod.event.KeySym.S: (0, 1),
+        tcod.event.KeySym.Z: (-1, 1),
+        tcod.event.KeySym.A: (-1, 0),
+        # Arrow keys
+        tcod.event.KeySym.UP: (0, -1),
+        tcod.event.KeySym.DOWN: (0, 1),
+        tcod.event.KeySym.LEFT: (-1, 0),
+        tcod.event.KeySym.RIGHT: (1, 0),
+        # Numpad
+        tcod.event.KeySym.KP_8: (0, -1),
+        tcod.event.KeySym.KP_9: (1, -1),
+        tcod.event.KeySym.KP_6: (1, 0),
+        tcod.event.KeySym.KP_3: (1, 1),
+        tcod.event.KeySym.KP_2: (0, 1),
+        tcod.event.KeySym.KP_1: (-1, 1),
+        tcod.event.KeySym.KP_4: (-1, 0),
+        tcod.event.KeySym.KP_7: (-1, -1)
+    }
+    
+    # Exploit usage (1-5 keys) mapped to equipped slot
+    EXPLOIT_SLOT_KEYS = {
+        tcod.event.KeySym.N1: 0,
+        tcod.event.KeySym.N2: 1,
+        tcod.event.KeySym.N3: 2,
+        tcod.event.KeySym.N4: 3,
+        tcod.event.KeySym.N5: 4
+    }
+    
+    CONFIRM_KEYS = (tcod.event.KeySym.RETURN, tcod.event.KeySym.KP_ENTER)
+    
     def __init__(self, game: Game):
         self.game = game
         self.exploit_system = ExploitSystem(game)
+        
+        # Dispatch tables for keys that map to a single action
+        self.inventory_actions = {
+            # Navigation keys - expanded to include arrows and numpad
+            tcod.event.KeySym.W: lambda: self._navigate_inventory(-1),
+            tcod.event.KeySym.UP: lambda: self._navigate_inventory(-1),
+            tcod.event.KeySym.KP_8: lambda: self._navigate_inventory(-1),
+            tcod.event.KeySym.S: lambda: self._navigate_inventory(1),
+            tcod.event.KeySym.DOWN: lambda: self._navigate_inventory(1),
+            tcod.event.KeySym.KP_2: lambda: self._navigate_inventory(1),
+            tcod.event.KeySym.RETURN: self._use_selected_inventory_item,
+            tcod.event.KeySym.KP_ENTER: self._use_selected_inventory_item,
+            tcod.event.KeySym.U: self._unequip_selected_exploit,
+            tcod.event.KeySym.I: self._close_inventory
+        }
+        self.gameplay_actions = {
+            # Wait/rest
+            tcod.event.KeySym.SPACE: self.game.maybe_process_turn,
+            tcod.event.KeySym.PERIOD: self.game.maybe_process_turn,
+            tcod.event.KeySym.KP_5: self.game.maybe_process_turn,
+            # UI toggles
+            tcod.event.KeySym.I: self._open_inventory
+        }
+        # Movement and exploit slots share the table, so gameplay keys need a single lookup
+        for sym, (dx, dy) in self.MOVEMENT_KEYS.items():
+            self.gameplay_actions[sym] = lambda dx=dx, dy=dy: self.game.move_player(dx, dy)
+        for sym, slot in self.EXPLOIT_SLOT_KEYS.items():
+            self.gameplay_actions[sym] = lambda slot=slot: self._use_exploit_slot(slot)
     
     def handle_keydown(self, event) -> bool:
-        """Handle keydown events. Returns True if game should continue."""
+        """Handle keydown events. Returns True if game should continue.
+        
+        The game only changes in response to input, so handlers mark the screen
+        dirty only when a key is bound in the current mode; unbound keys (including
+        bare modifiers) leave the last frame on screen.
+        """
         # Global exit conditions
         if event.sym == tcod.event.KeySym.ESCAPE:
+            self.game.dirty = True
             return self._handle_escape()
         
         # Dead/game over state
@@ -2253,6 +2940,7 @@ class InputHandler:
         # Modal screens
         if self.game.show_help:
             self.game.show_help = False
+            self.game.dirty = True
             return True
         
         if self.game.show_inventory:
@@ -2273,124 +2961,47 @@ class InputHandler:
         elif self.game.targeting_mode:
             self.game.targeting_mode = False
             self.game.targeting_exploit = None
-            self.message_log.add_message("Targeting cancelled")
+            self.game.message_log.add_message("Targeting cancelled")
         else:
             return False  # Exit game
         return True
     
     def _handle_inventory_input(self, event) -> bool:
         """Handle input while inventory is open."""
-        # Navigation keys - expanded to include arrows and numpad
-        if event.sym in (tcod.event.KeySym.W, tcod.event.KeySym.UP, tcod.event.KeySym.KP_8):
-            self._navigate_inventory(-1)
-        elif event.sym in (tcod.event.KeySym.S, tcod.event.KeySym.DOWN, tcod.event.KeySym.KP_2):
-            self._navigate_inventory(1)
-        elif event.sym in (tcod.event.KeySym.RETURN, tcod.event.KeySym.KP_ENTER):
-            self._use_selected_inventory_item()
-        elif event.sym == tcod.event.KeySym.U:
-            self._unequip_selected_exploit()
-        elif event.sym == tcod.event.KeySym.I:
-            self.game.show_inventory = False
+        action = self.inventory_actions.get(event.sym)
+        if action:
+            action()
+            self.game.dirty = True
         
         return True
 
     def _handle_targeting_input(self, event) -> bool:
         """Handle input while in targeting mode."""
-        # Movement keys - expanded to include numpad and arrows
-        movement_map = {
-            # WASD + QEZC (original)
-            tcod.event.KeySym.W: (0, -1),
-            tcod.event.KeySym.Q: (-1, -1),
-            tcod.event.KeySym.E: (1, -1),
-            tcod.event.KeySym.D: (1, 0),
-            tcod.event.KeySym.C: (1, 1),
-            tcod.event.KeySym.S: (0, 1),
-            tcod.event.KeySym.Z: (-1, 1),
-            tcod.event.KeySym.A: (-1, 0),
-            # Arrow keys
-            tcod.event.KeySym.UP: (0, -1),
-            tcod.event.KeySym.DOWN: (0, 1),
-            tcod.event.KeySym.LEFT: (-1, 0),
-            tcod.event.KeySym.RIGHT: (1, 0),
-            # Numpad
-            tcod.event.KeySym.KP_8: (0, -1),
-            tcod.event.KeySym.KP_9: (1, -1),
-            tcod.event.KeySym.KP_6: (1, 0),
-            tcod.event.KeySym.KP_3: (1, 1),
-            tcod.event.KeySym.KP_2: (0, 1),
-            tcod.event.KeySym.KP_1: (-1, 1),
-            tcod.event.KeySym.KP_4: (-1, 0),
-            tcod.event.KeySym.KP_7: (-1, -1)
-        }
-        
-        if event.sym in movement_map:
-            dx, dy = movement_map[event.sym]
-            self.game._move_cursor(dx, dy)
-        elif event.sym in (tcod.event.KeySym.RETURN, tcod.event.KeySym.KP_ENTER):
+        move = self.MOVEMENT_KEYS.get(event.sym)
+        if move:
+            self.game._move_cursor(*move)
+        elif event.sym in self.CONFIRM_KEYS:
             self.exploit_system.execute_exploit(
                 self.game.targeting_exploit, 
                 self.game.cursor_position
             )
+        else:
+            return True
         
+        self.game.dirty = True
         return True
     
     def _handle_gameplay_input(self, event) -> bool:
         """Handle input during normal gameplay."""
-        # Movement keys - expanded to include numpad and arrows
-        movement_map = {
-            # WASD + QEZC (original)
-            tcod.event.KeySym.W: (0, -1),
-            tcod.event.KeySym.Q: (-1, -1),
-            tcod.event.KeySym.E: (1, -1),
-            tcod.event.KeySym.D: (1, 0),
-            tcod.event.KeySym.C: (1, 1),
-            tcod.event.KeySym.S: (0, 1),
-            tcod.event.KeySym.Z: (-1, 1),
-            tcod.event.KeySym.A: (-1, 0),
-            # Arrow keys
-            tcod.event.KeySym.UP: (0, -1),
-            tcod.event.KeySym.DOWN: (0, 1),
-            tcod.event.KeySym.LEFT: (-1, 0),
-            tcod.event.KeySym.RIGHT: (1, 0),
-            # Numpad
-            tcod.event.KeySym.KP_8: (0, -1),
-            tcod.event.KeySym.KP_9: (1, -1),
-            tcod.event.KeySym.KP_6: (1, 0),
-            tcod.event.KeySym.KP_3: (1, 1),
-            tcod.event.KeySym.KP_2: (0, 1),
-            tcod.event.KeySym.KP_1: (-1, 1),
-            tcod.event.KeySym.KP_4: (-1, 0),
-            tcod.event.KeySym.KP_7: (-1, -1)
-        }
-        
-        if event.sym in movement_map:
-            dx, dy = movement_map[event.sym]
-            self.game.move_player(dx, dy)
-        
-        # Wait/rest
-        elif event.sym in (tcod.event.KeySym.SPACE, tcod.event.KeySym.PERIOD, tcod.event.KeySym.KP_5):
-            self.game.maybe_process_turn()
-        
-        # UI toggles
-        elif event.sym == tcod.event.KeySym.I:
-            self._open_inventory()
+        action = self.gameplay_actions.get(event.sym)
+        if action:
+            action()
         elif event.sym == tcod.event.KeySym.SLASH and (event.mod & (tcod.event.Modifier.LSHIFT | tcod.event.Modifier.RSHIFT)):
             self.game.show_help = True
+        else:
+            return True
         
-        # Exploit usage (1-5 keys)
-        elif event.sym == tcod.event.KeySym.N1:
-            self._use_exploit_slot(0)
-        elif event.sym == tcod.event.KeySym.N2:
-            self._use_exploit_slot(1)
-        elif event.sym == tcod.event.KeySym.N3:
-            self._use_exploit_slot(2)
-        elif event.sym == tcod.event.KeySym.N4:
-            self._use_exploit_slot(3)
-        elif event.sym == tcod.event.KeySym.N5:
-            self._use_exploit_slot(4)
-        elif event.sym == tcod.event.KeySym.N5:
-            self._use_exploit_slot(4)
-        
+        self.game.dirty = True
         return True
     
     def _navigate_inventory(self, direction: int):
@@ -2448,6 +3059,10 @@ class InputHandler:
         self.game.show_inventory = True
         self.game.inventory_selection = 0
     
+    def _close_inventory(self):
+        """Close the inventory screen."""
+        self.game.show_inventory = False
+    
     def _use_exploit_slot(self, slot: int):
         """Use exploit in specified slot."""
         equipped = self.game.player.inventory_manager.equipped_exploits
@@ -2461,6 +3076,18 @@ class InputHandler:
 class Renderer:
     """Handles all game rendering."""
     
+    # End-of-run messages as (x, y offset from the game area center, text, color)
+    VICTORY_LINES = (
+        (-10, 0, "MISSION COMPLETE!", Colors.ACID_GREEN),
+        (-15, 1, "All networks infiltrated!", Colors.CYBER_TEAL),
+        (-8, 3, "Press ESC to exit", Colors.ELECTRIC_PURPLE),
+    )
+    DEATH_LINES = (
+        (-8, 0, "SYSTEM FAILURE", Colors.NEON_PINK),
+        (-12, 1, "Consciousness purged", Colors.RED),
+        (-8, 3, "Press ESC to exit", Colors.ELECTRIC_PURPLE),
+    )
+    
     def __init__(self):
         self.ui_renderer = UIRenderer()
         self.map_renderer = MapRenderer()
@@ -2485,31 +3112,86 @@ class Renderer:
         
         # Render game over/death messages
         if game.game_over:
-            self._render_victory_message(console)
+            self._render_end_message(console, self.VICTORY_LINES)
         elif game.player.cpu <= 0:
-            self._render_death_message(console)
-    
-    def _render_victory_message(self, console: tcod.console.Console):
-        """Render victory message."""
-        center_x = GameConfig.GAME_AREA_WIDTH // 2
-        center_y = GameConfig.SCREEN_HEIGHT // 2
-        
-        console.print(center_x - 10, center_y, "MISSION COMPLETE!", fg=Colors.ACID_GREEN)
-        console.print(center_x - 15, center_y + 1, "All networks infiltrated!", fg=Colors.CYBER_TEAL)
-        console.print(center_x - 8, center_y + 3, "Press ESC to exit", fg=Colors.ELECTRIC_PURPLE)
+            self._render_end_message(console, self.DEATH_LINES)
     
-    def _render_death_message(self, console: tcod.console.Console):
-        """Render death message."""
+    def _render_end_message(self, console: tcod.console.Console, lines: Tuple[Tuple[int, int, str, Tuple[int, int, int]], ...]):
+        """Render a victory or death message around the game area center."""
         center_x = GameConfig.GAME_AREA_WIDTH // 2
         center_y = GameConfig.SCREEN_HEIGHT // 2
         
-        console.print(center_x - 8, center_y, "SYSTEM FAILURE", fg=Colors.NEON_PINK)
-        console.print(center_x - 12, center_y + 1, "Consciousness purged", fg=Colors.RED)
-        console.print(center_x - 8, center_y + 3, "Press ESC to exit", fg=Colors.ELECTRIC_PURPLE)
+        for dx, dy, text, color in lines:
+            console.print(center_x + dx, center_y + dy, text, fg=color)
 
 class UIRenderer:
     """Renders UI elements."""
     
+    # Help screen lines as (text, color)
+    HELP_SECTIONS: Tuple[Tuple[str, Tuple[int, int, int]], ...] = (
+        ("MOVEMENT (8-DIRECTIONAL):", Colors.CYAN),
+        ("  WASD + QEZC: Move in 8 directions", Colors.WHITE),
+        ("  Arrow Keys: 4-directional movement", Colors.WHITE),
+        ("  Numpad 1-9: 8-directional movement", Colors.WHITE),
+        ("  Space/./5: Wait/Rest", Colors.WHITE),
+        ("", Colors.WHITE),
+        
+        ("EXPLOITS:", Colors.CYAN),
+        ("  1-5: Use equipped exploits", Colors.WHITE),
+        ("  Follow targeting prompts for ranged exploits", Colors.WHITE),
+        ("", Colors.WHITE),
+        
+        ("INVENTORY & EQUIPMENT:", Colors.CYAN),
+        ("  I: Open inventory", Colors.WHITE),
+        ("  W/S or ↑/↓ or 8/2: Navigate selection", Colors.WHITE),
+        ("  Enter: Use data patch / Equip exploit", Colors.WHITE),
+        ("  Max 5 exploits can be equipped at once", Colors.WHITE),
+        ("", Colors.WHITE),
+        
+        ("INTERFACE:", Colors.CYAN),
+        ("  ?: This help screen", Colors.WHITE),
+        ("  ESC: Cancel targeting/Close menus/Quit", Colors.WHITE),
+        ("", Colors.WHITE),
+        
+        ("MAP SYMBOLS:", Colors.CYAN),
+        ("  @: Player character", Colors.PLAYER),
+        ("  #: Walls", Colors.WALL),
+        ("  .: Floor/Shadow areas", Colors.FLOOR),
+        ("  G: Gateway (level exit)", Colors.GATEWAY),
+        ("", Colors.WHITE),
+        
+        ("ITEMS & PICKUPS:", Colors.CYAN),
+        ("  !: Data patches (various effects)", Colors.GREEN),
+        ("  &: Exploit programs", Colors.MAGENTA),
+        ("  ~: Cooling nodes (reduce heat)", Colors.CYAN),
+        ("  +: CPU recovery nodes (restore health)", Colors.ELECTRIC_BLUE),
+        ("", Colors.WHITE),
+
+        ("GAMEPLAY TIPS:", Colors.CYAN),
+        ("  - Hide in shadows (.) to avoid detection", Colors.WHITE),
+        ("  - Use cooling nodes (~) to manage heat", Colors.WHITE),
+        ("  - CPU recovery nodes (+) restore health", Colors.WHITE),
+        ("  - Collect data patches (!) for various effects", Colors.WHITE),
+        ("  - Stealth attacks deal more damage", Colors.WHITE),
+        ("  - Watch your heat and detection levels!", Colors.WHITE),
+        ("", Colors.WHITE),
+        
+        ("ENEMY TYPES:", Colors.CYAN),
+        ("  S: Scanner (static, low vision)", Colors.ORANGE),
+        ("  P: Patrol (moves on routes)", Colors.ORANGE),
+        ("  B: Bot (random movement)", Colors.ORANGE),
+        ("  F: Firewall (high health, static)", Colors.RED),
+        ("  H: Hunter (seeks players)", Colors.RED),
+        ("  A: Admin Avatar (extremely dangerous!)", Colors.RED),
+    )
+    # The help lines that fit between the header and the footer
+    HELP_VISIBLE_SECTIONS = HELP_SECTIONS[:GameConfig.SCREEN_HEIGHT - 7]
+    
+    def __init__(self):
+        # Status bar segments and the player/turn values they were formatted from
+        self._status_key: Optional[Tuple] = None
+        self._status_segments: List[Tuple[str, Tuple[int, int, int]]] = []
+    
     def render_help_screen(self, console: tcod.console.Console):
         """Render the help screen."""
         console.clear()
@@ -2518,83 +3200,22 @@ class UIRenderer:
         title = "ROGUE SIGNAL PROTOCOL - HELP"
         console.print(GameConfig.SCREEN_WIDTH // 2 - len(title) // 2, 2, title, fg=Colors.YELLOW)
         
-        y = 5
-        help_sections = self._get_help_sections()
-        
-        for text, color in help_sections:
-            if y < GameConfig.SCREEN_HEIGHT - 2:
-                console.print(2, y, text, fg=color)
-                y += 1
+        for y, (text, color) in enumerate(self.HELP_VISIBLE_SECTIONS, start=5):
+            console.print(2, y, text, fg=color)
         
         console.print(GameConfig.SCREEN_WIDTH // 2 - 10, GameConfig.SCREEN_HEIGHT - 2, 
                      "Press any key to return", fg=Colors.YELLOW)
     
-    def _get_help_sections(self) -> List[Tuple[str, Tuple[int, int, int]]]:
+    def _get_help_sections(self) -> Tuple[Tuple[str, Tuple[int, int, int]], ...]:
         """Get help text sections."""
-        return [
-            ("MOVEMENT (8-DIRECTIONAL):", Colors.CYAN),
-            ("  WASD + QEZC: Move in 8 directions", Colors.WHITE),
-            ("  Arrow Keys: 4-directional movement", Colors.WHITE),
-            ("  Numpad 1-9: 8-directional movement", Colors.WHITE),
-            ("  Space/./5: Wait/Rest", Colors.WHITE),
-            ("", Colors.WHITE),
-            
-            ("EXPLOITS:", Colors.CYAN),
-            ("  1-5: Use equipped exploits", Colors.WHITE),
-            ("  Follow targeting prompts for ranged exploits", Colors.WHITE),
-            ("", Colors.WHITE),
-            
-            ("INVENTORY & EQUIPMENT:", Colors.CYAN),
-            ("  I: Open inventory", Colors.WHITE),
-            ("  W/S or ↑/↓ or 8/2: Navigate selection", Colors.WHITE),
-            ("  Enter: Use data patch / Equip exploit", Colors.WHITE),
-            ("  Max 5 exploits can be equipped at once", Colors.WHITE),
-            ("", Colors.WHITE),
-            
-            ("INTERFACE:", Colors.CYAN),
-            ("  ?: This help screen", Colors.WHITE),
-            ("  ESC: Cancel targeting/Close menus/Quit", Colors.WHITE),
-            ("", Colors.WHITE),
-            
-            ("MAP SYMBOLS:", Colors.CYAN),
-            ("  @: Player character", Colors.PLAYER),
-            ("  #: Walls", Colors.WALL),
-            ("  .: Floor/Shadow areas", Colors.FLOOR),
-            ("  G: Gateway (level exit)", Colors.GATEWAY),
-            ("", Colors.WHITE),
-            
-            ("ITEMS & PICKUPS:", Colors.CYAN),
-            ("  !: Data patches (various effects)", Colors.GREEN),
-            ("  &: Exploit programs", Colors.MAGENTA),
-            ("  ~: Cooling nodes (reduce heat)", Colors.CYAN),
-            ("  +: CPU recovery nodes (restore health)", Colors.ELECTRIC_BLUE),
-            ("", Colors.WHITE),
-
-            ("GAMEPLAY TIPS:", Colors.CYAN),
-            ("  - Hide in shadows (.) to avoid detection", Colors.WHITE),
-            ("  - Use cooling nodes (~) to manage heat", Colors.WHITE),
-            ("  - CPU recovery nodes (+) restore health", Colors.WHITE),
-            ("  - Collect data patches (!) for various effects", Colors.WHITE),
-            ("  - Stealth attacks deal more damage", Colors.WHITE),
-            ("  - Watch your heat and detection levels!", Colors.WHITE),
-            ("", Colors.WHITE),
-            
-            ("ENEMY TYPES:", Colors.CYAN),
-            ("  S: Scanner (static, low vision)", Colors.ORANGE),
-            ("  P: Patrol (moves on routes)", Colors.ORANGE),
-            ("  B: Bot (random movement)", Colors.ORANGE),
-            ("  F: Firewall (high health, static)", Colors.RED),
-            ("  H: Hunter (seeks players)", Colors.RED),
-            ("  A: Admin Avatar (extremely dangerous!)", Colors.RED),
-        ]
+        return self.HELP_SECTIONS
     
     def render_inventory_screen(self, console: tcod.console.Console, game: Game):
         """Render the inventory screen."""
         # Clear only the main game area, preserve top bar, bottom panel, and system log
         # Clear lines 1 to PANEL_Y-1 in game area (x 0-54)
-        for x in range(GameConfig.GAME_AREA_WIDTH):
-            for y in range(1, GameConfig.PANEL_Y):
-                console.print(x, y, ' ', fg=Colors.WHITE, bg=Colors.BLACK)
+        console.draw_rect(0, 1, GameConfig.GAME_AREA_WIDTH, GameConfig.PANEL_Y - 1,
+                          ch=ord(' '), fg=Colors.WHITE, bg=Colors.BLACK)
         
         # Title (centered in game area only)
         title = "INVENTORY SYSTEM"
@@ -2666,13 +3287,11 @@ class UIRenderer:
             console.print(4, y, "No data patches collected", fg=Colors.WHITE)
             y += 1
         else:
-            display_items = game.player.inventory_manager.get_display_items()
+            # Patches lead the display order, right after the equipped exploits
             equipped_count = len(game.player.inventory_manager.equipped_exploits)
             
             for i, patch in enumerate(data_patches):
-                display_index = display_items.index(patch)
-                # Adjust selection index to account for equipped exploits
-                adjusted_selection_index = display_index + equipped_count
+                adjusted_selection_index = equipped_count + i
                 
                 if adjusted_selection_index == game.inventory_selection:
                     color = Colors.YELLOW
@@ -2698,16 +3317,12 @@ class UIRenderer:
             console.print(4, y, "No unequipped exploits", fg=Colors.WHITE)
             y += 1
         else:
-            display_items = game.player.inventory_manager.get_display_items()
-            equipped_count = len(game.player.inventory_manager.equipped_exploits)
+            # Exploits follow the equipped exploits and the data patches in display order
+            first_index = (len(game.player.inventory_manager.equipped_exploits) +
+                           len(game.player.inventory_manager.get_items_by_type("data_patch")))
             
             for i, exploit_item in enumerate(exploit_items):
-                try:
-                    display_index = display_items.index(exploit_item)
-                    # Adjust selection index to account for equipped exploits
-                    adjusted_selection_index = display_index + equipped_count
-                except ValueError:
-                    adjusted_selection_index = -1
+                adjusted_selection_index = first_index + i
                 
                 if adjusted_selection_index == game.inventory_selection:
                     color = Colors.YELLOW
@@ -2734,32 +3349,57 @@ class UIRenderer:
     def render_top_status_bar(self, console: tcod.console.Console, game: Game):
         """Render the top status bar."""
         # Clear the top line
-        for x in range(GameConfig.GAME_AREA_WIDTH):
-            console.print(x, 0, ' ', fg=Colors.UI_TEXT, bg=Colors.UI_BG)
-        
+        console.draw_rect(0, 0, GameConfig.GAME_AREA_WIDTH, 1, ord(' '), fg=Colors.UI_TEXT, bg=Colors.UI_BG)
+        
+        # Reformat the status line only when one of its values changed
+        player = game.player
+        status_key = (player.cpu, player.max_cpu, player.heat, player.detection,
+                      player.ram_used, player.ram_total, game.turn)
+        if status_key != self._status_key:
+            self._status_key = status_key
+            self._status_segments = self._build_status_segments(*status_key)
+        self._print_segments(console, 1, 0, self._status_segments, Colors.UI_BG)
+    
+    def _build_status_segments(self, cpu: int, max_cpu: int, heat: int, detection: float,
+                               ram_used: int, ram_total: int, turn: int) -> List[Tuple[str, Tuple[int, int, int]]]:
+        """Format the colored status bar segments that fit on the top line."""
         # Color coding for status values
-        cpu_color = self._get_cpu_color(game.player.cpu)
-        heat_color = self._get_heat_color(game.player.heat)
-        detection_color = self._get_detection_color(game.player.detection)
-        ram_color = Colors.RED if game.player.ram_used > game.player.ram_total else Colors.GREEN
+        cpu_color = self._get_cpu_color(cpu)
+        heat_color = self._get_heat_color(heat)
+        detection_color = self._get_detection_color(detection)
+        ram_color = Colors.RED if ram_used > ram_total else Colors.GREEN
         
         # Build status line
         status_parts = [
-            f"CPU:{game.player.cpu:3d}/{game.player.max_cpu}",
-            f"Heat:{game.player.heat:3d}°C",
-            f"Det:{int(game.player.detection):3d}%",
-            f"RAM:{game.player.ram_used}/{game.player.ram_total}GB",
-            f"Turn:{game.turn:4d}",
+            f"CPU:{cpu:3d}/{max_cpu}",
+            f"Heat:{heat:3d}°C",
+            f"Det:{int(detection):3d}%",
+            f"RAM:{ram_used}/{ram_total}GB",
+            f"Turn:{turn:4d}",
             "Press ? for help"
         ]
         
         colors = [cpu_color, heat_color, detection_color, ram_color, Colors.UI_TEXT, Colors.ELECTRIC_PURPLE]
         
+        segments = []
         x_pos = 1
         for part, color in zip(status_parts, colors):
             if x_pos + len(part) < GameConfig.GAME_AREA_WIDTH - 1:
-                console.print(x_pos, 0, part, fg=color, bg=Colors.UI_BG)
+                segments.append((part, color))
                 x_pos += len(part) + 2
+        return segments
+    
+    def _print_segments(self, console: tcod.console.Console, x: int, y: int,
+                        segments: List[Tuple[str, Tuple[int, int, int]]], bg: Tuple[int, int, int]):
+        """Print colored text segments two spaces apart with a single print call."""
+        if not segments:
+            return
+        console.print(x, y, "  ".join(text for text, _ in segments), fg=Colors.UI_TEXT, bg=bg)
+        
+        # Recolor each segment in place rather than printing it separately
+        for text, color in segments:
+            console.fg[x:x + len(text), y] = color
+            x += len(text) + 2
     
     def _get_cpu_color(self, cpu: int) -> Tuple[int, int, int]:
         """Get color for CPU display."""
@@ -2791,13 +3431,13 @@ class UIRenderer:
     def render_bottom_panel(self, console: tcod.console.Console, game: Game):
         """Render the bottom information panel."""
         # Clear panel area
-        for x in range(GameConfig.GAME_AREA_WIDTH):
-            for y in range(GameConfig.PANEL_Y, GameConfig.SCREEN_HEIGHT):
-                console.print(x, y, ' ', fg=Colors.UI_TEXT, bg=Colors.UI_BG)
+        console.draw_rect(0, GameConfig.PANEL_Y, GameConfig.GAME_AREA_WIDTH, GameConfig.PANEL_HEIGHT,
+                          ch=ord(' '), fg=Colors.UI_TEXT, bg=Colors.UI_BG)
         
-        # Panel border
-        border = "+" + "-" * (GameConfig.GAME_AREA_WIDTH - 2) + "+"
-        console.print(0, GameConfig.PANEL_Y, border, fg=Colors.LOG_BORDER, bg=Colors.UI_BG)
+        # Panel border: a run of dashes with corner marks
+        console.draw_rect(0, GameConfig.PANEL_Y, GameConfig.GAME_AREA_WIDTH, 1,
+                          ch=ord('-'), fg=Colors.LOG_BORDER, bg=Colors.UI_BG)
+        console.ch[[0, GameConfig.GAME_AREA_WIDTH - 1], GameConfig.PANEL_Y] = ord('+')
         
         # Equipped exploits (2 lines)
         self._render_equipped_exploits_panel(console, game)
@@ -2820,99 +3460,79 @@ class UIRenderer:
         second_line_exploits = equipped_exploits[3:]
         
         # Render first line exploits
-        x_pos = 11
-        for i, exploit_key in enumerate(first_line_exploits):
-            if exploit_key in GameData.EXPLOITS:
-                exploit = GameData.EXPLOITS[exploit_key]
-                heat_cost = exploit.heat
-                if game.player.temporary_effects['exploit_efficiency_turns'] > 0:
-                    heat_cost = int(heat_cost * 0.6)
-                
-                heat_ok = game.player.heat + heat_cost <= 100
-                color = Colors.GREEN if heat_ok else Colors.RED
-                exploit_text = f"{i+1}.{exploit.name}"
-                
-                # Check if it fits on this line
-                if x_pos + len(exploit_text) + 2 <= GameConfig.GAME_AREA_WIDTH:
-                    console.print(x_pos, y1, exploit_text, fg=color, bg=Colors.UI_BG)
-                    x_pos += len(exploit_text) + 2  # Add some spacing
+        self._print_segments(console, 11, y1, self._get_exploit_segments(game, first_line_exploits, 1), Colors.UI_BG)
         
-        # Render second line exploits
+        # Render second line exploits, continuing numbering from where the first line left off
         if second_line_exploits:
-            console.print(1, y2, "        ", fg=Colors.ELECTRIC_PURPLE, bg=Colors.UI_BG)  # Indent to align
-            x_pos = 11
-            for i, exploit_key in enumerate(second_line_exploits):
-                if exploit_key in GameData.EXPLOITS:
-                    exploit = GameData.EXPLOITS[exploit_key]
-                    heat_cost = exploit.heat
-                    if game.player.temporary_effects['exploit_efficiency_turns'] > 0:
-                        heat_cost = int(heat_cost * 0.6)
-                    
-                    heat_ok = game.player.heat + heat_cost <= 100
-                    color = Colors.GREEN if heat_ok else Colors.RED
-                    exploit_text = f"{i+4}.{exploit.name}"  # Continue numbering from where first line left off
-                    
-                    # Check if it fits on this line
-                    if x_pos + len(exploit_text) + 2 <= GameConfig.GAME_AREA_WIDTH:
-                        console.print(x_pos, y2, exploit_text, fg=color, bg=Colors.UI_BG)
-                        x_pos += len(exploit_text) + 2
+            console.draw_rect(1, y2, 8, 1, ch=ord(' '), fg=Colors.ELECTRIC_PURPLE, bg=Colors.UI_BG)  # Indent to align
+            self._print_segments(console, 11, y2, self._get_exploit_segments(game, second_line_exploits, 4), Colors.UI_BG)
+    
+    def _get_exploit_segments(self, game: Game, exploit_keys: List[str],
+                              first_number: int) -> List[Tuple[str, Tuple[int, int, int]]]:
+        """Build the colored exploit labels that fit on one panel line."""
+        segments = []
+        x_pos = 11
+        efficient = game.player.temporary_effects['exploit_efficiency_turns'] > 0
+        heat_budget = 100 - game.player.heat
+        for i, exploit_key in enumerate(exploit_keys):
+            # Even the shortest label ("N.X" plus spacing) no longer fits
+            if x_pos + 5 > GameConfig.GAME_AREA_WIDTH:
+                break
+            exploit = GameData.EXPLOITS.get(exploit_key)
+            if exploit is None:
+                continue
+            
+            heat_cost = int(exploit.heat * 0.6) if efficient else exploit.heat
+            color = Colors.GREEN if heat_cost <= heat_budget else Colors.RED
+            exploit_text = f"{i+first_number}.{exploit.name}"
+            
+            # Check if it fits on this line
+            if x_pos + len(exploit_text) + 2 <= GameConfig.GAME_AREA_WIDTH:
+                segments.append((exploit_text, color))
+                x_pos += len(exploit_text) + 2  # Add some spacing
+        return segments
     
     def _render_temporary_conditions(self, console: tcod.console.Console, game: Game):
         """Render all temporary conditions with turn counts remaining."""
         y = GameConfig.PANEL_Y + 3
         
-        conditions = []
-        
-        # Player temporary effects (from data patches and other sources)
-        for effect_name, turns in game.player.temporary_effects.items():
-            if turns > 0:
-                display_name = effect_name.replace('_turns', '').replace('_', ' ').title()
-                conditions.append(f"{display_name}({turns})")
-        
-        # Network scan effect
-        if game.network_scan_turns > 0:
-            conditions.append(f"Network Scan({game.network_scan_turns})")
-        
-        # Speed moves remaining (from speed boost)
-        if game.player.speed_moves_remaining > 0:
-            conditions.append(f"Speed Moves({game.player.speed_moves_remaining})")
-        
-        # Any other temporary game-wide effects could be added here
-        
-        if conditions:
-            conditions_text = "Conditions: " + " ".join(conditions)
-            # Truncate if too long for the line
-            max_width = GameConfig.GAME_AREA_WIDTH - 2
-            if len(conditions_text) > max_width:
-                conditions_text = conditions_text[:max_width-3] + "..."
-            console.print(1, y, conditions_text, fg=Colors.CYAN, bg=Colors.UI_BG)
-        else:
-            console.print(1, y, "Conditions: None", fg=Colors.UI_TEXT, bg=Colors.UI_BG)
+        conditions_text, active = game.player.get_conditions_text(game.network_scan_turns)
+        color = Colors.CYAN if active else Colors.UI_TEXT
+        console.print(1, y, conditions_text, fg=color, bg=Colors.UI_BG)
     
     
     def render_system_log(self, console: tcod.console.Console, game: Game):
         """Render the system log on the right side."""
         # Draw log border
-        for y in range(GameConfig.SCREEN_HEIGHT):
-            console.print(GameConfig.GAME_AREA_WIDTH, y, '|', fg=Colors.LOG_BORDER, bg=Colors.LOG_BG)
+        console.draw_rect(GameConfig.GAME_AREA_WIDTH, 0, 1, GameConfig.SCREEN_HEIGHT,
+                          ch=ord('|'), fg=Colors.LOG_BORDER, bg=Colors.LOG_BG)
         
         # Log header
         console.print(GameConfig.GAME_AREA_WIDTH + 1, 0, "SYSTEM LOG", fg=Colors.ELECTRIC_PURPLE, bg=Colors.LOG_BG)
-        console.print(GameConfig.GAME_AREA_WIDTH + 1, 1, "-" * (GameConfig.LOG_WIDTH - 1), fg=Colors.LOG_BORDER, bg=Colors.LOG_BG)
+        console.draw_rect(GameConfig.GAME_AREA_WIDTH + 1, 1, GameConfig.LOG_WIDTH - 1, 1,
+                          ch=ord('-'), fg=Colors.LOG_BORDER, bg=Colors.LOG_BG)
         
         # Clear log area
-        for x in range(GameConfig.GAME_AREA_WIDTH + 1, GameConfig.SCREEN_WIDTH):
-            for y in range(2, GameConfig.SCREEN_HEIGHT):
-                console.print(x, y, ' ', fg=Colors.UI_TEXT, bg=Colors.LOG_BG)
+        console.draw_rect(GameConfig.GAME_AREA_WIDTH + 1, 2, GameConfig.LOG_WIDTH - 1, GameConfig.SCREEN_HEIGHT - 2,
+                          ch=ord(' '), fg=Colors.UI_TEXT, bg=Colors.LOG_BG)
         
         # Process and display messages
         self._render_log_messages(console, game)
     
     def _render_log_messages(self, console: tcod.console.Console, game: Game):
         """Render log messages with proper wrapping."""
-        wrapped_lines = self._wrap_messages(game.message_log.messages)
         log_height = GameConfig.SCREEN_HEIGHT - 2
-        visible_lines = wrapped_lines[-log_height:] if len(wrapped_lines) > log_height else wrapped_lines
+        
+        # Wrap from the newest message back, stopping once the log area is full
+        blocks = []
+        line_count = 0
+        for message in reversed(game.message_log.messages):
+            block = self._wrap_messages((message,))
+            blocks.append(block)
+            line_count += len(block)
+            if line_count >= log_height:
+                break
+        visible_lines = [line for block in reversed(blocks) for line in block][-log_height:]
         
         for i, (line, color) in enumerate(visible_lines):
             y_pos = 2 + i
@@ -2949,18 +3569,48 @@ class UIRenderer:
 class MapRenderer:
     """Renders the game map and entities."""
     
+    # Predicted-move dot colors for steps 1-3, dimming with distance
+    PATROL_STEP_COLORS = (Colors.YELLOW, (200, 200, 0), (150, 150, 0))
+    SCAN_STEP_COLORS = (Colors.CYAN, (0, 200, 200), (0, 150, 150))
+    # Vision overlay background for each enemy awareness state
+    VISION_OVERLAY_COLORS = {
+        EnemyState.UNAWARE: Colors.VISION_UNAWARE,
+        EnemyState.ALERT: Colors.VISION_ALERT,
+        EnemyState.HOSTILE: Colors.VISION_HOSTILE,
+    }
+    # Dimmer overlays for enemies only revealed by Network Scan
+    SCANNED_OVERLAY_COLORS = {state: tuple(c // 2 for c in color)
+                              for state, color in VISION_OVERLAY_COLORS.items()}
+    # Last-known-position ghosts are drawn at a third of the enemy's current color
+    # Both are indexed by Enemy.color_index so a batch of glyphs is colored in one lookup
+    ENEMY_COLORS = np.array(Enemy.RENDER_COLORS, dtype=np.uint8)
+    GHOST_COLORS = ENEMY_COLORS // 3
+    SCANNED_ENEMY_FG = np.array(Colors.CYAN, dtype=np.uint8)
+    SCANNED_ENEMY_BG = np.array((20, 0, 20), dtype=np.uint8)  # Dark purple behind scanned enemies
+    
+    def __init__(self):
+        self.tile_chars, self.tile_fg, self.tile_bg = self._build_tile_tables(remembered=False)
+        self.remembered_chars, self.remembered_fg, self.remembered_bg = self._build_tile_tables(remembered=True)
+        # Scratch buffers over the map view, reused every frame instead of reallocated
+        view_shape = (GameConfig.GAME_AREA_WIDTH, GameConfig.SCREEN_HEIGHT - GameConfig.PANEL_HEIGHT - 1)
+        self._disc_owner = np.empty(view_shape, dtype=np.int64)
+        self._view_mask = np.empty(view_shape, dtype=np.bool_)
+    
     def render_map(self, console: tcod.console.Console, game: Game):
         """Render the complete game map."""
         try:
+            game.update_fov()
             camera_offset = self._calculate_camera_offset(game.player)
             vision_range = game.player.get_vision_range()
+            enemy_visibility = game.get_enemy_visibility()
+            sightings = self._get_sightings(game, enemy_visibility, camera_offset)
             
             # Render in layers for proper z-ordering
             self._render_terrain(console, game, camera_offset, vision_range)
-            self._render_vision_overlays(console, game, camera_offset, vision_range)
-            self._render_patrol_routes(console, game, camera_offset, vision_range)
+            self._render_vision_overlays(console, game, camera_offset, sightings)
+            self._render_patrol_routes(console, game, camera_offset, sightings)
             self._render_gateway(console, game, camera_offset, vision_range)
-            self._render_enemies(console, game, camera_offset, vision_range)
+            self._render_enemies(console, game, camera_offset, sightings, enemy_visibility)
             self._render_player(console, game, camera_offset)
             self._render_targeting_cursor(console, game, camera_offset)
             
@@ -2981,179 +3631,194 @@ class MapRenderer:
     
     def _render_terrain(self, console: tcod.console.Console, game: Game, camera_offset: Position, vision_range: int):
         """Render basic terrain (floors, walls, items)."""
-        for screen_x in range(GameConfig.GAME_AREA_WIDTH):
-            for screen_y in range(1, GameConfig.SCREEN_HEIGHT - GameConfig.PANEL_HEIGHT):
-                world_pos = Position(screen_x + camera_offset.x, screen_y - 1 + camera_offset.y)
-                
-                if world_pos.is_valid(GameConfig.MAP_WIDTH, GameConfig.MAP_HEIGHT):
-                    distance = game.player.position.distance_to(world_pos)
-                    
-                    # Check if player can see this position
-                    can_see = (distance <= vision_range and 
-                              (game.player.can_see_through_walls() or 
-                               game.game_map.has_line_of_sight(game.player.position, world_pos)))
-                    
-                    # Check if this tile has been explored (memory system)
-                    explored = (world_pos.x, world_pos.y) in game.game_map.explored_tiles
-                    
-                    if can_see:
-                        self._render_tile(console, screen_x, screen_y, world_pos, game)
-                    elif explored:
-                        # Render remembered tile with dimmed colors
-                        self._render_remembered_tile(console, screen_x, screen_y, world_pos, game)
-                    else:
-                        # Fog of war
-                        console.print(screen_x, screen_y, ' ', fg=Colors.BLACK, bg=Colors.BLACK)
-                else:
-                    # Outside map bounds
-                    console.print(screen_x, screen_y, ' ', fg=Colors.BLACK, bg=Colors.BLACK)
-    
-    def _render_remembered_tile(self, console: tcod.console.Console, screen_x: int, screen_y: int, world_pos: Position, game: Game):
-        """Render a tile from memory with dimmed neon colors."""
-        # Only render basic terrain in memory, not dynamic elements
-        if game.game_map.is_wall(world_pos):
-            # Dimmed neon wall
-            console.print(screen_x, screen_y, '#', fg=(60, 70, 90), bg=Colors.BLACK)
-        elif game.game_map.is_shadow(world_pos):
-            # Dimmed neon shadow
-            console.print(screen_x, screen_y, '.', fg=(10, 60, 90), bg=(5, 15, 25))
-        else:
-            # Dimmed neon floor
-            console.print(screen_x, screen_y, '.', fg=(15, 20, 35), bg=Colors.BLACK)
-    
-    def _render_tile(self, console: tcod.console.Console, screen_x: int, screen_y: int, world_pos: Position, game: Game):
-        """Render a single tile."""
-        # Priority order for tile rendering
-        if game.game_map.is_wall(world_pos):
-            console.print(screen_x, screen_y, '#', fg=Colors.WALL, bg=Colors.BLACK)
-        elif game.game_map.is_cooling_node(world_pos):
-            console.print(screen_x, screen_y, '~', fg=Colors.CYAN, bg=Colors.BLACK)
-        elif game.game_map.is_cpu_recovery_node(world_pos):
-            console.print(screen_x, screen_y, '+', fg=Colors.ELECTRIC_BLUE, bg=Colors.BLACK)
-        elif (world_pos.x, world_pos.y) in game.game_map.data_patches:
-            patch = game.game_map.data_patches[(world_pos.x, world_pos.y)]
-            color = self._get_patch_color(patch.color)
-            console.print(screen_x, screen_y, '!', fg=color, bg=Colors.BLACK)
-        elif (world_pos.x, world_pos.y) in game.game_map.exploit_pickups:
-            console.print(screen_x, screen_y, '&', fg=Colors.MAGENTA, bg=Colors.BLACK)
-        elif game.game_map.is_shadow(world_pos):
-            console.print(screen_x, screen_y, '.', fg=Colors.CYBER_TEAL, bg=Colors.SHADOW)
+        game_map = game.game_map
+        view_height = GameConfig.SCREEN_HEIGHT - GameConfig.PANEL_HEIGHT - 1
+        
+        # Fog of war and outside map bounds
+        console.draw_rect(0, 1, GameConfig.GAME_AREA_WIDTH, view_height, ord(' '), fg=Colors.BLACK, bg=Colors.BLACK)
+        
+        width = max(0, min(GameConfig.GAME_AREA_WIDTH, game_map.width - camera_offset.x))
+        height = max(0, min(view_height, game_map.height - camera_offset.y))
+        if width == 0 or height == 0:
+            return
+        
+        # Check which positions the player can see; the map's field of view is already
+        # clipped to the vision disc, so only wall-piercing sight needs its own disc
+        if game.player.can_see_through_walls():
+            dx = np.arange(camera_offset.x, camera_offset.x + width)[:, np.newaxis] - game.player.x
+            dy = np.arange(camera_offset.y, camera_offset.y + height)[np.newaxis, :] - game.player.y
+            visible = dx * dx + dy * dy <= vision_range * vision_range
         else:
-            console.print(screen_x, screen_y, '.', fg=Colors.FLOOR, bg=Colors.BLACK)
-    
-    def _get_patch_color(self, color_name: str) -> Tuple[int, int, int]:
-        """Get color tuple for data patch."""
-        color_map = {
-            'crimson': Colors.NEON_PINK, 'azure': Colors.ELECTRIC_BLUE, 'emerald': Colors.ACID_GREEN,
-            'golden': Colors.YELLOW, 'violet': Colors.ELECTRIC_PURPLE, 'silver': Colors.CYAN
-        }
-        return color_map.get(color_name, Colors.CYAN)
-    
-    def _render_vision_overlays(self, console: tcod.console.Console, game: Game, camera_offset: Position, vision_range: int):
+            visible = game_map.visible[camera_offset.x:camera_offset.x + width,
+                                       camera_offset.y:camera_offset.y + height]
+        
+        # Check which tiles have been explored (memory system)
+        explored = game_map.explored[camera_offset.x:camera_offset.x + width,
+                                     camera_offset.y:camera_offset.y + height]
+        
+        flags = game_map.tile_flags[camera_offset.x:camera_offset.x + width,
+                                    camera_offset.y:camera_offset.y + height]
+        ch = console.ch[0:width, 1:height + 1]
+        fg = console.fg[0:width, 1:height + 1]
+        bg = console.bg[0:width, 1:height + 1]
+        
+        # Remembered tiles with dimmed colors
+        remembered = np.logical_not(visible, out=self._view_mask[:width, :height])
+        remembered &= explored
+        kinds = flags[remembered]
+        ch[remembered] = self.remembered_chars[kinds]
+        fg[remembered] = self.remembered_fg[kinds]
+        bg[remembered] = self.remembered_bg[kinds]
+        
+        kinds = flags[visible]
+        ch[visible] = self.tile_chars[kinds]
+        fg[visible] = self.tile_fg[kinds]
+        bg[visible] = self.tile_bg[kinds]
+        
+        # Data patches take their color from the patch itself
+        patch_mask = visible & ((flags & TileFlags.OCCUPIED) == TileFlags.DATA_PATCH)
+        patch_x, patch_y = np.nonzero(patch_mask)
+        if len(patch_x):
+            fg[patch_x, patch_y] = [game_map.data_patches[(x + camera_offset.x, y + camera_offset.y)].render_color
+                                    for x, y in zip(patch_x.tolist(), patch_y.tolist())]
+    
+    @staticmethod
+    def _build_tile_tables(remembered: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Build glyph, foreground and background lookup tables indexed by TileFlags."""
+        chars = np.empty(256, dtype=np.int32)
+        fg = np.empty((256, 3), dtype=np.uint8)
+        bg = np.empty((256, 3), dtype=np.uint8)
+        for flags in range(256):
+            # Priority order for tile rendering; memory only keeps basic terrain
+            if flags & TileFlags.WALL:
+                tile = ('#', (60, 70, 90) if remembered else Colors.WALL, Colors.BLACK)
+            elif remembered:
+                if flags & TileFlags.SHADOW:
+                    tile = ('.', (10, 60, 90), (5, 15, 25))
+                else:
+                    tile = ('.', (15, 20, 35), Colors.BLACK)
+            elif flags & TileFlags.COOLING_NODE:
+                tile = ('~', Colors.CYAN, Colors.BLACK)
+            elif flags & TileFlags.CPU_RECOVERY_NODE:
+                tile = ('+', Colors.ELECTRIC_BLUE, Colors.BLACK)
+            elif flags & TileFlags.DATA_PATCH:
+                tile = ('!', Colors.CYAN, Colors.BLACK)  # Recolored per patch
+            elif flags & TileFlags.EXPLOIT_PICKUP:
+                tile = ('&', Colors.MAGENTA, Colors.BLACK)
+            elif flags & TileFlags.SHADOW:
+                tile = ('.', Colors.CYBER_TEAL, Colors.SHADOW)
+            else:
+                tile = ('.', Colors.FLOOR, Colors.BLACK)
+            chars[flags] = ord(tile[0])
+            fg[flags] = tile[1]
+            bg[flags] = tile[2]
+        return chars, fg, bg
+    
+    def _render_vision_overlays(self, console: tcod.console.Console, game: Game, camera_offset: Position,
+                                sightings: List[Tuple[Enemy, bool]]):
         """Render enemy vision range overlays."""
         if game.player.is_invisible():
             return
         
-        network_scan_active = game.network_scan_turns > 0
-        
-        for enemy in game.enemies:
+        discs = []
+        for enemy, can_see_enemy in sightings:
             if enemy.disabled_turns > 0:
                 continue
             
-            # Show vision overlays for visible enemies OR if Network Scan is active
-            can_see_enemy = game.player.can_see_enemy(enemy, game.game_map)
+            # If revealed by network scan, make overlay more translucent
+            overlay_colors = self.VISION_OVERLAY_COLORS if can_see_enemy else self.SCANNED_OVERLAY_COLORS
+            overlay_color = overlay_colors[enemy.state]
             
-            if can_see_enemy or network_scan_active:
-                overlay_color = self._get_vision_overlay_color(enemy.state)
-                
-                # If revealed by network scan, make overlay more translucent
-                if network_scan_active and not can_see_enemy:
-                    overlay_color = tuple(c // 2 for c in overlay_color)  # Make it dimmer
-                
-                self._render_enemy_vision_range(console, enemy, camera_offset, overlay_color)
-    
-    def _get_vision_overlay_color(self, enemy_state: EnemyState) -> Tuple[int, int, int]:
-        """Get vision overlay color based on enemy state."""
-        if enemy_state == EnemyState.HOSTILE:
-            return Colors.VISION_HOSTILE
-        elif enemy_state == EnemyState.ALERT:
-            return Colors.VISION_ALERT
-        else:
-            return Colors.VISION_UNAWARE
-    
-    def _render_enemy_vision_range(self, console: tcod.console.Console, enemy: Enemy, camera_offset: Position, overlay_color: Tuple[int, int, int]):
-        """Render vision range for a single enemy."""
-        for dx in range(-enemy.type_data.vision, enemy.type_data.vision + 1):
-            for dy in range(-enemy.type_data.vision, enemy.type_data.vision + 1):
-                # Use Euclidean distance to match the actual detection logic
-                if dx*dx + dy*dy <= enemy.type_data.vision*enemy.type_data.vision:
-                    screen_x = enemy.x - camera_offset.x + dx
-                    screen_y = enemy.y - camera_offset.y + dy + 1
-                    
-                    if (0 <= screen_x < GameConfig.GAME_AREA_WIDTH and 
-                        1 <= screen_y < GameConfig.SCREEN_HEIGHT - GameConfig.PANEL_HEIGHT):
-                        self._safely_overlay_tile(console, screen_x, screen_y, overlay_color)
-    
-    def _safely_overlay_tile(self, console: tcod.console.Console, x: int, y: int, bg_color: Tuple[int, int, int]):
-        """Safely overlay background color on existing tile."""
-        try:
-            current_char = console.ch[x, y]
-            if current_char != ord(' '):  # Don't overlay fog of war
-                current_fg = console.fg[x, y]
-                if hasattr(current_fg, '__iter__') and len(current_fg) >= 3:
-                    fg_tuple = tuple(current_fg[:3])
-                    console.print(x, y, chr(current_char), fg=fg_tuple, bg=bg_color)
-        except (IndexError, ValueError) as e:
-            import traceback
-            tb = traceback.extract_tb(e.__traceback__)
-            line_no = tb[-1].lineno if tb else "?"
-            # Silent fail for overlay errors, but could log line_no if needed for debugging
-            pass
+            # Euclidean disc to match the actual detection logic
+            discs.append((enemy.position, enemy.vision, overlay_color))
+        
+        self._overlay_discs(console, discs, camera_offset)
     
-    def _render_patrol_routes(self, console: tcod.console.Console, game: Game, camera_offset: Position, vision_range: int):
-        """Render next 3 predicted moves for all moving enemies."""
+    def _get_sightings(self, game: Game, enemy_visibility: np.ndarray, camera_offset: Position) -> List[Tuple[Enemy, bool]]:
+        """Get (enemy, seen by player) for every enemy to show: all under Network Scan, otherwise the seen ones."""
+        if game.network_scan_turns > 0:
+            # Skip enemies too far off screen for their glyph, next 3 steps or vision disc to show
+            margin = np.maximum(game.enemy_vision, 3)
+            view_x = game.enemy_x - camera_offset.x
+            view_y = game.enemy_y - camera_offset.y
+            view_height = GameConfig.SCREEN_HEIGHT - GameConfig.PANEL_HEIGHT - 1
+            near_view = ((view_x >= -margin) & (view_x < GameConfig.GAME_AREA_WIDTH + margin) &
+                         (view_y >= -margin) & (view_y < view_height + margin))
+            return [(game.enemies[index], bool(enemy_visibility[index])) for index in np.flatnonzero(near_view)]
+        return [(game.enemies[index], True) for index in np.flatnonzero(enemy_visibility)]
+    
+    def _overlay_disc(self, console: tcod.console.Console, center: Position, radius: int, camera_offset: Position, bg_color: Tuple[int, int, int]):
+        """Overlay background color on every on-screen, non-fog tile of a disc."""
+        self._overlay_discs(console, [(center, radius, bg_color)], camera_offset)
+    
+    def _overlay_discs(self, console: tcod.console.Console,
+                       discs: List[Tuple[Position, int, Tuple[int, int, int]]], camera_offset: Position):
+        """Overlay each (center, radius, color) disc in one pass; later discs win where they overlap."""
+        if not discs:
+            return
         
-        network_scan_active = game.network_scan_turns > 0
+        # Stamp disc indices over the map view, then color each covered cell from its disc
+        owner = self._disc_owner
+        owner.fill(-1)
+        stamp_discs(owner,
+                    np.array([center.x - camera_offset.x for center, _, _ in discs], dtype=np.int64),
+                    np.array([center.y - camera_offset.y for center, _, _ in discs], dtype=np.int64),
+                    np.array([radius for _, radius, _ in discs], dtype=np.int64))
+        colors = np.array([color for _, _, color in discs], dtype=np.uint8)
+        
+        view = (slice(0, owner.shape[0]), slice(1, 1 + owner.shape[1]))
+        # Don't overlay fog of war
+        covered = np.greater_equal(owner, 0, out=self._view_mask)
+        covered &= console.ch[view] != ord(' ')
+        console.bg[view][covered] = colors[owner[covered]]
+    
+    @staticmethod
+    def _in_view(screen_x: np.ndarray, screen_y: np.ndarray) -> np.ndarray:
+        """Mask the screen cells that fall inside the map view."""
+        return ((screen_x >= 0) & (screen_x < GameConfig.GAME_AREA_WIDTH) &
+                (screen_y >= 1) & (screen_y < GameConfig.SCREEN_HEIGHT - GameConfig.PANEL_HEIGHT))
+    
+    @staticmethod
+    def _last_writes(screen_x: np.ndarray, screen_y: np.ndarray) -> np.ndarray:
+        """Get the indices of the last entry for each distinct cell.
+        
+        NumPy leaves the winner of repeated fancy-index writes unspecified, so bulk
+        draws keep only the entry a sequential draw would have left on screen.
+        """
+        cells = screen_x * GameConfig.SCREEN_HEIGHT + screen_y
+        _, first_from_end = np.unique(cells[::-1], return_index=True)
+        return len(cells) - 1 - first_from_end
+    
+    def _render_patrol_routes(self, console: tcod.console.Console, game: Game, camera_offset: Position,
+                              sightings: List[Tuple[Enemy, bool]]):
+        """Render next 3 predicted moves for all moving enemies."""
+        dot_x: List[int] = []
+        dot_y: List[int] = []
+        dot_colors: List[Tuple[int, int, int]] = []
+        
+        for enemy, can_see_enemy in sightings:
+            # Network scan reveals movement of unseen enemies in cyan
+            step_colors = self.PATROL_STEP_COLORS if can_see_enemy else self.SCAN_STEP_COLORS
+            for (point_x, point_y), color in zip(game.get_enemy_next_positions(enemy, 3), step_colors):
+                dot_x.append(point_x)
+                dot_y.append(point_y)
+                dot_colors.append(color)
+        
+        if not dot_x:
+            return
         
-        for enemy in game.enemies:
-            # Show patrol routes for visible enemies OR if Network Scan is active
-            can_see_enemy = game.player.can_see_enemy(enemy, game.game_map)
-            
-            if can_see_enemy or network_scan_active:
-                next_positions = game.get_enemy_next_positions(enemy, 3)
-                
-                for i, point in enumerate(next_positions):
-                    screen_x = point.x - camera_offset.x
-                    screen_y = point.y - camera_offset.y + 1
-                    if (0 <= screen_x < GameConfig.GAME_AREA_WIDTH and 
-                        1 <= screen_y < GameConfig.SCREEN_HEIGHT - GameConfig.PANEL_HEIGHT):
-                        # Color code by step and scan status
-                        if network_scan_active and not can_see_enemy:
-                            # Network scan reveals movement with special cyan colors
-                            if i == 0:
-                                color = Colors.CYAN
-                            elif i == 1:
-                                color = (0, 200, 200)  # Dimmer cyan
-                            else:
-                                color = (0, 150, 150)  # Dimmest cyan
-                        else:
-                            # Normal patrol route colors
-                            if i == 0:
-                                color = Colors.YELLOW
-                            elif i == 1:
-                                color = (200, 200, 0)  # Dimmer yellow
-                            else:
-                                color = (150, 150, 0)  # Dimmest yellow
-                        screen_x = point.x - camera_offset.x
-                        screen_y = point.y - camera_offset.y + 1
-                        # Preserve existing background color if present (e.g., vision overlay)
-                        try:
-                            current_bg = tuple(console.bg[screen_x, screen_y][:3])
-                            # Use current background if it's not black, otherwise use black
-                            bg_color = current_bg if current_bg != (0, 0, 0) else Colors.BLACK
-                        except (IndexError, AttributeError):
-                            bg_color = Colors.BLACK
-                        console.print(screen_x, screen_y, '•', fg=color, bg=bg_color)
+        # Draw every on-screen dot at once; later enemies' dots win shared cells as before
+        screen_x = np.array(dot_x) - camera_offset.x
+        screen_y = np.array(dot_y) - camera_offset.y + 1
+        in_view = self._in_view(screen_x, screen_y)
+        screen_x, screen_y = screen_x[in_view], screen_y[in_view]
+        last = self._last_writes(screen_x, screen_y)
+        dot_x, dot_y = screen_x[last], screen_y[last]
+        console.ch[dot_x, dot_y] = ord('•')
+        console.fg[dot_x, dot_y] = np.array(dot_colors, dtype=np.uint8)[in_view][last]
+        # Keep an existing background (e.g., vision overlay), but never leave pure black
+        unlit = ~console.bg[dot_x, dot_y].any(axis=1)
+        console.bg[dot_x[unlit], dot_y[unlit]] = Colors.BLACK
     
     def _render_gateway(self, console: tcod.console.Console, game: Game, camera_offset: Position, vision_range: int):
         """Render the level gateway."""
@@ -3165,60 +3830,60 @@ class MapRenderer:
         
         if (0 <= screen_x < GameConfig.GAME_AREA_WIDTH and 
             1 <= screen_y < GameConfig.SCREEN_HEIGHT - GameConfig.PANEL_HEIGHT):
-            distance = game.player.position.distance_to(game.game_map.gateway)
             # Check if player can see the gateway (respecting walls)
-            can_see = (distance <= vision_range and 
+            can_see = (game.player.position.within(game.game_map.gateway, vision_range) and 
                       (game.player.can_see_through_walls() or 
-                       game.game_map.has_line_of_sight(game.player.position, game.game_map.gateway)))
+                       game.game_map.is_visible(game.game_map.gateway)))
             if can_see:
                 console.print(screen_x, screen_y, '>', fg=Colors.GATEWAY, bg=Colors.BLACK)
     
-    def _render_enemies(self, console: tcod.console.Console, game: Game, camera_offset: Position, vision_range: int):
+    def _render_enemies(self, console: tcod.console.Console, game: Game, camera_offset: Position,
+                        sightings: List[Tuple[Enemy, bool]], enemy_visibility: np.ndarray):
         """Render all enemies and their last known positions."""
         # First, render last known positions as ghosts
+        ghost_x, ghost_y, ghost_colors = [], [], []
+        enemy_by_id = game.enemy_by_id
+        oldest_turn = game.turn - 20  # Show ghost for 20 turns
         for enemy_id, (position, turn_seen) in game.game_map.last_known_enemy_positions.items():
-            # Find if this enemy is still alive and currently visible
-            current_enemy = None
-            currently_visible = False
-            for enemy in game.enemies:
-                if enemy.id == enemy_id:
-                    current_enemy = enemy
-                    if game.player.can_see_enemy(enemy, game.game_map):
-                        currently_visible = True
-                    break
-            
-            # Only show ghost if enemy is not currently visible and was seen recently
-            if not currently_visible and turn_seen > game.turn - 20:  # Show ghost for 20 turns
-                screen_x = position.x - camera_offset.x
-                screen_y = position.y - camera_offset.y + 1
-                
-                if (0 <= screen_x < GameConfig.GAME_AREA_WIDTH and 
-                    1 <= screen_y < GameConfig.SCREEN_HEIGHT - GameConfig.PANEL_HEIGHT):
-                    if current_enemy:
-                        # Dimmed ghost of living enemy
-                        ghost_color = tuple(c // 3 for c in current_enemy.get_color())
-                        console.print(screen_x, screen_y, '?', fg=ghost_color, bg=Colors.BLACK)
-        
-        # Then render currently visible enemies
-        for enemy in game.enemies:
-            screen_x = enemy.x - camera_offset.x
-            screen_y = enemy.y - camera_offset.y + 1
-            
-            if (0 <= screen_x < GameConfig.GAME_AREA_WIDTH and 
-                1 <= screen_y < GameConfig.SCREEN_HEIGHT - GameConfig.PANEL_HEIGHT):
-                # Check if Network Scan is active (shows all enemies)
-                network_scan_active = game.network_scan_turns > 0
-                can_see_enemy = game.player.can_see_enemy(enemy, game.game_map)
-                
-                if can_see_enemy or network_scan_active:
-                    if network_scan_active and not can_see_enemy:
-                        # Network scan reveals enemy with special highlighting
-                        console.print(screen_x, screen_y, enemy.type_data.symbol, 
-                                    fg=Colors.CYAN, bg=(20, 0, 20))  # Cyan text on dark purple bg
-                    else:
-                        # Normal enemy rendering
-                        console.print(screen_x, screen_y, enemy.type_data.symbol, 
-                                    fg=enemy.get_color(), bg=Colors.BLACK)
+            # Only show ghosts of living enemies that are not currently visible but were seen recently
+            current_enemy = enemy_by_id.get(enemy_id)
+            if (current_enemy is not None and turn_seen > oldest_turn and
+                    not enemy_visibility[current_enemy.list_index]):
+                # Dimmed ghost of living enemy
+                ghost_x.append(position.x)
+                ghost_y.append(position.y)
+                ghost_colors.append(current_enemy.color_index)
+        if ghost_x:
+            self._draw_glyph_arrays(console, np.array(ghost_x), np.array(ghost_y), ord('?'),
+                                    self.GHOST_COLORS[ghost_colors], Colors.BLACK, camera_offset)
+        
+        # Then render currently visible enemies, plus the rest under Network Scan
+        if not sightings:
+            return
+        enemies, seen = zip(*sightings)
+        seen = np.array(seen)[:, None]
+        # Network scan reveals unseen enemies as cyan text on a dark purple background
+        fg = np.where(seen, self.ENEMY_COLORS[[enemy.color_index for enemy in enemies]], self.SCANNED_ENEMY_FG)
+        bg = np.where(seen, np.array(Colors.BLACK, dtype=np.uint8), self.SCANNED_ENEMY_BG)
+        self._draw_glyph_arrays(console, np.array([enemy.x for enemy in enemies]),
+                                np.array([enemy.y for enemy in enemies]),
+                                np.array([ord(enemy.symbol) for enemy in enemies]), fg, bg, camera_offset)
+    
+    def _draw_glyph_arrays(self, console: tcod.console.Console, map_x: np.ndarray, map_y: np.ndarray,
+                           chars, fg, bg, camera_offset: Position):
+        """Draw glyphs given as parallel arrays; chars, fg and bg may be per-glyph or shared.
+        
+        Later glyphs win shared cells.
+        """
+        screen_x = map_x - camera_offset.x
+        screen_y = map_y - camera_offset.y + 1
+        in_view = self._in_view(screen_x, screen_y)
+        last = self._last_writes(screen_x[in_view], screen_y[in_view])
+        keep = np.flatnonzero(in_view)[last]
+        screen_x, screen_y = screen_x[keep], screen_y[keep]
+        console.ch[screen_x, screen_y] = chars if np.ndim(chars) == 0 else chars[keep]
+        console.fg[screen_x, screen_y] = fg if np.ndim(fg) == 1 else fg[keep]
+        console.bg[screen_x, screen_y] = bg if np.ndim(bg) == 1 else bg[keep]
     
     def _render_player(self, console: tcod.console.Console, game: Game, camera_offset: Position):
         """Render the player character."""
@@ -3227,19 +3892,7 @@ class MapRenderer:
         
         if (0 <= player_screen_x < GameConfig.GAME_AREA_WIDTH and 
             1 <= player_screen_y < GameConfig.SCREEN_HEIGHT - GameConfig.PANEL_HEIGHT):
-            player_color = self._get_player_color(game.player)
-            console.print(player_screen_x, player_screen_y, '@', fg=player_color, bg=Colors.BLACK)
-    
-    def _get_player_color(self, player: Player) -> Tuple[int, int, int]:
-        """Get player color based on current state."""
-        if player.is_invisible():
-            return Colors.BLUE
-        elif player.temporary_effects['speed_boost_turns'] > 0:
-            return Colors.YELLOW
-        elif player.heat >= 90:
-            return Colors.RED
-        else:
-            return Colors.PLAYER
+            console.print(player_screen_x, player_screen_y, '@', fg=game.player.render_color, bg=Colors.BLACK)
     
     def _render_targeting_cursor(self, console: tcod.console.Console, game: Game, camera_offset: Position):
         """Render targeting cursor and range indicator."""
@@ -3260,22 +3913,15 @@ class MapRenderer:
     
     def _render_targeting_range(self, console: tcod.console.Console, center: Position, range_val: int, camera_offset: Position):
         """Render targeting range indicator."""
-        for dx in range(-range_val, range_val + 1):
-            for dy in range(-range_val, range_val + 1):
-                if dx*dx + dy*dy <= range_val*range_val:
-                    range_screen_x = center.x - camera_offset.x + dx
-                    range_screen_y = center.y - camera_offset.y + dy + 1
-                    
-                    if (0 <= range_screen_x < GameConfig.GAME_AREA_WIDTH and 
-                        1 <= range_screen_y < GameConfig.SCREEN_HEIGHT - GameConfig.PANEL_HEIGHT):
-                        self._safely_overlay_tile(console, range_screen_x, range_screen_y, (40, 40, 40))
+        self._overlay_disc(console, center, range_val, camera_offset, (40, 40, 40))
 
 # ============================================================================
 # MAIN GAME LOOP AND INITIALIZATION
 # ============================================================================
 
-def initialize_tcod_context():
-    """Initialize tcod context with fallback handling."""
+@functools.lru_cache(maxsize=1)
+def _load_tileset():
+    """Load the game tileset once, falling back to the default or None."""
     tileset = None
     try:
 
@@ -3286,7 +3932,7 @@ def initialize_tcod_context():
         tileset = tcod.tileset.load_truetype_font("Orbitron-VariableFont_wght.ttf")
 
 
-    except (FileNotFoundError, ImportError, Exception) as e:
+    except Exception as e:
         import traceback
         tb = traceback.extract_tb(e.__traceback__)
         line_no = tb[-1].lineno if tb else "?"
@@ -3302,7 +3948,11 @@ def initialize_tcod_context():
             print(f"Default tileset error: {e2} (line {line_no2})")
             # Use built-in fallback
             pass
-    
+    return tileset
+
+def initialize_tcod_context():
+    """Initialize tcod context with fallback handling."""
+    tileset = _load_tileset()
     context_args = {
         "columns": GameConfig.SCREEN_WIDTH,
         "rows": GameConfig.SCREEN_HEIGHT,
@@ -3316,8 +3966,31 @@ def initialize_tcod_context():
     
     return tcod.context.new(**context_args)
 
+def _show_render_error(context, console: tcod.console.Console, error: Exception) -> bool:
+    """Show a rendering error screen. Returns False if the player chose to exit."""
+    import traceback
+    tb = traceback.extract_tb(error.__traceback__)
+    line_no = tb[-1].lineno if tb else "?"
+    print(f"Rendering error: {error} (line {line_no})")
+    console.clear()
+    console.print(1, 1, f"Error: {str(error)[:50]} (line {line_no})", fg=Colors.RED)
+    console.print(1, 2, "Press ESC to exit", fg=Colors.WHITE)
+    context.present(console)
+    
+    for event in tcod.event.wait():
+        if event.type == "QUIT" or (event.type == "KEYDOWN" and event.sym == tcod.event.KeySym.ESCAPE):
+            return False
+    return True
+
+# Window events after which the last frame has to be presented again
+REPAINT_EVENT_TYPES = frozenset({
+    "WindowShown", "WindowExposed", "WindowResized", "PixelSizeChanged",
+    "WindowRestored", "WindowMaximized", "EnterFullscreen", "LeaveFullscreen"
+})
+
 def main():
     """Main game loop with improved error handling."""
+    warm_up_kernels()
     try:
         with initialize_tcod_context() as context:
             console = tcod.console.Console(GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT, order='F')
@@ -3335,34 +4008,34 @@ def main():
             game.message_log.add_message("Starting Corporate Network infiltration...")
 
             # Main game loop
+            needs_present = True
             while True:
-                try:
-                    # Render current game state
-                    renderer.render_game(console, game)
-                    context.present(console)
-                    
-                    # Handle input events
-                    for event in tcod.event.wait():
-                        if event.type == "QUIT":
+                # Render current game state only when something changed
+                if game.dirty:
+                    try:
+                        renderer.render_game(console, game)
+                    except Exception as e:
+                        # Handle rendering errors gracefully
+                        if not _show_render_error(context, console, e):
                             return
-                        elif event.type == "KEYDOWN":
-                            if not input_handler.handle_keydown(event):
-                                return  # Exit game
-                        
-                except Exception as e:
-                    # Handle rendering errors gracefully
-                    import traceback
-                    tb = traceback.extract_tb(e.__traceback__)
-                    line_no = tb[-1].lineno if tb else "?"
-                    print(f"Rendering error: {e} (line {line_no})")
-                    console.clear()
-                    console.print(1, 1, f"Error: {str(e)[:50]} (line {line_no})", fg=Colors.RED)
-                    console.print(1, 2, "Press ESC to exit", fg=Colors.WHITE)
+                    game.dirty = False
+                    needs_present = True
+                
+                # Present a new frame, or the old one again when the window needs repainting;
+                # other events (mouse motion, focus changes) leave the screen as it is
+                if needs_present:
                     context.present(console)
-                    
-                    for event in tcod.event.wait():
-                        if event.type == "QUIT" or (event.type == "KEYDOWN" and event.sym == tcod.event.KeySym.ESCAPE):
-                            return
+                    needs_present = False
+                
+                # Handle input events; game logic errors propagate to the outer handler
+                for event in tcod.event.wait():
+                    if event.type == "QUIT":
+                        return
+                    elif event.type == "KEYDOWN":
+                        if not input_handler.handle_keydown(event):
+                            return  # Exit game
+                    elif event.type in REPAINT_EVENT_TYPES:
+                        needs_present = True
     
     except Exception as e:
         import traceback
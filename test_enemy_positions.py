@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Test that the enemy position index follows enemies that share a cell.
+"""
+
+import sys
+import os
+
+# Add the parent directory to sys.path so we can import the game
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from RogueSignalProtocol import Game, Position
+
+def test_shared_cell_handoff():
+    """Test that an enemy keeps its cell when another enemy passes through it."""
+    print("Testing enemy position index on shared cells...")
+    
+    game = Game()
+    first, second = game.enemies[0], game.enemies[1]
+    first_cell = Position(first.x, first.y)
+    second_cell = Position(second.x, second.y)
+    
+    # Step the second enemy onto the first enemy's cell and back off it
+    second.position = Position(first_cell.x, first_cell.y)
+    assert game._get_enemy_at(first_cell) is first
+    assert game.enemy_grid[first_cell.x, first_cell.y] == 2
+    second.position = second_cell
+    assert game._get_enemy_at(first_cell) is first
+    assert game._get_enemy_at(second_cell) is second
+    assert game.enemy_grid[first_cell.x, first_cell.y] == 1
+    
+    # The owner leaves a shared cell: it passes to the enemy still on it
+    second.position = Position(first_cell.x, first_cell.y)
+    first.position = Position(second_cell.x, second_cell.y)
+    assert game._get_enemy_at(first_cell) is second
+    assert game._get_enemy_at(second_cell) is first
+    
+    print("[OK] Shared cells are kept by their owner and handed off when it leaves")
+
+if __name__ == "__main__":
+    test_shared_cell_handoff()
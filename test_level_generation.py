@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test that a dungeon seed reproduces its levels and that placements follow the level rules.
+"""
+
+import sys
+import os
+import random
+
+# Add the parent directory to sys.path so we can import the game
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from RogueSignalProtocol import Game, TileFlags
+
+def level_snapshot(game):
+    """Capture everything the level generator decides."""
+    game_map = game.game_map
+    return (game_map.tile_flags.tobytes(),
+            sorted((x, y, patch.color) for (x, y), patch in game_map.data_patches.items()),
+            sorted((x, y, item.exploit_key) for (x, y), item in game_map.exploit_pickups.items()),
+            [(enemy.x, enemy.y, enemy.type, [(p.x, p.y) for p in enemy.patrol_points]) for enemy in game.enemies],
+            game_map.gateway)
+
+def check_placements(game):
+    """Check that nothing was placed on a blocked cell or too close to spawn."""
+    game_map = game.game_map
+    flags = game_map.tile_flags
+    spawn = game.spawn_distance_sq
+    
+    nodes = (flags & TileFlags.NODE) != 0
+    assert not (nodes & game_map.walls).any(), "node on a wall"
+    assert (game_map.cooling_nodes & game_map.cpu_recovery_nodes).sum() == 0, "two nodes on one cell"
+    assert (spawn[nodes] > 8 * 8).all(), "node too close to spawn"
+    
+    for (x, y) in game_map.data_patches:
+        assert not flags[x, y] & (TileFlags.WALL | TileFlags.NODE), f"data patch on a blocked cell {(x, y)}"
+        assert spawn[x, y] > 5 * 5, f"data patch too close to spawn {(x, y)}"
+    
+    cells = set()
+    for enemy in game.enemies:
+        assert not flags[enemy.x, enemy.y] & TileFlags.OCCUPIED, f"enemy on a blocked cell {(enemy.x, enemy.y)}"
+        assert spawn[enemy.x, enemy.y] > 12 * 12, f"enemy too close to spawn {(enemy.x, enemy.y)}"
+        assert (enemy.x, enemy.y) not in cells, f"two enemies on {(enemy.x, enemy.y)}"
+        cells.add((enemy.x, enemy.y))
+    
+    gateway = game_map.gateway
+    if gateway is not None:
+        assert not game_map.walls[gateway.x, gateway.y], "gateway on a wall"
+
+def test_seed_reproduces_levels():
+    """Test that regenerating from the same dungeon seed rebuilds the same levels."""
+    print("Testing level reproduction from a dungeon seed...")
+    
+    for seed in range(5):
+        random.seed(seed)
+        original = Game()
+        replay = Game()
+        replay.dungeon_seed = original.dungeon_seed
+        # Pickups carry over between levels, so start the replay from an empty map like the original
+        replay.game_map.exploit_pickups.clear()
+        replay._generate_procedural_level()
+        
+        for level in (1, 2, 3):
+            assert level_snapshot(replay) == level_snapshot(original), f"seed {seed} level {level} differs"
+            check_placements(original)
+            original.next_level()
+            replay.next_level()
+    
+    print("[OK] Levels are reproducible and placements follow the rules")
+
+if __name__ == "__main__":
+    test_seed_reproduces_levels()
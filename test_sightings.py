@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test that the batched sight checks agree with the per-enemy ones.
+"""
+
+import sys
+import os
+import random
+
+import numpy as np
+import tcod
+
+# Add the parent directory to sys.path so we can import the game
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from RogueSignalProtocol import Game, InputHandler, Position
+
+class KeyEvent:
+    """Minimal stand-in for a tcod keydown event."""
+    def __init__(self, sym):
+        self.sym = sym
+        self.mod = 0
+        self.type = "KEYDOWN"
+
+def test_batched_sightings_match():
+    """Test get_player_sightings and get_enemy_visibility against can_see_player and can_see_enemy."""
+    print("Testing batched sight checks...")
+    
+    keys = [tcod.event.KeySym.W, tcod.event.KeySym.A, tcod.event.KeySym.S, tcod.event.KeySym.D,
+            tcod.event.KeySym.Q, tcod.event.KeySym.E, tcod.event.KeySym.Z, tcod.event.KeySym.C,
+            tcod.event.KeySym.SPACE]
+    effects = [{}, {'data_mimic_turns': 3}, {'enhanced_vision_turns': 3}]
+    checked = 0
+    
+    for seed in range(4):
+        random.seed(seed)
+        game = Game()
+        input_handler = InputHandler(game)
+        rng = random.Random(seed)
+        open_cells = np.argwhere(~game.game_map.walls).tolist()
+        
+        for step in range(150):
+            if game.player.cpu <= 0 or game.game_over:
+                break
+            # Alternate real turns with jumps to random open cells so walls and shadows get in the way
+            if step % 2:
+                input_handler.handle_keydown(KeyEvent(rng.choice(keys)))
+            else:
+                game.player.position = Position(*rng.choice(open_cells))
+            
+            for effect in effects:
+                for name, turns in effect.items():
+                    game.player.temporary_effects[name] = turns
+                game.update_fov()
+                player, game_map = game.player, game.game_map
+                
+                sightings = [enemy.can_see_player(player, game_map) for enemy in game.enemies]
+                assert game.get_player_sightings().tolist() == sightings, f"seed {seed} step {step} {effect}"
+                visibility = [player.can_see_enemy(enemy, game_map) for enemy in game.enemies]
+                assert game.get_enemy_visibility().tolist() == visibility, f"seed {seed} step {step} {effect}"
+                checked += sum(sightings) + sum(visibility)
+                
+                for name in effect:
+                    game.player.temporary_effects[name] = 0
+    
+    assert checked > 0, "no enemy was ever in sight"
+    print(f"[OK] Batched sight checks match ({checked} sightings)")
+
+if __name__ == "__main__":
+    test_batched_sightings_match()